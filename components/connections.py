@@ -5,25 +5,28 @@ Supports dovetail, magnet pockets, and clip connections.
 """
 
 import math
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Tuple
 
 try:
     import bpy
-    import bmesh
+    import numpy as np
     HAS_BPY = True
 except ImportError:
     HAS_BPY = False
 
 from ..config.derived_config import DerivedConfig
 from ..config.enums import ConnectionType
+from ..geometry.primitives import (
+    create_mesh_object,
+    cylinder_mesh_data,
+    link_objects,
+    prism_faces,
+    requires_bpy,
+)
 
 
-def ensure_bpy():
-    """Check if bpy is available."""
-    if not HAS_BPY:
-        raise RuntimeError("Blender Python API (bpy) not available")
-
-
+@requires_bpy
 def build_dovetail(
     width: float,
     depth: float,
@@ -32,7 +35,8 @@ def build_dovetail(
     is_male: bool = True,
     name: str = "Dovetail",
     location: Tuple[float, float, float] = (0, 0, 0),
-) -> Optional["bpy.types.Object"]:
+    link: bool = True,
+) -> "bpy.types.Object":
     """
     Create a dovetail joint (male or female).
     
@@ -49,14 +53,29 @@ def build_dovetail(
         is_male: True for protrusion, False for pocket
         name: Object name
         location: Object location
+        link: Link to the active collection (False to batch-link)
     
     Returns:
         Blender object
     """
-    ensure_bpy()
-    
-    bm = bmesh.new()
+    verts, faces = _dovetail_mesh_data(width, depth, height, angle, is_male)
+    return create_mesh_object(name, verts, faces, location, link=link)
+
+
+@lru_cache(maxsize=16)
+def _dovetail_mesh_data(
+    width: float,
+    depth: float,
+    height: float,
+    angle: float,
+    is_male: bool,
+) -> Tuple["np.ndarray", Tuple[Tuple[int, ...], ...]]:
+    """
+    Vertex and face data for build_dovetail (cached, read-only).
     
+    Pure NumPy: touches no bpy state, so the four identical corner
+    dovetails of a connection set share one computation.
+    """
     # Calculate dovetail profile
     rad = math.radians(angle)
     offset = depth * math.tan(rad)
@@ -66,54 +85,36 @@ def build_dovetail(
     
     if is_male:
         # Male dovetail (wider at top)
-        verts_front = [
-            bm.verts.new((-half_narrow, 0, 0)),
-            bm.verts.new((half_narrow, 0, 0)),
-            bm.verts.new((half_wide, 0, depth)),
-            bm.verts.new((-half_wide, 0, depth)),
-        ]
+        front = np.array([
+            (-half_narrow, 0, 0),
+            (-half_wide, 0, depth),
+            (half_wide, 0, depth),
+            (half_narrow, 0, 0),
+        ], dtype=np.float32)
     else:
         # Female dovetail pocket (wider at bottom)
-        verts_front = [
-            bm.verts.new((-half_wide, 0, 0)),
-            bm.verts.new((half_wide, 0, 0)),
-            bm.verts.new((half_narrow, 0, depth)),
-            bm.verts.new((-half_narrow, 0, depth)),
-        ]
-    
-    verts_back = [
-        bm.verts.new((v.co.x, height, v.co.z)) for v in verts_front
-    ]
-    
-    # Faces
-    bm.faces.new(verts_front)
-    bm.faces.new(list(reversed(verts_back)))
-    
-    for i in range(4):
-        next_i = (i + 1) % 4
-        bm.faces.new([
-            verts_front[i], verts_front[next_i],
-            verts_back[next_i], verts_back[i]
-        ])
-    
-    mesh = bpy.data.meshes.new(name)
-    bm.to_mesh(mesh)
-    bm.free()
-    
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
-    obj.location = location
-    
-    return obj
+        front = np.array([
+            (-half_wide, 0, 0),
+            (-half_narrow, 0, depth),
+            (half_narrow, 0, depth),
+            (half_wide, 0, 0),
+        ], dtype=np.float32)
+    
+    verts = np.concatenate([front, front + (0, height, 0)])
+    verts.flags.writeable = False
+    
+    return verts, prism_faces(4)
 
 
+@requires_bpy
 def build_magnet_pocket(
     diameter: float = 6.1,
     depth: float = 3.1,
     arch_top: bool = True,
     name: str = "MagnetPocket",
     location: Tuple[float, float, float] = (0, 0, 0),
-) -> Optional["bpy.types.Object"]:
+    link: bool = True,
+) -> "bpy.types.Object":
     """
     Create pocket for 6x3mm magnets with pressfit tolerance.
     
@@ -128,56 +129,92 @@ def build_magnet_pocket(
         arch_top: Add arch for overhang-free printing
         name: Object name
         location: Object location
+        link: Link to the active collection (False to batch-link)
     
     Returns:
         Blender object (for boolean subtraction)
     """
-    ensure_bpy()
-    
+    # Pocket templates are cached across pockets
     if arch_top:
-        # Create cylinder with arched top (45° overhang safe)
-        bpy.ops.mesh.primitive_cylinder_add(
-            vertices=32,
-            radius=diameter / 2,
-            depth=depth,
-            location=location,
-        )
-        obj = bpy.context.active_object
-        if obj is not None:
-            obj.name = name
-        
-        # Add arch top using cone
-        arch_height = diameter / 2 * 0.5  # 45° slope
-        bpy.ops.mesh.primitive_cone_add(
-            vertices=32,
-            radius1=diameter / 2,
-            radius2=0,
-            depth=arch_height,
-            location=(location[0], location[1], location[2] + depth / 2),
-        )
-        arch = bpy.context.active_object
-        
-        # Union arch with cylinder
-        if obj is not None and arch is not None:
-            from ..geometry.boolean_ops import boolean_union
-            boolean_union(obj, arch)
-        
-        return obj
+        verts, faces = _arched_pocket_mesh_data(diameter / 2, depth)
     else:
-        # Simple cylinder pocket
-        bpy.ops.mesh.primitive_cylinder_add(
-            vertices=32,
-            radius=diameter / 2,
-            depth=depth,
-            location=location,
-        )
-        obj = bpy.context.active_object
-        if obj is not None:
-            obj.name = name
-        
-        return obj
+        verts, faces = cylinder_mesh_data(diameter / 2, depth, vertices=32)
+    
+    return create_mesh_object(name, verts, faces, location, link=link)
 
 
+@lru_cache(maxsize=16)
+def _arched_pocket_mesh_data(
+    radius: float,
+    depth: float,
+    vertices: int = 32,
+) -> Tuple["np.ndarray", Tuple[Tuple[int, ...], ...]]:
+    """
+    Cylinder with arched (conical) top as a single closed mesh.
+    
+    Same shape as the union of the pocket cylinder with a cone of
+    height radius / 2 centred on its top face, built directly
+    instead of through a boolean modifier:
+    
+    - ring 0: bottom edge (radius, -depth / 2)
+    - ring 1: top edge (radius, depth / 2)
+    - ring 2: where the cone leaves the cylinder (radius / 2, depth / 2)
+    - apex at depth / 2 + radius / 4
+    """
+    arch_height = radius * 0.5  # 45° slope
+    
+    phi = np.arange(vertices) * (2 * math.pi / vertices)
+    ring = np.column_stack((-np.sin(phi), np.cos(phi)))
+    
+    verts = np.concatenate([
+        np.column_stack((radius * ring, np.full(vertices, -depth / 2))),
+        np.column_stack((radius * ring, np.full(vertices, depth / 2))),
+        np.column_stack((radius / 2 * ring, np.full(vertices, depth / 2))),
+        [(0, 0, depth / 2 + arch_height / 2)],
+    ]).astype(np.float32)
+    verts.flags.writeable = False
+    
+    apex = 3 * vertices
+    faces = [tuple(range(vertices - 1, -1, -1))]  # Bottom cap
+    for i in range(vertices):
+        next_i = (i + 1) % vertices
+        # Wall
+        faces.append((i, next_i, vertices + next_i, vertices + i))
+        # Top annulus
+        faces.append((
+            vertices + i, vertices + next_i,
+            2 * vertices + next_i, 2 * vertices + i,
+        ))
+        # Arch
+        faces.append((2 * vertices + i, 2 * vertices + next_i, apex))
+    
+    return verts, tuple(faces)
+
+
+# Fixed clip topologies (vertex order as built in build_clip)
+_CLIP_MALE_FACES = (
+    (0, 1, 2, 3),               # Bottom
+    (0, 4, 5, 1),               # Front
+    (0, 3, 8, 11, 7, 4),        # Sides
+    (1, 5, 6, 10, 9, 2),
+    (4, 7, 6, 5),               # Top surfaces
+    (7, 11, 10, 6),
+    (8, 9, 10, 11),             # Back ramp
+    (3, 2, 9, 8),
+)
+
+# Female socket is a simple box
+_CLIP_FEMALE_FACES = (
+    (0, 1, 2, 3),
+    (7, 6, 5, 4),
+    (0, 4, 5, 1),
+    (2, 6, 7, 3),
+    (0, 3, 7, 4),
+    (1, 5, 6, 2),
+)
+
+
+@requires_bpy
 def build_clip(
     width: float = 8.0,
     height: float = 6.0,
@@ -186,7 +223,8 @@ def build_clip(
     is_male: bool = True,
     name: str = "Clip",
     location: Tuple[float, float, float] = (0, 0, 0),
-) -> Optional["bpy.types.Object"]:
+    link: bool = True,
+) -> "bpy.types.Object":
     """
     Create snap-fit clip connection.
     
@@ -203,85 +241,72 @@ def build_clip(
         is_male: True for clip, False for socket
         name: Object name
         location: Object location
+        link: Link to the active collection (False to batch-link)
     
     Returns:
         Blender object
     """
-    ensure_bpy()
-    
-    bm = bmesh.new()
-    
+    verts, faces = _clip_mesh_data(width, height, depth, lip_height, is_male)
+    return create_mesh_object(name, verts, faces, location, link=link)
+
+
+@lru_cache(maxsize=16)
+def _clip_mesh_data(
+    width: float,
+    height: float,
+    depth: float,
+    lip_height: float,
+    is_male: bool,
+) -> Tuple["np.ndarray", Tuple[Tuple[int, ...], ...]]:
+    """
+    Vertex and face data for build_clip (cached, read-only).
+    """
     if is_male:
         # Male clip with 45° entry ramp
         half_width = width / 2
         
-        verts = [
+        verts = np.array([
             # Base
-            bm.verts.new((-half_width, 0, 0)),
-            bm.verts.new((half_width, 0, 0)),
-            bm.verts.new((half_width, depth, 0)),
-            bm.verts.new((-half_width, depth, 0)),
+            (-half_width, 0, 0),
+            (half_width, 0, 0),
+            (half_width, depth, 0),
+            (-half_width, depth, 0),
             # Top with lip
-            bm.verts.new((-half_width, 0, height - lip_height)),
-            bm.verts.new((half_width, 0, height - lip_height)),
-            bm.verts.new((half_width, depth - lip_height, height - lip_height)),
-            bm.verts.new((-half_width, depth - lip_height, height - lip_height)),
+            (-half_width, 0, height - lip_height),
+            (half_width, 0, height - lip_height),
+            (half_width, depth - lip_height, height - lip_height),
+            (-half_width, depth - lip_height, height - lip_height),
             # Entry ramp (45° angle)
-            bm.verts.new((-half_width, depth, height)),
-            bm.verts.new((half_width, depth, height)),
-            bm.verts.new((half_width, depth - lip_height, height)),
-            bm.verts.new((-half_width, depth - lip_height, height)),
-        ]
+            (-half_width, depth, height),
+            (half_width, depth, height),
+            (half_width, depth - lip_height, height),
+            (-half_width, depth - lip_height, height),
+        ], dtype=np.float32)
         
-        # Create faces for clip shape
-        # Bottom
-        bm.faces.new([verts[0], verts[1], verts[2], verts[3]])
-        # Front
-        bm.faces.new([verts[0], verts[4], verts[5], verts[1]])
-        # Sides
-        bm.faces.new([verts[0], verts[3], verts[8], verts[11], verts[7], verts[4]])
-        bm.faces.new([verts[1], verts[5], verts[6], verts[10], verts[9], verts[2]])
-        # Top surfaces
-        bm.faces.new([verts[4], verts[7], verts[6], verts[5]])
-        bm.faces.new([verts[7], verts[11], verts[10], verts[6]])
-        # Back ramp
-        bm.faces.new([verts[8], verts[9], verts[10], verts[11]])
-        bm.faces.new([verts[3], verts[2], verts[9], verts[8]])
+        faces = _CLIP_MALE_FACES
         
     else:
         # Female socket (simple rectangular pocket)
         half_width = width / 2 + 0.15  # Add clearance
         
-        verts = [
-            bm.verts.new((-half_width, 0, 0)),
-            bm.verts.new((half_width, 0, 0)),
-            bm.verts.new((half_width, depth + 0.1, 0)),
-            bm.verts.new((-half_width, depth + 0.1, 0)),
-            bm.verts.new((-half_width, 0, height + 0.1)),
-            bm.verts.new((half_width, 0, height + 0.1)),
-            bm.verts.new((half_width, depth + 0.1, height + 0.1)),
-            bm.verts.new((-half_width, depth + 0.1, height + 0.1)),
-        ]
+        verts = np.array([
+            (-half_width, 0, 0),
+            (half_width, 0, 0),
+            (half_width, depth + 0.1, 0),
+            (-half_width, depth + 0.1, 0),
+            (-half_width, 0, height + 0.1),
+            (half_width, 0, height + 0.1),
+            (half_width, depth + 0.1, height + 0.1),
+            (-half_width, depth + 0.1, height + 0.1),
+        ], dtype=np.float32)
         
-        # Simple box faces
-        bm.faces.new([verts[0], verts[1], verts[2], verts[3]])
-        bm.faces.new([verts[7], verts[6], verts[5], verts[4]])
-        bm.faces.new([verts[0], verts[4], verts[5], verts[1]])
-        bm.faces.new([verts[2], verts[6], verts[7], verts[3]])
-        bm.faces.new([verts[0], verts[3], verts[7], verts[4]])
-        bm.faces.new([verts[1], verts[5], verts[6], verts[2]])
-    
-    mesh = bpy.data.meshes.new(name)
-    bm.to_mesh(mesh)
-    bm.free()
-    
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
-    obj.location = location
-    
-    return obj
+        faces = _CLIP_FEMALE_FACES
+    
+    verts.flags.writeable = False
+    return verts, faces
 
 
+@requires_bpy
 def build_stacking_key(
     width: float = 4.0,
     depth: float = 4.0,
@@ -289,7 +314,8 @@ def build_stacking_key(
     shape: str = "triangle",
     name: str = "StackingKey",
     location: Tuple[float, float, float] = (0, 0, 0),
-) -> Optional["bpy.types.Object"]:
+    link: bool = True,
+) -> "bpy.types.Object":
     """
     Create anti-rotation stacking key.
     
@@ -304,68 +330,51 @@ def build_stacking_key(
         shape: "triangle" or "diamond"
         name: Object name
         location: Object location
+        link: Link to the active collection (False to batch-link)
     
     Returns:
         Blender object
     """
-    ensure_bpy()
-    
-    bm = bmesh.new()
-    
+    verts, faces = _stacking_key_mesh_data(width, depth, height, shape)
+    return create_mesh_object(name, verts, faces, location, link=link)
+
+
+@lru_cache(maxsize=16)
+def _stacking_key_mesh_data(
+    width: float,
+    depth: float,
+    height: float,
+    shape: str,
+) -> Tuple["np.ndarray", Tuple[Tuple[int, ...], ...]]:
+    """
+    Vertex and face data for build_stacking_key (cached, read-only).
+    """
     if shape == "triangle":
         # Triangular key
-        verts_bottom = [
-            bm.verts.new((0, -depth / 2, 0)),
-            bm.verts.new((width / 2, depth / 2, 0)),
-            bm.verts.new((-width / 2, depth / 2, 0)),
-        ]
-        verts_top = [
-            bm.verts.new((v.co.x, v.co.y, height)) for v in verts_bottom
-        ]
-        
-        bm.faces.new(verts_bottom)
-        bm.faces.new(list(reversed(verts_top)))
-        for i in range(3):
-            next_i = (i + 1) % 3
-            bm.faces.new([
-                verts_bottom[i], verts_bottom[next_i],
-                verts_top[next_i], verts_top[i]
-            ])
+        bottom = np.array([
+            (0, -depth / 2, 0),
+            (width / 2, depth / 2, 0),
+            (-width / 2, depth / 2, 0),
+        ], dtype=np.float32)
         
     else:  # diamond
         # Diamond key
         half_w = width / 2
         half_d = depth / 2
-        verts_bottom = [
-            bm.verts.new((0, -half_d, 0)),
-            bm.verts.new((half_w, 0, 0)),
-            bm.verts.new((0, half_d, 0)),
-            bm.verts.new((-half_w, 0, 0)),
-        ]
-        verts_top = [
-            bm.verts.new((v.co.x, v.co.y, height)) for v in verts_bottom
-        ]
-        
-        bm.faces.new(verts_bottom)
-        bm.faces.new(list(reversed(verts_top)))
-        for i in range(4):
-            next_i = (i + 1) % 4
-            bm.faces.new([
-                verts_bottom[i], verts_bottom[next_i],
-                verts_top[next_i], verts_top[i]
-            ])
-    
-    mesh = bpy.data.meshes.new(name)
-    bm.to_mesh(mesh)
-    bm.free()
-    
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
-    obj.location = location
-    
-    return obj
+        bottom = np.array([
+            (0, -half_d, 0),
+            (half_w, 0, 0),
+            (0, half_d, 0),
+            (-half_w, 0, 0),
+        ], dtype=np.float32)
+    
+    verts = np.concatenate([bottom, bottom + (0, 0, height)])
+    verts.flags.writeable = False
+    
+    return verts, prism_faces(len(bottom))
 
 
+@requires_bpy
 def build_micro_teeth(
     length: float,
     width: float = 10.0,
@@ -373,7 +382,8 @@ def build_micro_teeth(
     tooth_pitch: float = 1.0,
     name: str = "MicroTeeth",
     location: Tuple[float, float, float] = (0, 0, 0),
-) -> Optional["bpy.types.Object"]:
+    link: bool = True,
+) -> "bpy.types.Object":
     """
     Create anti-slide micro teeth for contact surfaces.
     
@@ -389,56 +399,70 @@ def build_micro_teeth(
         tooth_pitch: Distance between teeth
         name: Object name
         location: Object location
+        link: Link to the active collection (False to batch-link)
     
     Returns:
         Blender object
     """
-    ensure_bpy()
-    
-    bm = bmesh.new()
-    
     half_width = width / 2
     num_teeth = int(length / tooth_pitch)
     
-    # Create sawtooth profile along Y
-    verts: list = []
-    
-    for i in range(num_teeth + 1):
-        y = i * tooth_pitch
-        # Base of tooth
-        verts.extend([
-            bm.verts.new((-half_width, y, 0)),
-            bm.verts.new((half_width, y, 0)),
-        ])
-        # Peak of tooth (45° safe)
-        if i < num_teeth:
-            y_peak = y + tooth_pitch / 2
-            verts.extend([
-                bm.verts.new((-half_width, y_peak, tooth_height)),
-                bm.verts.new((half_width, y_peak, tooth_height)),
-            ])
-    
-    # Create faces connecting vertices
-    # This creates a series of triangular teeth
-    for i in range(0, len(verts) - 4, 4):
-        # Left side triangle
-        bm.faces.new([verts[i], verts[i + 2], verts[i + 4]])
-        # Right side triangle
-        bm.faces.new([verts[i + 1], verts[i + 5], verts[i + 3]])
-        # Top face
-        bm.faces.new([verts[i + 2], verts[i + 3], verts[i + 5], verts[i + 4]])
-        # Front ramp
-        bm.faces.new([verts[i], verts[i + 1], verts[i + 3], verts[i + 2]])
-    
-    mesh = bpy.data.meshes.new(name)
-    bm.to_mesh(mesh)
-    bm.free()
-    
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
-    obj.location = location
-    
-    return obj
+    # Sawtooth profile along Y: per tooth a base pair then a peak
+    # pair (4 rows), closed by a final base pair
+    ys_base = np.arange(num_teeth + 1) * tooth_pitch
+    ys_peak = ys_base[:-1] + tooth_pitch / 2
+    
+    verts = np.zeros((4 * num_teeth + 2, 3), dtype=np.float32)
+    verts[0::2, 0] = -half_width
+    verts[1::2, 0] = half_width
+    verts[0::4, 1] = ys_base
+    verts[1::4, 1] = ys_base
+    verts[2::4, 1] = ys_peak
+    verts[3::4, 1] = ys_peak
+    verts[2::4, 2] = tooth_height  # Peak of tooth (45° safe)
+    verts[3::4, 2] = tooth_height
+    
+    # Same stride-4 face pattern for every tooth
+    offsets = 4 * np.arange(num_teeth)[:, None, None]
+    tris = offsets + np.array([
+        (0, 2, 4),          # Left side triangle
+        (1, 5, 3),          # Right side triangle
+    ])
+    quads = offsets + np.array([
+        (2, 3, 5, 4),       # Top face
+        (0, 1, 3, 2),       # Front ramp
+    ])
+    faces = tris.reshape(-1, 3).tolist() + quads.reshape(-1, 4).tolist()
+    
+    return create_mesh_object(name, verts, faces, location, link=link)
+
+
+# Connector positions as fractions of the box footprint
+_DOVETAIL_FRACTIONS = ((0.2, 0.2), (0.8, 0.2), (0.2, 0.8), (0.8, 0.8))
+_MAGNET_FRACTIONS = ((0.15, 0.15), (0.85, 0.15), (0.15, 0.85), (0.85, 0.85))
+_CLIP_FRACTIONS = ((0.5, 0.2), (0.5, 0.8))
+
+
+def _footprint_locations(
+    fractions: Tuple[Tuple[float, float], ...],
+    width: float,
+    depth: float,
+) -> "np.ndarray":
+    """
+    Map footprint fractions to centred local (x, y, 0) locations.
+    
+    Args:
+        fractions: (fx, fy) pairs in 0..1 across width and depth
+        width: Box width
+        depth: Box depth
+    
+    Returns:
+        Array of shape (N, 3)
+    """
+    size = np.array([width, depth])
+    locations = np.zeros((len(fractions), 3))
+    locations[:, :2] = np.asarray(fractions) * size - size / 2
+    return locations
 
 
 def build_connection_set(
@@ -454,6 +478,9 @@ def build_connection_set(
     
     Returns:
         List of connection objects
+    
+    Objects are created off-scene and linked to the active
+    collection together once the whole set is built.
     """
     connection_type = config.connection_auto
     width = config.config.width
@@ -463,54 +490,41 @@ def build_connection_set(
     
     if connection_type == ConnectionType.DOVETAIL:
         # Four dovetails at corners
-        positions = [
-            (width * 0.2, depth * 0.2),
-            (width * 0.8, depth * 0.2),
-            (width * 0.2, depth * 0.8),
-            (width * 0.8, depth * 0.8),
-        ]
-        for i, (x, y) in enumerate(positions):
+        locations = _footprint_locations(_DOVETAIL_FRACTIONS, width, depth)
+        for i, loc in enumerate(locations):
             dt = build_dovetail(
                 width=8, depth=4, height=6,
                 is_male=is_top,
                 name=f"Dovetail_{i}",
-                location=(x - width / 2, y - depth / 2, 0)
+                location=tuple(loc),
+                link=False,
             )
-            if dt:
-                connections.append(dt)
+            connections.append(dt)
     
     elif connection_type == ConnectionType.MAGNET:
         # Four magnet pockets at corners
-        positions = [
-            (width * 0.15, depth * 0.15),
-            (width * 0.85, depth * 0.15),
-            (width * 0.15, depth * 0.85),
-            (width * 0.85, depth * 0.85),
-        ]
-        for i, (x, y) in enumerate(positions):
+        locations = _footprint_locations(_MAGNET_FRACTIONS, width, depth)
+        for i, loc in enumerate(locations):
             mp = build_magnet_pocket(
                 diameter=config.MAGNET_DIA,
                 depth=config.MAGNET_DEPTH,
                 name=f"MagnetPocket_{i}",
-                location=(x - width / 2, y - depth / 2, 0)
+                location=tuple(loc),
+                link=False,
             )
-            if mp:
-                connections.append(mp)
+            connections.append(mp)
     
     elif connection_type == ConnectionType.CLIP:
         # Two clips on long sides
-        positions = [
-            (width / 2, depth * 0.2),
-            (width / 2, depth * 0.8),
-        ]
-        for i, (x, y) in enumerate(positions):
+        locations = _footprint_locations(_CLIP_FRACTIONS, width, depth)
+        for i, loc in enumerate(locations):
             clip = build_clip(
                 is_male=is_top,
                 name=f"Clip_{i}",
-                location=(x - width / 2, y - depth / 2, 0)
+                location=tuple(loc),
+                link=False,
             )
-            if clip:
-                connections.append(clip)
+            connections.append(clip)
     
     # Add stacking keys (always)
     if is_top:
@@ -518,16 +532,18 @@ def build_connection_set(
         key1 = build_stacking_key(
             shape="triangle",
             name="StackKey_Triangle",
-            location=(-width / 2 + 15, -depth / 2 + 15, 0)
+            location=(-width / 2 + 15, -depth / 2 + 15, 0),
+            link=False,
         )
         key2 = build_stacking_key(
             shape="diamond",
             name="StackKey_Diamond",
-            location=(width / 2 - 15, depth / 2 - 15, 0)
+            location=(width / 2 - 15, depth / 2 - 15, 0),
+            link=False,
         )
-        if key1:
-            connections.append(key1)
-        if key2:
-            connections.append(key2)
+        connections.append(key1)
+        connections.append(key2)
+    
+    link_objects(connections)
     
     return connections
@@ -4,25 +4,31 @@ Divider System for Storage Box.
 Removable dividers with snap and lock modes.
 """
 
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Tuple
 
 try:
     import bpy
-    import bmesh
+    import numpy as np
     HAS_BPY = True
 except ImportError:
     HAS_BPY = False
 
 from ..config.derived_config import DerivedConfig
 from ..config.enums import DividerMode
+from ..geometry.boolean_ops import boolean_difference, boolean_union
+from ..geometry.primitives import (
+    create_box,
+    create_mesh_object,
+    cylinder_mesh_data,
+    linked_duplicate,
+    prism_faces,
+    requires_bpy,
+    tile_mesh_data,
+)
 
 
-def ensure_bpy():
-    """Check if bpy is available."""
-    if not HAS_BPY:
-        raise RuntimeError("Blender Python API (bpy) not available")
-
-
+@requires_bpy
 def build_divider(
     length: float,
     height: float,
@@ -32,7 +38,7 @@ def build_divider(
     tab_position: str = "center",
     name: str = "Divider",
     location: Tuple[float, float, float] = (0, 0, 0),
-) -> Optional["bpy.types.Object"]:
+) -> "bpy.types.Object":
     """
     Create a single divider piece.
     
@@ -55,10 +61,6 @@ def build_divider(
     Returns:
         Blender object
     """
-    ensure_bpy()
-    
-    bm = bmesh.new()
-    
     half_len = length / 2
     half_thick = thickness / 2
     
@@ -67,35 +69,15 @@ def build_divider(
     slot_width = 2.4
     
     # Main divider body
-    verts_front = [
-        bm.verts.new((-half_len, -half_thick, 0)),
-        bm.verts.new((half_len, -half_thick, 0)),
-        bm.verts.new((half_len, -half_thick, height)),
-        bm.verts.new((-half_len, -half_thick, height)),
-    ]
-    
-    verts_back = [
-        bm.verts.new((-half_len, half_thick, 0)),
-        bm.verts.new((half_len, half_thick, 0)),
-        bm.verts.new((half_len, half_thick, height)),
-        bm.verts.new((-half_len, half_thick, height)),
-    ]
-    
-    # Create main body faces
-    bm.faces.new(verts_front)
-    bm.faces.new(list(reversed(verts_back)))
-    for i in range(4):
-        next_i = (i + 1) % 4
-        bm.faces.new([verts_front[i], verts_front[next_i],
-                      verts_back[next_i], verts_back[i]])
-    
-    mesh = bpy.data.meshes.new(name)
-    bm.to_mesh(mesh)
-    bm.free()
+    front = np.array([
+        (-half_len, -half_thick, 0),
+        (-half_len, -half_thick, height),
+        (half_len, -half_thick, height),
+        (half_len, -half_thick, 0),
+    ], dtype=np.float32)
+    verts = np.concatenate([front, front + (0, thickness, 0)])
     
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
-    obj.location = location
+    obj = create_mesh_object(name, verts, prism_faces(4), location)
     
     # Add tab if requested
     if has_tab:
@@ -105,17 +87,15 @@ def build_divider(
             slot_width - 0.2,  # Clearance
             mode,
         )
-        if tab:
-            # Position tab at center-bottom
-            if tab_position == "left":
-                tab.location = (-half_len * 0.6, 0, -slot_depth / 2)
-            elif tab_position == "right":
-                tab.location = (half_len * 0.6, 0, -slot_depth / 2)
-            else:
-                tab.location = (0, 0, -slot_depth / 2)
-            
-            from ..geometry.boolean_ops import boolean_union
-            boolean_union(obj, tab)
+        # Position tab at center-bottom
+        if tab_position == "left":
+            tab.location = (-half_len * 0.6, 0, -slot_depth / 2)
+        elif tab_position == "right":
+            tab.location = (half_len * 0.6, 0, -slot_depth / 2)
+        else:
+            tab.location = (0, 0, -slot_depth / 2)
+        
+        boolean_union(obj, tab)
     
     return obj
 
@@ -125,71 +105,42 @@ def _build_divider_tab(
     depth: float,
     width: float,
     mode: DividerMode,
-) -> Optional["bpy.types.Object"]:
+) -> "bpy.types.Object":
     """
     Create tab for slot engagement.
     
     SNAP: Rounded edges for easy insertion/removal
     LOCK: Has catch that clicks into keyhole
     """
-    ensure_bpy()
-    
-    bm = bmesh.new()
-    
     half_len = length / 2
     half_w = width / 2
     
     if mode == DividerMode.SNAP:
         # Simple rounded tab
-        verts = [
-            bm.verts.new((-half_len + 1, -half_w, 0)),
-            bm.verts.new((-half_len, -half_w, -depth * 0.3)),
-            bm.verts.new((-half_len, -half_w, -depth)),
-            bm.verts.new((half_len, -half_w, -depth)),
-            bm.verts.new((half_len, -half_w, -depth * 0.3)),
-            bm.verts.new((half_len - 1, -half_w, 0)),
-        ]
-        verts_back = [
-            bm.verts.new((v.co.x, half_w, v.co.z)) for v in verts
-        ]
-        
-        bm.faces.new(verts)
-        bm.faces.new(list(reversed(verts_back)))
-        for i in range(len(verts)):
-            next_i = (i + 1) % len(verts)
-            bm.faces.new([verts[i], verts[next_i],
-                          verts_back[next_i], verts_back[i]])
+        front = np.array([
+            (-half_len + 1, -half_w, 0),
+            (half_len - 1, -half_w, 0),
+            (half_len, -half_w, -depth * 0.3),
+            (half_len, -half_w, -depth),
+            (-half_len, -half_w, -depth),
+            (-half_len, -half_w, -depth * 0.3),
+        ], dtype=np.float32)
     
     else:  # LOCK mode
         # Tab with locking catch
         catch_height = 0.8
-        verts = [
-            bm.verts.new((-half_len, -half_w, 0)),
-            bm.verts.new((-half_len, -half_w, -depth + catch_height)),
-            bm.verts.new((-half_len - 0.5, -half_w, -depth)),
-            bm.verts.new((half_len + 0.5, -half_w, -depth)),
-            bm.verts.new((half_len, -half_w, -depth + catch_height)),
-            bm.verts.new((half_len, -half_w, 0)),
-        ]
-        verts_back = [
-            bm.verts.new((v.co.x, half_w, v.co.z)) for v in verts
-        ]
-        
-        bm.faces.new(verts)
-        bm.faces.new(list(reversed(verts_back)))
-        for i in range(len(verts)):
-            next_i = (i + 1) % len(verts)
-            bm.faces.new([verts[i], verts[next_i],
-                          verts_back[next_i], verts_back[i]])
-    
-    mesh = bpy.data.meshes.new("DividerTab")
-    bm.to_mesh(mesh)
-    bm.free()
-    
-    obj = bpy.data.objects.new("DividerTab", mesh)
-    bpy.context.collection.objects.link(obj)
-    
-    return obj
+        front = np.array([
+            (-half_len, -half_w, 0),
+            (half_len, -half_w, 0),
+            (half_len, -half_w, -depth + catch_height),
+            (half_len + 0.5, -half_w, -depth),
+            (-half_len - 0.5, -half_w, -depth),
+            (-half_len, -half_w, -depth + catch_height),
+        ], dtype=np.float32)
+    
+    verts = np.concatenate([front, front + (0, width, 0)])
+    
+    return create_mesh_object("DividerTab", verts, prism_faces(len(front)))
 
 
 def build_divider_set(
@@ -208,48 +159,54 @@ def build_divider_set(
     if cols == 0 and rows == 0:
         return []
     
-    width = config.drawer_width - 2 * config.wall_thickness
-    depth = config.drawer_depth - 2 * config.wall_thickness
     height = config.drawer_inner_depth - 2
     
     mode = config.config.divider_mode
     
     dividers: list = []
     
+    # All dividers in a direction are identical: build the mesh once
+    # and add linked duplicates for the rest
+    
     # Column dividers (run along Y)
-    for i in range(cols):
+    if cols > 0:
+        depth = config.drawer_depth - 2 * config.wall_thickness
         div = build_divider(
             length=depth - 5,
             height=height,
             mode=mode,
-            name=f"ColDivider_{i}",
+            name="ColDivider_0",
         )
-        if div:
-            dividers.append(div)
+        dividers.append(div)
+        for i in range(1, cols):
+            dividers.append(linked_duplicate(div, f"ColDivider_{i}"))
     
     # Row dividers (run along X)
-    for i in range(rows):
+    if rows > 0:
+        width = config.drawer_width - 2 * config.wall_thickness
         div = build_divider(
             length=width - 5,
             height=height,
             mode=mode,
-            name=f"RowDivider_{i}",
+            name="RowDivider_0",
         )
-        if div:
-            # Rotate 90 degrees for row orientation
-            div.rotation_euler = (0, 0, 1.5708)  # 90 degrees
-            dividers.append(div)
+        # Rotate 90 degrees for row orientation
+        div.rotation_euler = (0, 0, 1.5708)  # 90 degrees
+        dividers.append(div)
+        for i in range(1, rows):
+            dividers.append(linked_duplicate(div, f"RowDivider_{i}"))
     
     return dividers
 
 
+@requires_bpy
 def build_insert(
     width: float,
     depth: float,
     insert_type: str = "flat",
     name: str = "Insert",
     location: Tuple[float, float, float] = (0, 0, 0),
-) -> Optional["bpy.types.Object"]:
+) -> "bpy.types.Object":
     """
     Create modular bottom insert for drawer cell.
     
@@ -270,22 +227,10 @@ def build_insert(
     Returns:
         Blender object
     """
-    ensure_bpy()
-    
     thickness = 1.4
     
     # Base plate
-    bpy.ops.mesh.primitive_cube_add(
-        size=1,
-        location=location
-    )
-    insert = bpy.context.active_object
-    if insert is None:
-        return None
-    
-    insert.name = name
-    insert.scale = (width, depth, thickness)
-    bpy.ops.object.transform_apply(scale=True)
+    insert = create_box(width, depth, thickness, name=name, location=location)
     
     if insert_type == "honeycomb":
         _add_honeycomb_pattern(insert, width, depth)
@@ -303,35 +248,58 @@ def _add_honeycomb_pattern(
     depth: float,
 ) -> None:
     """Add honeycomb depressions for round items."""
-    from ..geometry.boolean_ops import boolean_batch_difference
     
     cell_size = 15.0
     cell_depth = 0.8
     
+    centers = _honeycomb_cell_centers(width, depth, cell_size, cell_depth)
+    
+    if len(centers):
+        # All cells as one cutter: one boolean instead of one per cell
+        verts, faces = cylinder_mesh_data(
+            cell_size / 2 - 1, cell_depth, vertices=6
+        )
+        cells = create_mesh_object(
+            "HoneycombCells", *tile_mesh_data(verts, faces, centers)
+        )
+        boolean_difference(insert, cells)
+
+
+@lru_cache(maxsize=16)
+def _honeycomb_cell_centers(
+    width: float,
+    depth: float,
+    cell_size: float,
+    cell_depth: float,
+) -> "np.ndarray":
+    """
+    Centres of the honeycomb cells that fit inside the insert.
+    
+    Odd rows are shifted by half a cell; cells closer than 5mm to
+    the insert edge are dropped. Computed over the whole cols x rows
+    grid at once instead of a nested Python loop. Cached per insert
+    size, so the array is read-only.
+    
+    Returns:
+        (N, 3) array of cell centres, row-major
+    """
     cols = int(width / cell_size)
     rows = int(depth / cell_size)
     
-    cells: list["bpy.types.Object"] = []
-    
-    for row in range(rows):
-        offset = cell_size / 2 if row % 2 else 0
-        for col in range(cols):
-            x = -width / 2 + col * cell_size + cell_size / 2 + offset
-            y = -depth / 2 + row * cell_size * 0.866 + cell_size / 2
-            
-            if abs(x) < width / 2 - 5 and abs(y) < depth / 2 - 5:
-                bpy.ops.mesh.primitive_cylinder_add(
-                    vertices=6,
-                    radius=cell_size / 2 - 1,
-                    depth=cell_depth,
-                    location=(x, y, cell_depth / 2)
-                )
-                cell = bpy.context.active_object
-                if cell is not None:
-                    cells.append(cell)
-    
-    if cells:
-        boolean_batch_difference(insert, cells)
+    row, col = np.meshgrid(np.arange(rows), np.arange(cols), indexing="ij")
+    
+    x = -width / 2 + col * cell_size + cell_size / 2 + (row % 2) * (cell_size / 2)
+    y = -depth / 2 + row * cell_size * 0.866 + cell_size / 2
+    
+    inside = (np.abs(x) < width / 2 - 5) & (np.abs(y) < depth / 2 - 5)
+    
+    centers = np.column_stack((
+        x[inside],
+        y[inside],
+        np.full(np.count_nonzero(inside), cell_depth / 2),
+    ))
+    centers.flags.writeable = False
+    return centers
 
 
 def _add_cable_waves(
@@ -340,30 +308,24 @@ def _add_cable_waves(
     depth: float,
 ) -> None:
     """Add wavy grooves for cable organization."""
-    from ..geometry.boolean_ops import boolean_batch_difference
     
     num_grooves = 4
     groove_depth = 0.6
     groove_width = 8.0
     
-    grooves: list["bpy.types.Object"] = []
-    
-    for i in range(num_grooves):
-        y = -depth / 2 + (i + 1) * depth / (num_grooves + 1)
-        
-        bpy.ops.mesh.primitive_cylinder_add(
-            vertices=16,
-            radius=groove_width / 2,
-            depth=width - 10,
-            location=(0, y, groove_depth / 2)
-        )
-        groove = bpy.context.active_object
-        if groove is not None:
-            groove.rotation_euler = (0, 1.5708, 0)
-            grooves.append(groove)
+    centers = [
+        (0, -depth / 2 + (i + 1) * depth / (num_grooves + 1), groove_depth / 2)
+        for i in range(num_grooves)
+    ]
     
-    if grooves:
-        boolean_batch_difference(insert, grooves)
+    # Grooves run along X, fused into a single cutter
+    verts, faces = cylinder_mesh_data(
+        groove_width / 2, width - 10, vertices=16, axis="X"
+    )
+    grooves = create_mesh_object(
+        "CableGrooves", *tile_mesh_data(verts, faces, centers)
+    )
+    boolean_difference(insert, grooves)
 
 
 def _add_pencil_grooves(
@@ -372,27 +334,22 @@ def _add_pencil_grooves(
     depth: float,
 ) -> None:
     """Add parallel grooves for pens/pencils."""
-    from ..geometry.boolean_ops import boolean_batch_difference
     
     num_grooves = int(width / 12)
     groove_depth = 0.8
     groove_dia = 10.0
     
-    grooves: list["bpy.types.Object"] = []
+    centers = [
+        (-width / 2 + (i + 1) * width / (num_grooves + 1), 0, groove_depth / 2)
+        for i in range(num_grooves)
+    ]
     
-    for i in range(num_grooves):
-        x = -width / 2 + (i + 1) * width / (num_grooves + 1)
-        
-        bpy.ops.mesh.primitive_cylinder_add(
-            vertices=16,
-            radius=groove_dia / 2,
-            depth=depth - 10,
-            location=(x, 0, groove_depth / 2)
+    if centers:
+        # Grooves run along Y, fused into a single cutter
+        verts, faces = cylinder_mesh_data(
+            groove_dia / 2, depth - 10, vertices=16, axis="Y"
         )
-        groove = bpy.context.active_object
-        if groove is not None:
-            groove.rotation_euler = (1.5708, 0, 0)
-            grooves.append(groove)
-    
-    if grooves:
-        boolean_batch_difference(insert, grooves)
+        grooves = create_mesh_object(
+            "PencilGrooves", *tile_mesh_data(verts, faces, centers)
+        )
+        boolean_difference(insert, grooves)
@@ -4,29 +4,50 @@ Drawer Component for Storage Box.
 Sliding drawer with stops, front panel, and divider slots.
 """
 
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Tuple
 
 try:
     import bpy
+    import numpy as np
     HAS_BPY = True
 except ImportError:
     HAS_BPY = False
 
 from ..config.derived_config import DerivedConfig
 from ..config.design_tokens import DesignTokens
+from ..geometry.boolean_ops import (
+    boolean_batch_difference,
+    boolean_batch_union,
+    boolean_difference,
+    ensure_object_mode,
+)
+from ..geometry.primitives import (
+    cached_mesh_object,
+    create_box,
+    create_mesh_object,
+    cylinder_mesh_data,
+    linked_duplicate,
+    requires_bpy,
+    tile_mesh_data,
+)
+from .front_panel import build_front_panel
+from .rails import build_v_groove
 
 
-def ensure_bpy():
-    """Check if bpy is available."""
-    if not HAS_BPY:
-        raise RuntimeError("Blender Python API (bpy) not available")
+# Quadrant signs for the four mirrored corner features
+_CORNER_SIGNS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
 
+# Weep holes are hidden under the drawer; a coarse prism is enough
+_WEEP_HOLE_SEGMENTS = 8
 
+
+@requires_bpy
 def build_drawer(
     config: DerivedConfig,
     tokens: DesignTokens,
     name: str = "Drawer",
-) -> Optional["bpy.types.Object"]:
+) -> "bpy.types.Object":
     """
     Build complete drawer with all features.
     
@@ -39,6 +60,9 @@ def build_drawer(
     - Micro lip for content retention
     - Weep holes for cleaning
     
+    Optional details are skipped entirely (no cutters are built) when
+    ``config.features_enabled`` turns them off.
+    
     Args:
         config: DerivedConfig with all parameters
         tokens: DesignTokens for visual style
@@ -47,27 +71,23 @@ def build_drawer(
     Returns:
         Complete drawer object
     """
-    ensure_bpy()
-    
-    from ..geometry.boolean_ops import (
-        boolean_difference,
-        boolean_union,
-        boolean_batch_difference,
-    )
-    from .rails import build_v_groove
-    from .front_panel import build_front_panel
-    from .stops import build_two_stage_stop
+    ensure_object_mode()
     
     width = config.drawer_width
     depth = config.drawer_depth
     height = config.drawer_height
     wall = config.wall_thickness
     floor = config.floor_thickness
+    features = config.features_enabled
+    
+    # Features are collected first and applied in two boolean passes
+    # (all unions, then all differences) instead of one pass each.
+    # Additive parts never overlap the cutters, so the order is safe.
+    additive: list["bpy.types.Object"] = []
+    cutters: list["bpy.types.Object"] = []
     
     # Step 1: Create drawer tray
     drawer = _create_tray(width, depth, height, floor, name)
-    if drawer is None:
-        return None
     
     # Step 2: Create inner cavity
     inner = _create_inner_cavity(
@@ -75,12 +95,11 @@ def build_drawer(
         depth - 2 * wall,
         height - floor,
     )
-    if inner:
-        inner.location = (0, 0, floor / 2)
-        boolean_difference(drawer, inner)
+    inner.location = (0, 0, floor / 2)
+    cutters.append(inner)
     
     # Step 3: Add V-grooves on sides for rail engagement
-    clearance = config.tolerances["slide"]
+    clearance = config.tol_slide
     groove_left = build_v_groove(
         depth,
         width=config.RAIL_WIDTH,
@@ -89,29 +108,31 @@ def build_drawer(
         name="GrooveLeft",
         location=(-width / 2, -depth / 2, height / 2)
     )
-    groove_right = build_v_groove(
-        depth,
-        width=config.RAIL_WIDTH,
-        depth=config.RAIL_DEPTH,
-        clearance=clearance,
-        name="GrooveRight",
-        location=(width / 2, -depth / 2, height / 2)
+    # The V profile is symmetric in X, so the right groove shares
+    # the left groove's mesh and only moves to the mirrored side.
+    groove_right = linked_duplicate(
+        groove_left,
+        "GrooveRight",
+        location=(width / 2, -depth / 2, height / 2),
     )
-    
-    grooves: list["bpy.types.Object"] = []
-    if groove_left:
-        grooves.append(groove_left)
-    if groove_right:
-        grooves.append(groove_right)
-    if grooves:
-        boolean_batch_difference(drawer, grooves)
+    cutters.extend((groove_left, groove_right))
     
     # Step 4: Add dust shelves on grooves
-    _add_dust_shelves(drawer, config)
+    if features.get("dust_shelves", True):
+        additive.extend(
+            _build_dust_shelves(width, depth, height, config.DUST_SHELF)
+        )
     
     # Step 5: Add divider slots
-    if config.features_enabled.get("dividers", False):
-        _add_divider_slots(drawer, config)
+    if features.get("dividers", False):
+        cutters.extend(_build_divider_slots(
+            config.divider_count,
+            width - 2 * wall,
+            depth - 2 * wall,
+            floor,
+            config.SLOT_WIDTH,
+            config.SLOT_DEPTH,
+        ))
     
     # Step 6: Add front panel
     front = build_front_panel(
@@ -119,20 +140,27 @@ def build_drawer(
         name="FrontPanel",
         location=(0, -depth / 2 - config.front_panel_thickness / 2, height / 2)
     )
-    if front:
-        boolean_union(drawer, front)
+    additive.append(front)
     
     # Step 7: Add stop engagement features
-    _add_stop_features(drawer, config)
+    if features.get("stops", True):
+        cutters.append(_build_stop_notch(depth, height))
     
     # Step 8: Add slide pad mounts
-    _add_slide_pad_mounts(drawer, config)
+    if features.get("slide_pads", True):
+        cutters.extend(_build_slide_pad_mounts(width, depth))
     
     # Step 9: Add micro lip for content retention
-    _add_micro_lip(drawer, config)
+    if features.get("micro_lip", True):
+        additive.append(_build_micro_lip(width, depth, height, wall))
     
     # Step 10: Add weep holes
-    _add_weep_holes(drawer, config)
+    if features.get("weep_holes", True):
+        cutters.append(_build_weep_holes(width, depth, floor))
+    
+    # Apply everything in two batched passes
+    boolean_batch_union(drawer, additive)
+    boolean_batch_difference(drawer, cutters)
     
     return drawer
 
@@ -143,263 +171,216 @@ def _create_tray(
     height: float,
     floor: float,
     name: str,
-) -> Optional["bpy.types.Object"]:
+) -> "bpy.types.Object":
     """Create basic drawer tray."""
-    ensure_bpy()
-    
-    bpy.ops.mesh.primitive_cube_add(
-        size=1,
-        location=(0, 0, height / 2)
+    return create_box(
+        width, depth, height,
+        name=name,
+        location=(0, 0, height / 2),
     )
-    obj = bpy.context.active_object
-    if obj is not None:
-        obj.name = name
-        obj.scale = (width, depth, height)
-        bpy.ops.object.transform_apply(scale=True)
-    
-    return obj
 
 
 def _create_inner_cavity(
     width: float,
     depth: float,
     height: float,
-) -> Optional["bpy.types.Object"]:
+) -> "bpy.types.Object":
     """Create inner cavity for drawer contents."""
-    ensure_bpy()
-    
-    bpy.ops.mesh.primitive_cube_add(
-        size=1,
-        location=(0, 0, height / 2)
+    return create_box(
+        width, depth, height,
+        name="DrawerCavity",
+        location=(0, 0, height / 2),
     )
-    obj = bpy.context.active_object
-    if obj is not None:
-        obj.name = "DrawerCavity"
-        obj.scale = (width, depth, height)
-        bpy.ops.object.transform_apply(scale=True)
-    
-    return obj
 
 
-def _add_dust_shelves(
-    drawer: "bpy.types.Object",
-    config: DerivedConfig,
-) -> None:
-    """Add dust shelves on V-grooves."""
-    from ..geometry.boolean_ops import boolean_union
-    
-    width = config.drawer_width
-    depth = config.drawer_depth
-    height = config.drawer_height
-    shelf_h = config.DUST_SHELF
-    
-    # Small shelf above each groove
-    for side in [-1, 1]:
-        x = side * (width / 2 - 1)
-        bpy.ops.mesh.primitive_cube_add(
-            size=1,
-            location=(x, 0, height - shelf_h / 2)
-        )
-        shelf = bpy.context.active_object
-        if shelf is not None:
-            shelf.name = f"DustShelf_{'L' if side < 0 else 'R'}"
-            shelf.scale = (2, depth - 10, shelf_h)
-            bpy.ops.object.transform_apply(scale=True)
-            boolean_union(drawer, shelf)
+def _build_dust_shelves(
+    width: float,
+    depth: float,
+    height: float,
+    shelf_h: float,
+) -> list:
+    """Build dust shelves on V-grooves (to union with the drawer)."""
+    # Small shelf above each groove; the right one shares the left mesh
+    x = width / 2 - 1
+    z = height - shelf_h / 2
+    left = create_box(
+        2, depth - 10, shelf_h,
+        name="DustShelf_L",
+        location=(-x, 0, z),
+    )
+    return [left, linked_duplicate(left, "DustShelf_R", location=(x, 0, z))]
 
 
-def _add_divider_slots(
-    drawer: "bpy.types.Object",
-    config: DerivedConfig,
-) -> None:
-    """Add universal slots for divider insertion."""
-    from ..geometry.boolean_ops import boolean_batch_difference
-    
-    cols, rows = config.divider_count
+def _build_divider_slots(
+    divider_count: Tuple[int, int],
+    width: float,
+    depth: float,
+    floor: float,
+    slot_w: float,
+    slot_d: float,
+) -> list:
+    """Build universal slots for divider insertion (cutters)."""
+    cols, rows = divider_count
     if cols == 0 and rows == 0:
-        return
-    
-    width = config.drawer_width - 2 * config.wall_thickness
-    depth = config.drawer_depth - 2 * config.wall_thickness
-    
-    slot_w = config.SLOT_WIDTH
-    slot_d = config.SLOT_DEPTH
+        return []
     
     slots: list["bpy.types.Object"] = []
+    z = slot_d / 2 + floor
     
     # Column divider slots (along X axis)
-    if cols > 0:
-        spacing = width / (cols + 1)
-        for i in range(1, cols + 1):
-            x = -width / 2 + i * spacing
-            bpy.ops.mesh.primitive_cube_add(
-                size=1,
-                location=(x, 0, slot_d / 2 + config.floor_thickness)
-            )
-            slot = bpy.context.active_object
-            if slot is not None:
-                slot.name = f"ColSlot_{i}"
-                slot.scale = (slot_w, depth - 5, slot_d)
-                bpy.ops.object.transform_apply(scale=True)
-                slots.append(slot)
+    xs = _compute_divider_positions(cols, width)
+    for i, x in enumerate(xs, start=1):
+        slots.append(create_box(
+            slot_w, depth - 5, slot_d,
+            name=f"ColSlot_{i}",
+            location=(x, 0, z),
+        ))
     
     # Row divider slots (along Y axis)
-    if rows > 0:
-        spacing = depth / (rows + 1)
-        for i in range(1, rows + 1):
-            y = -depth / 2 + i * spacing
-            bpy.ops.mesh.primitive_cube_add(
-                size=1,
-                location=(0, y, slot_d / 2 + config.floor_thickness)
-            )
-            slot = bpy.context.active_object
-            if slot is not None:
-                slot.name = f"RowSlot_{i}"
-                slot.scale = (width - 5, slot_w, slot_d)
-                bpy.ops.object.transform_apply(scale=True)
-                slots.append(slot)
-    
-    if slots:
-        boolean_batch_difference(drawer, slots)
+    ys = _compute_divider_positions(rows, depth)
+    for i, y in enumerate(ys, start=1):
+        slots.append(create_box(
+            width - 5, slot_w, slot_d,
+            name=f"RowSlot_{i}",
+            location=(0, y, z),
+        ))
+    
+    return slots
 
 
-def _add_stop_features(
-    drawer: "bpy.types.Object",
-    config: DerivedConfig,
-) -> None:
-    """Add engagement features for drawer stops."""
-    from ..geometry.boolean_ops import boolean_difference
+@lru_cache(maxsize=64)
+def _compute_divider_positions(count: int, span: float) -> Tuple[float, ...]:
+    """
+    Centred offsets of ``count`` evenly spaced dividers across ``span``.
     
-    # Notch for spring tab engagement
-    depth = config.drawer_depth
-    height = config.drawer_height
+    Pure layout kernel (no bpy); cached because catalog builds repeat
+    the same drawer sizes.
+    """
+    offsets = np.arange(1, count + 1) * (span / (count + 1)) - span / 2
+    return tuple(offsets.tolist())
+
+
+@lru_cache(maxsize=64)
+def _compute_corner_positions(
+    offset_x: float,
+    offset_y: float,
+) -> Tuple[Tuple[float, float], ...]:
+    """
+    Mirrored (x, y) positions of four corner features, _CORNER_SIGNS order.
     
+    Pure layout kernel (no bpy), shared by pad mounts and weep holes.
+    """
+    positions = np.array(_CORNER_SIGNS) * (offset_x, offset_y)
+    return tuple(map(tuple, positions.tolist()))
+
+
+def _build_stop_notch(
+    depth: float,
+    height: float,
+) -> "bpy.types.Object":
+    """Build engagement notch for drawer stops (cutter)."""
+    # Notch for spring tab engagement
     notch_w = 12.0
     notch_h = 4.0
     notch_d = 3.0
     
-    bpy.ops.mesh.primitive_cube_add(
-        size=1,
-        location=(0, depth / 2 - notch_d / 2, height - notch_h / 2)
+    return create_box(
+        notch_w, notch_d, notch_h,
+        name="StopNotch",
+        location=(0, depth / 2 - notch_d / 2, height - notch_h / 2),
     )
-    notch = bpy.context.active_object
-    if notch is not None:
-        notch.name = "StopNotch"
-        notch.scale = (notch_w, notch_d, notch_h)
-        bpy.ops.object.transform_apply(scale=True)
-        boolean_difference(drawer, notch)
 
 
-def _add_slide_pad_mounts(
-    drawer: "bpy.types.Object",
-    config: DerivedConfig,
-) -> None:
-    """Add mounting slots for replaceable slide pads."""
-    from ..geometry.boolean_ops import boolean_batch_difference
-    
-    width = config.drawer_width
-    depth = config.drawer_depth
-    
+def _build_slide_pad_mounts(
+    width: float,
+    depth: float,
+) -> list:
+    """Build mounting slots for replaceable slide pads (cutters)."""
     # 4-6 pad locations
     pad_w = 8.0
     pad_d = 20.0
     pad_slot_h = 1.2
     
-    positions = [
-        (width * 0.3, depth * 0.25),
-        (width * 0.3, -depth * 0.25),
-        (-width * 0.3, depth * 0.25),
-        (-width * 0.3, -depth * 0.25),
-    ]
-    
-    mounts: list["bpy.types.Object"] = []
-    for i, (x, y) in enumerate(positions):
-        bpy.ops.mesh.primitive_cube_add(
-            size=1,
-            location=(x, y, pad_slot_h / 2)
+    positions = _compute_corner_positions(width * 0.3, depth * 0.25)
+    
+    # Identical cutters: one (cached) mesh, linked duplicates for the rest
+    size = (pad_w + 0.4, pad_d + 0.4, pad_slot_h)
+    first = cached_mesh_object(
+        ("pad_mount",) + size,
+        lambda: create_box(*size),
+        name="PadMount_0",
+        location=(*positions[0], pad_slot_h / 2),
+    )
+    mounts: list["bpy.types.Object"] = [first]
+    for i, (x, y) in enumerate(positions[1:], start=1):
+        mounts.append(
+            linked_duplicate(first, f"PadMount_{i}", (x, y, pad_slot_h / 2))
         )
-        mount = bpy.context.active_object
-        if mount is not None:
-            mount.name = f"PadMount_{i}"
-            mount.scale = (pad_w + 0.4, pad_d + 0.4, pad_slot_h)
-            bpy.ops.object.transform_apply(scale=True)
-            mounts.append(mount)
-    
-    if mounts:
-        boolean_batch_difference(drawer, mounts)
+    
+    return mounts
 
 
-def _add_micro_lip(
-    drawer: "bpy.types.Object",
-    config: DerivedConfig,
-) -> None:
-    """Add micro lip at front to prevent content spillage."""
-    from ..geometry.boolean_ops import boolean_union
-    
-    width = config.drawer_width - 2 * config.wall_thickness
+def _build_micro_lip(
+    width: float,
+    depth: float,
+    height: float,
+    wall: float,
+) -> "bpy.types.Object":
+    """Build micro lip at front to prevent content spillage."""
     lip_height = 1.8
-    lip_thickness = config.wall_thickness
+    lip_thickness = wall
     
-    bpy.ops.mesh.primitive_cube_add(
-        size=1,
+    return create_box(
+        width - 2 * wall, lip_thickness, lip_height,
+        name="MicroLip",
         location=(
             0,
-            -config.drawer_depth / 2 + lip_thickness / 2,
-            config.drawer_height - lip_height / 2
-        )
+            -depth / 2 + lip_thickness / 2,
+            height - lip_height / 2
+        ),
     )
-    lip = bpy.context.active_object
-    if lip is not None:
-        lip.name = "MicroLip"
-        lip.scale = (width, lip_thickness, lip_height)
-        bpy.ops.object.transform_apply(scale=True)
-        boolean_union(drawer, lip)
 
 
-def _add_weep_holes(
-    drawer: "bpy.types.Object",
-    config: DerivedConfig,
-) -> None:
-    """Add drainage holes in corners for cleaning."""
-    from ..geometry.boolean_ops import boolean_batch_difference
-    
-    width = config.drawer_width
-    depth = config.drawer_depth
-    floor = config.floor_thickness
+def _build_weep_holes(
+    width: float,
+    depth: float,
+    floor: float,
+) -> "bpy.types.Object":
+    """
+    Build drainage holes in corners for cleaning (one fused cutter).
     
+    The holes are hidden under the drawer, so an 8-sided prism is
+    enough. All four are tiled into a single mesh, so they cost one
+    boolean instead of four.
+    """
     hole_radius = 1.5
     
-    positions = [
-        (width / 2 - 8, depth / 2 - 8),
-        (width / 2 - 8, -depth / 2 + 8),
-        (-width / 2 + 8, depth / 2 - 8),
-        (-width / 2 + 8, -depth / 2 + 8),
-    ]
-    
-    holes: list["bpy.types.Object"] = []
-    for i, (x, y) in enumerate(positions):
-        bpy.ops.mesh.primitive_cylinder_add(
-            vertices=16,
-            radius=hole_radius,
-            depth=floor + 1,
-            location=(x, y, floor / 2)
-        )
-        hole = bpy.context.active_object
-        if hole is not None:
-            hole.name = f"WeepHole_{i}"
-            holes.append(hole)
-    
-    if holes:
-        boolean_batch_difference(drawer, holes)
+    positions = _compute_corner_positions(width / 2 - 8, depth / 2 - 8)
+    offsets = [(x, y, floor / 2) for x, y in positions]
+    
+    return cached_mesh_object(
+        ("weep_holes", width, depth, floor),
+        lambda: create_mesh_object(
+            "WeepHoles",
+            *tile_mesh_data(
+                *cylinder_mesh_data(
+                    hole_radius, floor + 1, vertices=_WEEP_HOLE_SEGMENTS
+                ),
+                offsets,
+            ),
+        ),
+        name="WeepHoles",
+    )
 
 
+@requires_bpy
 def build_drawer_simple(
     width: float,
     depth: float,
     height: float,
     wall: float = 2.0,
     name: str = "DrawerSimple",
-) -> Optional["bpy.types.Object"]:
+) -> "bpy.types.Object":
     """
     Build simplified drawer without advanced features.
     
@@ -415,25 +396,15 @@ def build_drawer_simple(
     Returns:
         Simple drawer object
     """
-    ensure_bpy()
-    
-    from ..geometry.boolean_ops import boolean_difference
-    
     # Outer box
     drawer = _create_tray(width, depth, height, wall, name)
-    if drawer is None:
-        return None
     
     # Inner cavity
-    bpy.ops.mesh.primitive_cube_add(
-        size=1,
-        location=(0, 0, height / 2 + wall / 2)
+    inner = create_box(
+        width - 2 * wall, depth - 2 * wall, height - wall,
+        name="DrawerCavity",
+        location=(0, 0, height / 2 + wall / 2),
     )
-    inner = bpy.context.active_object
-    if inner is not None:
-        inner.name = "DrawerCavity"
-        inner.scale = (width - 2 * wall, depth - 2 * wall, height - wall)
-        bpy.ops.object.transform_apply(scale=True)
-        boolean_difference(drawer, inner)
+    boolean_difference(drawer, inner)
     
     return drawer
@@ -5,31 +5,35 @@ Handle, label frame, and decorative elements.
 """
 
 import math
+from functools import lru_cache
 from typing import Optional, Tuple
 
 try:
     import bpy
-    import bmesh
+    import numpy as np
     HAS_BPY = True
 except ImportError:
     HAS_BPY = False
 
 from ..config.derived_config import DerivedConfig
 from ..config.design_tokens import DesignTokens
+from ..geometry.boolean_ops import boolean_difference, boolean_union
+from ..geometry.primitives import (
+    cached_mesh_object,
+    create_box,
+    create_cylinder,
+    extrude_profile,
+    requires_bpy,
+)
 
 
-def ensure_bpy():
-    """Check if bpy is available."""
-    if not HAS_BPY:
-        raise RuntimeError("Blender Python API (bpy) not available")
-
-
+@requires_bpy
 def build_front_panel(
     config: DerivedConfig,
     tokens: DesignTokens,
     name: str = "FrontPanel",
     location: Tuple[float, float, float] = (0, 0, 0),
-) -> Optional["bpy.types.Object"]:
+) -> "bpy.types.Object":
     """
     Create front panel with handle and label frame.
     
@@ -49,47 +53,58 @@ def build_front_panel(
     Returns:
         Blender object
     """
-    ensure_bpy()
-    
     width = config.config.width
     height = config.config.height
     thickness = config.front_panel_thickness
     
     # Create base panel
-    bpy.ops.mesh.primitive_cube_add(size=1, location=location)
-    panel = bpy.context.active_object
-    if panel is None:
-        return None
-    
-    panel.name = name
-    panel.scale = (width, thickness, height)
-    bpy.ops.object.transform_apply(scale=True)
-    
-    # Add handle cutout
-    handle = _build_handle(config, tokens)
-    if handle:
-        from ..geometry.boolean_ops import boolean_difference
-        # Position handle at center-top area
-        handle_z = height * 0.3  # 30% from top
-        handle.location = (0, thickness / 2, handle_z)
-        boolean_difference(panel, handle)
+    panel = create_box(width, thickness, height, name=name, location=location)
+    
+    # Add handle cutout (mesh shared by panels with the same handle);
+    # push-latch panels have no handle, so skip the lookup altogether
+    if tokens.handle_profile != "invisible":
+        handle_args = (
+            tokens.handle_profile,
+            tokens.handle_width,
+            tokens.handle_height,
+            tokens.handle_inner_radius,
+            width,
+        )
+        handle = cached_mesh_object(
+            ("handle",) + handle_args, lambda: _build_handle(*handle_args)
+        )
+        if handle:
+            # Position handle at center-top area
+            handle_z = height * 0.3  # 30% from top
+            handle.location = (0, thickness / 2, handle_z)
+            boolean_difference(panel, handle)
     
     # Add label frame
     if config.features_enabled.get("label", False):
-        label = _build_label_frame(config, tokens)
-        if label:
-            from ..geometry.boolean_ops import boolean_difference
-            # Position label above handle
-            label_z = height * 0.55
-            label.location = (0, thickness / 2, label_z)
-            boolean_difference(panel, label)
+        label_args = (
+            tokens.label_frame_style,
+            tokens.label_frame_width,
+            tokens.label_shadow_gap,
+            width,
+            height,
+        )
+        label = cached_mesh_object(
+            ("label",) + label_args, lambda: _build_label_frame(*label_args)
+        )
+        # Position label above handle
+        label_z = height * 0.55
+        label.location = (0, thickness / 2, label_z)
+        boolean_difference(panel, label)
     
     return panel
 
 
 def _build_handle(
-    config: DerivedConfig,
-    tokens: DesignTokens,
+    profile: str,
+    width: float,
+    height: float,
+    inner_radius: float,
+    panel_width: float,
 ) -> Optional["bpy.types.Object"]:
     """
     Create handle cutout based on style.
@@ -102,173 +117,105 @@ def _build_handle(
     - rune_slot: Hexagonal rune shape
     - invisible: No visible handle (push-latch)
     """
-    ensure_bpy()
-    
-    profile = tokens.handle_profile
-    width = tokens.handle_width
-    height = tokens.handle_height
-    inner_radius = tokens.handle_inner_radius
-    
     if profile == "invisible":
         return None
     
-    if profile == "pinch":
-        # Narrow horizontal slot
-        return _build_pinch_handle(width, height, inner_radius)
-    
-    elif profile == "hook":
-        # Bottom hook cutout
-        return _build_hook_handle(width, height, inner_radius)
+    if profile == "hidden_bottom":
+        # Cutout along bottom edge spans most of the panel
+        width = panel_width * 0.6
     
-    elif profile == "hidden_bottom":
-        # Cutout along bottom edge
-        return _build_hidden_bottom_handle(
-            config.config.width * 0.6, height, inner_radius
-        )
-    
-    elif profile == "hidden_hook_rune":
-        # Belovodye: hidden hook with tactile mark
-        return _build_belovodie_handle(width, height, inner_radius)
-    
-    elif profile == "rune_slot":
-        # Hexagonal rune shape
-        return _build_rune_slot_handle(width, height, inner_radius)
-    
-    else:
-        # Default hook style
-        return _build_hook_handle(width, height, inner_radius)
+    # Unknown profiles fall back to the default hook style
+    builder = _HANDLE_BUILDERS.get(profile, _build_hook_handle)
+    return builder(width, height, inner_radius)
 
 
 def _build_pinch_handle(
     width: float,
     height: float,
     inner_radius: float,
-) -> Optional["bpy.types.Object"]:
+) -> "bpy.types.Object":
     """Narrow slot for pinch grip."""
-    ensure_bpy()
-    
-    bm = bmesh.new()
-    
     # Rounded rectangle slot
     half_w = width / 2
     half_h = height / 2
     r = min(inner_radius, half_h)
     
     # Simple rectangle (would add fillet in production)
-    verts = [
-        bm.verts.new((-half_w, 0, -half_h)),
-        bm.verts.new((half_w, 0, -half_h)),
-        bm.verts.new((half_w, 0, half_h)),
-        bm.verts.new((-half_w, 0, half_h)),
+    profile = [
+        (-half_w, -half_h),
+        (half_w, -half_h),
+        (half_w, half_h),
+        (-half_w, half_h),
     ]
-    verts_back = [
-        bm.verts.new((v.co.x, 10, v.co.z)) for v in verts
-    ]
-    
-    bm.faces.new(verts)
-    bm.faces.new(list(reversed(verts_back)))
-    for i in range(4):
-        next_i = (i + 1) % 4
-        bm.faces.new([verts[i], verts[next_i],
-                      verts_back[next_i], verts_back[i]])
-    
-    mesh = bpy.data.meshes.new("PinchHandle")
-    bm.to_mesh(mesh)
-    bm.free()
-    
-    obj = bpy.data.objects.new("PinchHandle", mesh)
-    bpy.context.collection.objects.link(obj)
     
-    return obj
+    return extrude_profile(profile, 10, name="PinchHandle")
 
 
 def _build_hook_handle(
     width: float,
     height: float,
     inner_radius: float,
-) -> Optional["bpy.types.Object"]:
+) -> "bpy.types.Object":
     """Bottom hook for finger catch."""
-    ensure_bpy()
-    
-    bm = bmesh.new()
-    
-    half_w = width / 2
+    profile = _compute_hook_profile_verts(width, height, inner_radius)
+    return extrude_profile(profile, 10, name="HookHandle")
+
+
+# Hook profile (L-shape with rounded inner corner) as coefficient rows:
+# x = X @ (half_w, inner_radius), z = Z @ (height, hook_depth)
+_HOOK_PROFILE_X = (
+    (-1, 0), (1, 0), (1, 0), (1, -1), (1, -1), (-1, 1), (-1, 1), (-1, 0),
+)
+_HOOK_PROFILE_Z = (
+    (0, 0), (0, 0), (-1, 0), (-1, 0), (0, -1), (0, -1), (-1, 0), (-1, 0),
+)
+
+
+@lru_cache(maxsize=32)
+def _compute_hook_profile_verts(
+    width: float,
+    height: float,
+    inner_radius: float,
+) -> "np.ndarray":
+    """(x, z) hook handle profile; pure layout kernel, cached (read-only)."""
     hook_depth = height * 0.6
     
-    # Hook profile: L-shape with rounded inner corner
-    verts = [
-        bm.verts.new((-half_w, 0, 0)),
-        bm.verts.new((half_w, 0, 0)),
-        bm.verts.new((half_w, 0, -height)),
-        bm.verts.new((half_w - inner_radius, 0, -height)),
-        bm.verts.new((half_w - inner_radius, 0, -hook_depth)),
-        bm.verts.new((-half_w + inner_radius, 0, -hook_depth)),
-        bm.verts.new((-half_w + inner_radius, 0, -height)),
-        bm.verts.new((-half_w, 0, -height)),
-    ]
-    
-    verts_back = [
-        bm.verts.new((v.co.x, 10, v.co.z)) for v in verts
-    ]
-    
-    bm.faces.new(verts)
-    bm.faces.new(list(reversed(verts_back)))
-    for i in range(len(verts)):
-        next_i = (i + 1) % len(verts)
-        bm.faces.new([verts[i], verts[next_i],
-                      verts_back[next_i], verts_back[i]])
-    
-    mesh = bpy.data.meshes.new("HookHandle")
-    bm.to_mesh(mesh)
-    bm.free()
-    
-    obj = bpy.data.objects.new("HookHandle", mesh)
-    bpy.context.collection.objects.link(obj)
-    
-    return obj
+    profile = np.column_stack((
+        np.dot(_HOOK_PROFILE_X, (width / 2, inner_radius)),
+        np.dot(_HOOK_PROFILE_Z, (height, hook_depth)),
+    ))
+    profile.setflags(write=False)
+    return profile
 
 
 def _build_hidden_bottom_handle(
     width: float,
     height: float,
     inner_radius: float,
-) -> Optional["bpy.types.Object"]:
+) -> "bpy.types.Object":
     """Invisible cutout along bottom edge."""
-    ensure_bpy()
-    
     # Simple angled cutout at bottom
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    obj = bpy.context.active_object
-    if obj is not None:
-        obj.name = "HiddenBottomHandle"
-        obj.scale = (width, 10, height)
-        bpy.ops.object.transform_apply(scale=True)
-    
-    return obj
+    return create_box(width, 10, height, name="HiddenBottomHandle")
 
 
 def _build_belovodie_handle(
     width: float,
     height: float,
     inner_radius: float,
-) -> Optional["bpy.types.Object"]:
+) -> "bpy.types.Object":
     """Belovodye hidden hook with tactile center mark."""
-    ensure_bpy()
-    
     # Hook cutout + small tactile dot
     handle = _build_hook_handle(width, height, inner_radius)
     
     # Add tactile mark (small cylinder emboss)
-    bpy.ops.mesh.primitive_cylinder_add(
+    mark = create_cylinder(
+        1.5, 0.3,
         vertices=16,
-        radius=1.5,
-        depth=0.3,
+        name="TactileMark",
         location=(0, 0, -height * 0.3),
     )
-    mark = bpy.context.active_object
     
     if handle and mark:
-        from ..geometry.boolean_ops import boolean_union
         boolean_union(handle, mark)
     
     return handle
@@ -278,51 +225,42 @@ def _build_rune_slot_handle(
     width: float,
     height: float,
     inner_radius: float,
-) -> Optional["bpy.types.Object"]:
+) -> "bpy.types.Object":
     """Hexagonal rune-shaped slot."""
-    ensure_bpy()
-    
-    bm = bmesh.new()
-    
     # Hexagonal profile
     half_w = width / 2
     half_h = height / 2
     inset = height * 0.3
     
-    verts = [
-        bm.verts.new((-half_w + inset, 0, half_h)),
-        bm.verts.new((half_w - inset, 0, half_h)),
-        bm.verts.new((half_w, 0, 0)),
-        bm.verts.new((half_w - inset, 0, -half_h)),
-        bm.verts.new((-half_w + inset, 0, -half_h)),
-        bm.verts.new((-half_w, 0, 0)),
+    profile = [
+        (-half_w + inset, half_h),
+        (half_w - inset, half_h),
+        (half_w, 0),
+        (half_w - inset, -half_h),
+        (-half_w + inset, -half_h),
+        (-half_w, 0),
     ]
     
-    verts_back = [
-        bm.verts.new((v.co.x, 10, v.co.z)) for v in verts
-    ]
-    
-    bm.faces.new(verts)
-    bm.faces.new(list(reversed(verts_back)))
-    for i in range(6):
-        next_i = (i + 1) % 6
-        bm.faces.new([verts[i], verts[next_i],
-                      verts_back[next_i], verts_back[i]])
-    
-    mesh = bpy.data.meshes.new("RuneSlotHandle")
-    bm.to_mesh(mesh)
-    bm.free()
-    
-    obj = bpy.data.objects.new("RuneSlotHandle", mesh)
-    bpy.context.collection.objects.link(obj)
-    
-    return obj
+    return extrude_profile(profile, 10, name="RuneSlotHandle")
+
+
+# Handle profile -> builder(width, height, inner_radius)
+_HANDLE_BUILDERS = {
+    "pinch": _build_pinch_handle,
+    "hook": _build_hook_handle,
+    "hidden_bottom": _build_hidden_bottom_handle,
+    "hidden_hook_rune": _build_belovodie_handle,
+    "rune_slot": _build_rune_slot_handle,
+}
 
 
 def _build_label_frame(
-    config: DerivedConfig,
-    tokens: DesignTokens,
-) -> Optional["bpy.types.Object"]:
+    style: str,
+    frame_width: float,
+    shadow_gap: float,
+    panel_width: float,
+    panel_height: float,
+) -> "bpy.types.Object":
     """
     Create label frame based on style.
     
@@ -332,29 +270,23 @@ def _build_label_frame(
     - recessed: Inset into panel
     - recessed_portal: Belovodye style with top/bottom breaks
     """
-    ensure_bpy()
-    
-    style = tokens.label_frame_style
-    frame_width = tokens.label_frame_width
-    
     # Label dimensions (60% of panel width)
-    label_width = config.config.width * 0.5
-    label_height = config.config.height * 0.15
+    label_width = panel_width * 0.5
+    label_height = panel_height * 0.15
     
-    if style == "recessed_portal":
-        return _build_portal_label(
-            label_width, label_height, frame_width,
-            tokens.label_shadow_gap
-        )
-    else:
-        # Simple rectangular frame
-        bpy.ops.mesh.primitive_cube_add(size=1)
-        obj = bpy.context.active_object
-        if obj is not None:
-            obj.name = "LabelFrame"
-            obj.scale = (label_width, 10, label_height)
-            bpy.ops.object.transform_apply(scale=True)
-        return obj
+    # Styles without a dedicated builder get a simple rectangular frame
+    builder = _LABEL_BUILDERS.get(style, _build_simple_label)
+    return builder(label_width, label_height, frame_width, shadow_gap)
+
+
+def _build_simple_label(
+    width: float,
+    height: float,
+    frame_width: float,
+    shadow_gap: float,
+) -> "bpy.types.Object":
+    """Simple rectangular label frame."""
+    return create_box(width, 10, height, name="LabelFrame")
 
 
 def _build_portal_label(
@@ -362,59 +294,49 @@ def _build_portal_label(
     height: float,
     frame_width: float,
     shadow_gap: float,
-) -> Optional["bpy.types.Object"]:
+) -> "bpy.types.Object":
     """Belovodye 'portal' style label frame with top/bottom breaks."""
-    ensure_bpy()
-    
-    bm = bmesh.new()
-    
-    half_w = width / 2
-    half_h = height / 2
+    profile = _compute_portal_profile_verts(width, height, frame_width)
+    return extrude_profile(profile, 5, name="PortalLabel")
+
+
+# Label frame style -> builder(width, height, frame_width, shadow_gap)
+_LABEL_BUILDERS = {
+    "recessed_portal": _build_portal_label,
+}
+
+
+# Portal frame profile (rectangle with top/bottom insets), counter-
+# clockwise from bottom left: x = X @ (half_w, break_width),
+# z = Z @ (half_h, frame_width)
+_PORTAL_PROFILE_X = (
+    (-1, 0), (0, -1), (0, -1), (0, 1), (0, 1), (1, 0),
+    (1, 0), (0, 1), (0, 1), (0, -1), (0, -1), (-1, 0),
+)
+_PORTAL_PROFILE_Z = (
+    (-1, 0), (-1, 0), (-1, -1), (-1, -1), (-1, 0), (-1, 0),
+    (1, 0), (1, 0), (1, 1), (1, 1), (1, 0), (1, 0),
+)
+
+
+@lru_cache(maxsize=32)
+def _compute_portal_profile_verts(
+    width: float,
+    height: float,
+    frame_width: float,
+) -> "np.ndarray":
+    """(x, z) portal label profile; pure layout kernel, cached (read-only)."""
     break_width = width * 0.2  # 20% breaks at top/bottom
     
-    # Portal frame profile (rectangle with top/bottom insets)
-    verts = [
-        # Bottom left
-        bm.verts.new((-half_w, 0, -half_h)),
-        # Bottom center left
-        bm.verts.new((-break_width, 0, -half_h)),
-        bm.verts.new((-break_width, 0, -half_h - frame_width)),
-        bm.verts.new((break_width, 0, -half_h - frame_width)),
-        bm.verts.new((break_width, 0, -half_h)),
-        # Bottom right
-        bm.verts.new((half_w, 0, -half_h)),
-        # Top right
-        bm.verts.new((half_w, 0, half_h)),
-        # Top center right
-        bm.verts.new((break_width, 0, half_h)),
-        bm.verts.new((break_width, 0, half_h + frame_width)),
-        bm.verts.new((-break_width, 0, half_h + frame_width)),
-        bm.verts.new((-break_width, 0, half_h)),
-        # Top left
-        bm.verts.new((-half_w, 0, half_h)),
-    ]
-    
-    verts_back = [
-        bm.verts.new((v.co.x, 5, v.co.z)) for v in verts
-    ]
-    
-    bm.faces.new(verts)
-    bm.faces.new(list(reversed(verts_back)))
-    for i in range(len(verts)):
-        next_i = (i + 1) % len(verts)
-        bm.faces.new([verts[i], verts[next_i],
-                      verts_back[next_i], verts_back[i]])
-    
-    mesh = bpy.data.meshes.new("PortalLabel")
-    bm.to_mesh(mesh)
-    bm.free()
-    
-    obj = bpy.data.objects.new("PortalLabel", mesh)
-    bpy.context.collection.objects.link(obj)
-    
-    return obj
+    profile = np.column_stack((
+        np.dot(_PORTAL_PROFILE_X, (width / 2, break_width)),
+        np.dot(_PORTAL_PROFILE_Z, (height / 2, frame_width)),
+    ))
+    profile.setflags(write=False)
+    return profile
 
 
+@requires_bpy
 def build_stiffening_ribs(
     config: DerivedConfig,
     name: str = "StiffeningRibs",
@@ -432,32 +354,19 @@ def build_stiffening_ribs(
     Returns:
         List of rib objects
     """
-    ensure_bpy()
-    
     width = config.config.width
     height = config.config.height
     
     rib_height = 3.0
     rib_thickness = 1.2
     
-    ribs: list = []
-    
-    # Horizontal rib
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    h_rib = bpy.context.active_object
-    if h_rib is not None:
-        h_rib.name = f"{name}_H"
-        h_rib.scale = (width * 0.8, rib_thickness, rib_height)
-        bpy.ops.object.transform_apply(scale=True)
-        ribs.append(h_rib)
-    
-    # Vertical rib
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    v_rib = bpy.context.active_object
-    if v_rib is not None:
-        v_rib.name = f"{name}_V"
-        v_rib.scale = (rib_thickness, rib_height, height * 0.6)
-        bpy.ops.object.transform_apply(scale=True)
-        ribs.append(v_rib)
-    
-    return ribs
+    return [
+        # Horizontal rib
+        create_box(
+            width * 0.8, rib_thickness, rib_height, name=f"{name}_H"
+        ),
+        # Vertical rib
+        create_box(
+            rib_thickness, rib_height, height * 0.6, name=f"{name}_V"
+        ),
+    ]
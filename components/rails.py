@@ -4,25 +4,33 @@ Rail System for Storage Box.
 V-profile rails with self-centering, dust labyrinth, and service channel.
 """
 
-import math
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Sequence, Tuple
 
 try:
     import bpy
-    import bmesh
+    import numpy as np
     HAS_BPY = True
 except ImportError:
     HAS_BPY = False
 
 from ..config.derived_config import DerivedConfig
+from ..geometry.boolean_ops import boolean_difference
+from ..geometry.primitives import (
+    box_mesh_data,
+    cached_mesh_object,
+    cone_mesh_data,
+    create_box,
+    create_mesh_object,
+    extrude_profile,
+    prism_faces,
+    requires_bpy,
+    tile_mesh_data,
+    v_half_tan,
+)
 
 
-def ensure_bpy():
-    """Check if bpy is available."""
-    if not HAS_BPY:
-        raise RuntimeError("Blender Python API (bpy) not available")
-
-
+@requires_bpy
 def build_v_rail(
     length: float,
     width: float = 5.0,
@@ -30,7 +38,7 @@ def build_v_rail(
     angle: float = 45.0,
     name: str = "VRail",
     location: Tuple[float, float, float] = (0, 0, 0),
-) -> Optional["bpy.types.Object"]:
+) -> "bpy.types.Object":
     """
     Create a V-profile rail for self-centering drawer slides.
     
@@ -50,62 +58,37 @@ def build_v_rail(
     Returns:
         Blender object
     """
-    ensure_bpy()
-    
-    bm = bmesh.new()
+    profile = _compute_v_rail_profile(width, depth, angle)
+    return extrude_profile(profile, length, name=name, location=location)
+
+
+@lru_cache(maxsize=32)
+def _compute_v_rail_profile(
+    width: float,
+    depth: float,
+    angle: float,
+) -> "np.ndarray":
+    """
+    (x, z) V-rail profile; pure layout kernel, cached (read-only).
     
-    # V profile geometry
+    Outward-pointing V (rail on shell), listed in the winding
+    extrude_profile expects.
+    """
     half_width = width / 2
-    rad = math.radians(angle / 2)
-    v_depth = half_width * math.tan(rad)
-    
-    # Profile: front face (looking from -Y)
-    # Creates outward-pointing V (rail on shell)
-    verts_front = [
-        bm.verts.new((-half_width, 0, 0)),           # Left base
-        bm.verts.new((0, 0, -v_depth)),              # V point (down)
-        bm.verts.new((half_width, 0, 0)),            # Right base
-        bm.verts.new((half_width, 0, depth)),        # Right top
-        bm.verts.new((-half_width, 0, depth)),       # Left top
-    ]
-    
-    # Profile: back face
-    verts_back = [
-        bm.verts.new((-half_width, length, 0)),
-        bm.verts.new((0, length, -v_depth)),
-        bm.verts.new((half_width, length, 0)),
-        bm.verts.new((half_width, length, depth)),
-        bm.verts.new((-half_width, length, depth)),
-    ]
-    
-    # Create faces
-    # Front face
-    bm.faces.new([verts_front[4], verts_front[3], 
-                  verts_front[2], verts_front[1], verts_front[0]])
-    # Back face
-    bm.faces.new([verts_back[0], verts_back[1], 
-                  verts_back[2], verts_back[3], verts_back[4]])
-    
-    # Side faces
-    for i in range(5):
-        next_i = (i + 1) % 5
-        bm.faces.new([
-            verts_front[i], verts_front[next_i],
-            verts_back[next_i], verts_back[i]
-        ])
-    
-    # Create mesh
-    mesh = bpy.data.meshes.new(name)
-    bm.to_mesh(mesh)
-    bm.free()
-    
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
-    obj.location = location
-    
-    return obj
+    v_depth = half_width * v_half_tan(angle)
+    
+    profile = np.array([
+        (-half_width, depth),        # Left top
+        (half_width, depth),         # Right top
+        (half_width, 0),             # Right base
+        (0, -v_depth),               # V point (down)
+        (-half_width, 0),            # Left base
+    ], dtype=np.float32)
+    profile.setflags(write=False)
+    return profile
 
 
+@requires_bpy
 def build_v_groove(
     length: float,
     width: float = 5.0,
@@ -114,7 +97,7 @@ def build_v_groove(
     clearance: float = 0.3,
     name: str = "VGroove",
     location: Tuple[float, float, float] = (0, 0, 0),
-) -> Optional["bpy.types.Object"]:
+) -> "bpy.types.Object":
     """
     Create V-groove (matching groove for V-rail) on drawer side.
     
@@ -130,66 +113,59 @@ def build_v_groove(
     Returns:
         Blender object (for boolean subtraction)
     """
-    ensure_bpy()
-    
+    # Both drawer sides and every drawer of a size share one groove mesh
+    return cached_mesh_object(
+        ("v_groove", length, width, depth, angle, clearance),
+        lambda: _create_v_groove(length, width, depth, angle, clearance, name),
+        name=name,
+        location=location,
+    )
+
+
+def _create_v_groove(
+    length: float,
+    width: float,
+    depth: float,
+    angle: float,
+    clearance: float,
+    name: str,
+) -> "bpy.types.Object":
+    """Build the V-groove mesh object at the origin (see build_v_groove)."""
+    profile = _compute_v_groove_profile(width, depth, angle, clearance)
+    return extrude_profile(profile, length, name=name)
+
+
+@lru_cache(maxsize=32)
+def _compute_v_groove_profile(
+    width: float,
+    depth: float,
+    angle: float,
+    clearance: float,
+) -> "np.ndarray":
+    """(x, z) V-groove profile; pure layout kernel, cached (read-only)."""
     # Groove is slightly larger than rail for clearance
-    effective_width = width + clearance
-    
-    bm = bmesh.new()
-    
-    half_width = effective_width / 2
-    rad = math.radians(angle / 2)
-    v_depth = half_width * math.tan(rad) + clearance
-    
-    # V-groove profile (inverted V - pointing up)
-    verts_front = [
-        bm.verts.new((-half_width, 0, -depth)),     # Left bottom
-        bm.verts.new((-half_width, 0, 0)),          # Left top
-        bm.verts.new((0, 0, v_depth)),              # V point (up)
-        bm.verts.new((half_width, 0, 0)),           # Right top
-        bm.verts.new((half_width, 0, -depth)),      # Right bottom
-    ]
-    
-    verts_back = [
-        bm.verts.new((-half_width, length, -depth)),
-        bm.verts.new((-half_width, length, 0)),
-        bm.verts.new((0, length, v_depth)),
-        bm.verts.new((half_width, length, 0)),
-        bm.verts.new((half_width, length, -depth)),
-    ]
-    
-    # Front face
-    bm.faces.new([verts_front[0], verts_front[1], verts_front[2],
-                  verts_front[3], verts_front[4]])
-    # Back face
-    bm.faces.new([verts_back[4], verts_back[3], verts_back[2],
-                  verts_back[1], verts_back[0]])
-    
-    # Side faces
-    for i in range(5):
-        next_i = (i + 1) % 5
-        bm.faces.new([
-            verts_front[i], verts_back[i],
-            verts_back[next_i], verts_front[next_i]
-        ])
-    
-    mesh = bpy.data.meshes.new(name)
-    bm.to_mesh(mesh)
-    bm.free()
-    
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
-    obj.location = location
-    
-    return obj
+    half_width = (width + clearance) / 2
+    v_depth = half_width * v_half_tan(angle) + clearance
+    
+    # Inverted V - pointing up
+    profile = np.array([
+        (-half_width, -depth),      # Left bottom
+        (-half_width, 0),           # Left top
+        (0, v_depth),               # V point (up)
+        (half_width, 0),            # Right top
+        (half_width, -depth),       # Right bottom
+    ], dtype=np.float32)
+    profile.setflags(write=False)
+    return profile
 
 
+@requires_bpy
 def build_rail_with_dust_lip(
     length: float,
     config: DerivedConfig,
     name: str = "RailWithDustLip",
     location: Tuple[float, float, float] = (0, 0, 0),
-) -> Optional["bpy.types.Object"]:
+) -> "bpy.types.Object":
     """
     Create V-rail with integrated dust labyrinth.
     
@@ -207,69 +183,56 @@ def build_rail_with_dust_lip(
     Returns:
         Blender object
     """
-    ensure_bpy()
-    
-    bm = bmesh.new()
-    
-    rail_width = config.RAIL_WIDTH
-    rail_depth = config.RAIL_DEPTH
-    dust_lip = config.DUST_LIP
+    profile = _compute_dust_lip_profile(
+        config.RAIL_WIDTH,
+        config.RAIL_DEPTH,
+        config.DUST_LIP,
+        config.V_TAN_HALF,
+    )
+    return extrude_profile(profile, length, name=name, location=location)
+
+
+@lru_cache(maxsize=32)
+def _compute_dust_lip_profile(
+    rail_width: float,
+    rail_depth: float,
+    dust_lip: float,
+    tan_half: float,
+) -> "np.ndarray":
+    """
+    (x, z) V-rail profile with overhanging dust lip.
     
+    Pure layout kernel, cached (read-only). Points run from the left
+    top around to the left base, the winding extrude_profile expects.
+    ``tan_half`` is tan(V angle / 2), see DerivedConfig.V_TAN_HALF.
+    """
     half_width = rail_width / 2
-    rad = math.radians(45 / 2)
-    v_depth = half_width * math.tan(rad)
-    
-    # Profile with dust lip extension
-    # Main V-rail + overhanging lip
+    v_depth = half_width * tan_half
     lip_extension = 1.5  # Lip extends past rail
-    
-    verts_front = [
-        # V-rail portion
-        bm.verts.new((-half_width, 0, 0)),
-        bm.verts.new((0, 0, -v_depth)),
-        bm.verts.new((half_width, 0, 0)),
+    lip_bottom = rail_depth - dust_lip
+    
+    profile = np.array([
+        # Origin side lip
+        (-half_width, rail_depth),
+        (-half_width - lip_extension, rail_depth),
+        (-half_width - lip_extension, lip_bottom),
+        (-half_width, lip_bottom),
+        # Across to the far side lip (overhanging)
+        (half_width, lip_bottom),
+        (half_width + lip_extension, lip_bottom),
+        (half_width + lip_extension, rail_depth),
         # Top portion
-        bm.verts.new((half_width, 0, rail_depth)),
-        # Dust lip (overhanging)
-        bm.verts.new((half_width + lip_extension, 0, rail_depth)),
-        bm.verts.new((half_width + lip_extension, 0, rail_depth - dust_lip)),
-        bm.verts.new((half_width, 0, rail_depth - dust_lip)),
-        # Back to origin side
-        bm.verts.new((-half_width, 0, rail_depth - dust_lip)),
-        bm.verts.new((-half_width - lip_extension, 0, rail_depth - dust_lip)),
-        bm.verts.new((-half_width - lip_extension, 0, rail_depth)),
-        bm.verts.new((-half_width, 0, rail_depth)),
-    ]
-    
-    verts_back = []
-    for v in verts_front:
-        verts_back.append(bm.verts.new((v.co.x, length, v.co.z)))
-    
-    # Front face
-    bm.faces.new(list(reversed(verts_front)))
-    # Back face
-    bm.faces.new(verts_back)
-    
-    # Side faces
-    n = len(verts_front)
-    for i in range(n):
-        next_i = (i + 1) % n
-        bm.faces.new([
-            verts_front[i], verts_front[next_i],
-            verts_back[next_i], verts_back[i]
-        ])
-    
-    mesh = bpy.data.meshes.new(name)
-    bm.to_mesh(mesh)
-    bm.free()
-    
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
-    obj.location = location
-    
-    return obj
+        (half_width, rail_depth),
+        # V-rail portion
+        (half_width, 0),
+        (0, -v_depth),
+        (-half_width, 0),
+    ], dtype=np.float32)
+    profile.setflags(write=False)
+    return profile
 
 
+@requires_bpy
 def build_rail_windows(
     rail_obj: "bpy.types.Object",
     length: float,
@@ -288,42 +251,43 @@ def build_rail_windows(
     Returns:
         Modified rail object
     """
-    ensure_bpy()
-    
-    from ..geometry.boolean_ops import boolean_batch_difference
-    from ..geometry.primitives import create_box
-    
+    rail_depth = config.RAIL_DEPTH
     window_spacing = config.RAIL_WINDOW_SPACING
     window_width = 8.0
     window_depth = 3.0
-    window_height = config.RAIL_DEPTH - 1.0
-    
-    windows: list["bpy.types.Object"] = []
-    y_pos = window_spacing / 2
+    window_height = rail_depth - 1.0
     
-    while y_pos < length - window_spacing / 2:
-        window = create_box(
-            window_width, window_depth, window_height,
-            name=f"RailWindow_{len(windows)}",
-            location=(0, y_pos, config.RAIL_DEPTH / 2)
-        )
-        if window is not None:
-            windows.append(window)
-        y_pos += window_spacing
-    
-    if windows:
-        boolean_batch_difference(rail_obj, windows)
+    # Windows every window_spacing, starting half a spacing in
+    y_positions = np.arange(
+        window_spacing / 2, length - window_spacing / 2, window_spacing
+    )
+    if len(y_positions) == 0:
+        return rail_obj
+    
+    # All windows as one mesh, cut in a single boolean
+    offsets = np.zeros((len(y_positions), 3), dtype=np.float32)
+    offsets[:, 1] = y_positions
+    offsets[:, 2] = rail_depth / 2
+    windows = create_mesh_object(
+        "RailWindows",
+        *tile_mesh_data(
+            *box_mesh_data(window_width, window_depth, window_height),
+            offsets,
+        ),
+    )
+    boolean_difference(rail_obj, windows)
     
     return rail_obj
 
 
+@requires_bpy
 def build_lead_in_zone(
     length: float,
     width: float,
     config: DerivedConfig,
     name: str = "LeadIn",
     location: Tuple[float, float, float] = (0, 0, 0),
-) -> Optional["bpy.types.Object"]:
+) -> "bpy.types.Object":
     """
     Create lead-in zone for anti-jam entry.
     
@@ -342,58 +306,35 @@ def build_lead_in_zone(
     Returns:
         Blender object
     """
-    ensure_bpy()
-    
-    bm = bmesh.new()
-    
     half_width = width / 2
     lead_in_extra = config.lead_in_tolerance
     entry_width = half_width + lead_in_extra
+    rail_depth = config.RAIL_DEPTH
     
-    # Tapered entry profile
-    verts_front = [
-        bm.verts.new((-entry_width, 0, 0)),
-        bm.verts.new((entry_width, 0, 0)),
-        bm.verts.new((entry_width, 0, config.RAIL_DEPTH)),
-        bm.verts.new((-entry_width, 0, config.RAIL_DEPTH)),
-    ]
-    
-    verts_back = [
-        bm.verts.new((-half_width, length, 0)),
-        bm.verts.new((half_width, length, 0)),
-        bm.verts.new((half_width, length, config.RAIL_DEPTH)),
-        bm.verts.new((-half_width, length, config.RAIL_DEPTH)),
-    ]
-    
-    # Faces
-    bm.faces.new(verts_front)
-    bm.faces.new(list(reversed(verts_back)))
-    
-    for i in range(4):
-        next_i = (i + 1) % 4
-        bm.faces.new([
-            verts_front[i], verts_front[next_i],
-            verts_back[next_i], verts_back[i]
-        ])
-    
-    mesh = bpy.data.meshes.new(name)
-    bm.to_mesh(mesh)
-    bm.free()
-    
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
-    obj.location = location
-    
-    return obj
+    # Tapered entry profile: wide at the front (Y=0), rail width at
+    # the back, listed in the winding prism_faces expects
+    verts = np.array([
+        (-entry_width, 0, rail_depth),
+        (entry_width, 0, rail_depth),
+        (entry_width, 0, 0),
+        (-entry_width, 0, 0),
+        (-half_width, length, rail_depth),
+        (half_width, length, rail_depth),
+        (half_width, length, 0),
+        (-half_width, length, 0),
+    ], dtype=np.float32)
+    
+    return create_mesh_object(name, verts, prism_faces(4), location)
 
 
+@requires_bpy
 def build_guide_cone(
     height: float = 1.5,
     base_radius: float = 2.0,
     angle: float = 30.0,
     name: str = "GuideCone",
     location: Tuple[float, float, float] = (0, 0, 0),
-) -> Optional["bpy.types.Object"]:
+) -> "bpy.types.Object":
     """
     Create micro guide cone for auto-alignment.
     
@@ -410,29 +351,49 @@ def build_guide_cone(
     Returns:
         Blender object
     """
-    ensure_bpy()
+    verts, faces = cone_mesh_data(base_radius, 0.2, height, vertices=16)
+    return create_mesh_object(name, verts, faces, location)
+
+
+@requires_bpy
+def build_guide_cones(
+    offsets: Sequence[Tuple[float, float, float]],
+    height: float = 1.5,
+    base_radius: float = 2.0,
+    name: str = "GuideCones",
+    location: Tuple[float, float, float] = (0, 0, 0),
+) -> "bpy.types.Object":
+    """
+    Create a set of guide cones as one object.
     
-    bpy.ops.mesh.primitive_cone_add(
-        vertices=16,
-        radius1=base_radius,
-        radius2=0.2,
-        depth=height,
-        location=location,
-    )
-    obj = bpy.context.active_object
-    if obj is not None:
-        obj.name = name
+    The cones of a rail entry are unioned together, so they are
+    emitted as one mesh and cost a single boolean operand.
     
-    return obj
+    Args:
+        offsets: Cone base centres relative to location
+        height: Cone height
+        base_radius: Cone base radius
+        name: Object name
+        location: Object location
+    
+    Returns:
+        Blender object
+    """
+    verts, faces = tile_mesh_data(
+        *cone_mesh_data(base_radius, 0.2, height, vertices=16),
+        offsets,
+    )
+    return create_mesh_object(name, verts, faces, location)
 
 
+@requires_bpy
 def build_service_channel(
     length: float,
     channel_width: float = 2.0,
     channel_height: float = 4.0,
     name: str = "ServiceChannel",
     location: Tuple[float, float, float] = (0, 0, 0),
-) -> Optional["bpy.types.Object"]:
+) -> "bpy.types.Object":
     """
     Create service channel for dusty mode (blowout port).
     
@@ -449,13 +410,8 @@ def build_service_channel(
     Returns:
         Blender object (for boolean subtraction)
     """
-    ensure_bpy()
-    
-    bpy.ops.mesh.primitive_cube_add(size=1, location=location)
-    obj = bpy.context.active_object
-    if obj is not None:
-        obj.name = name
-        obj.scale = (channel_width, length, channel_height)
-        bpy.ops.object.transform_apply(scale=True)
-    
-    return obj
+    return create_box(
+        channel_width, length, channel_height,
+        name=name,
+        location=location,
+    )
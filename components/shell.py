@@ -4,7 +4,7 @@ Shell Component for Storage Box.
 Main outer container with rails, connections, and dust labyrinth.
 """
 
-from typing import Optional, Tuple
+from typing import Tuple
 
 try:
     import bpy
@@ -15,19 +15,34 @@ except ImportError:
 from ..config.derived_config import DerivedConfig
 from ..config.design_tokens import DesignTokens
 from ..config.enums import ConnectionType
+from ..geometry.boolean_ops import (
+    boolean_compose,
+    boolean_difference,
+)
+from ..geometry.primitives import (
+    cached_mesh_object,
+    create_box,
+    create_mesh_object,
+    cylinder_mesh_data,
+    linked_duplicate,
+    requires_bpy,
+    tile_mesh_data,
+)
+from .connections import build_connection_set
+from .rails import (
+    build_guide_cones,
+    build_rail_with_dust_lip,
+    build_rail_windows,
+    build_service_channel,
+)
 
 
-def ensure_bpy():
-    """Check if bpy is available."""
-    if not HAS_BPY:
-        raise RuntimeError("Blender Python API (bpy) not available")
-
-
+@requires_bpy
 def build_shell(
     config: DerivedConfig,
     tokens: DesignTokens,
     name: str = "Shell",
-) -> Optional["bpy.types.Object"]:
+) -> "bpy.types.Object":
     """
     Build complete shell with all features.
     
@@ -50,21 +65,6 @@ def build_shell(
     Returns:
         Complete shell object
     """
-    ensure_bpy()
-    
-    from ..geometry.boolean_ops import (
-        boolean_difference,
-        boolean_union,
-        boolean_batch_difference,
-    )
-    from .rails import (
-        build_rail_with_dust_lip,
-        build_rail_windows,
-        build_guide_cone,
-        build_service_channel,
-    )
-    from .connections import build_connection_set
-    
     width = config.config.width
     depth = config.config.depth
     height = config.config.height
@@ -73,8 +73,12 @@ def build_shell(
     
     # Step 1: Create outer shell box
     shell = _create_outer_box(width, depth, height, name)
-    if shell is None:
-        return None
+    
+    # Cutters and additive parts are collected and applied in one
+    # composition below; the additive parts sit inside the cavity
+    # or on the outer faces, clear of every cutter
+    cutters: list["bpy.types.Object"] = []
+    unions: list["bpy.types.Object"] = []
     
     # Step 2: Create inner cavity
     inner = _create_inner_cavity(
@@ -83,34 +87,37 @@ def build_shell(
         height - floor,
         config
     )
-    if inner:
-        inner.location = (0, 0, floor / 2)
-        boolean_difference(shell, inner)
-    
-    # Step 3: Add V-rails on sides
-    rail_left = build_rail_with_dust_lip(
-        depth - 2 * wall,
-        config,
+    inner.location = (0, 0, floor / 2)
+    cutters.append(inner)
+    
+    # Step 3: Add V-rails (with windows) on sides. The dust-lip profile
+    # is symmetric in X, so the right rail is the left rail's mesh at
+    # the mirrored position; no flipped transform is needed.
+    rail_length = depth - 2 * wall
+    rail_x = width / 2 - wall - config.RAIL_WIDTH / 2
+    rail_left = cached_mesh_object(
+        (
+            "shell_rail",
+            rail_length,
+            config.RAIL_WIDTH,
+            config.RAIL_DEPTH,
+            config.DUST_LIP,
+            config.RAIL_WINDOW_SPACING,
+        ),
+        lambda: _build_windowed_rail(rail_length, config),
         name="RailLeft",
-        location=(-width / 2 + wall + config.RAIL_WIDTH / 2, -depth / 2 + wall, 0)
+        location=(-rail_x, -depth / 2 + wall, 0),
     )
-    rail_right = build_rail_with_dust_lip(
-        depth - 2 * wall,
-        config,
-        name="RailRight",
-        location=(width / 2 - wall - config.RAIL_WIDTH / 2, -depth / 2 + wall, 0)
+    rail_right = linked_duplicate(
+        rail_left,
+        "RailRight",
+        location=(rail_x, -depth / 2 + wall, 0),
     )
-    
-    if rail_left:
-        build_rail_windows(rail_left, depth - 2 * wall, config)
-        boolean_union(shell, rail_left)
-    if rail_right:
-        build_rail_windows(rail_right, depth - 2 * wall, config)
-        boolean_union(shell, rail_right)
+    unions.extend((rail_left, rail_right))
     
     # Step 4: Add guide cones at rail entry
     if config.features_enabled.get("guide_cones", True):
-        _add_guide_cones(shell, config)
+        unions.extend(_build_guide_cones(config))
     
     # Step 5: Add service channel (dusty mode)
     if config.features_enabled.get("service_channel", False):
@@ -119,8 +126,7 @@ def build_shell(
             name="ServiceChannel",
             location=(0, 0, floor / 2)
         )
-        if channel:
-            boolean_difference(shell, channel)
+        cutters.append(channel)
     
     # Step 6: Add connections (top surface)
     top_connections = build_connection_set(config, is_top=True)
@@ -130,23 +136,22 @@ def build_shell(
             conn.location[1],
             height - 2
         )
-        boolean_union(shell, conn)
+        unions.append(conn)
     
     # Step 7: Add connection pockets (bottom surface)
     bottom_connections = build_connection_set(config, is_top=False)
-    cutouts: list["bpy.types.Object"] = []
     for conn in bottom_connections:
         conn.location = (conn.location[0], conn.location[1], 0)
-        cutouts.append(conn)
-    if cutouts:
-        boolean_batch_difference(shell, cutouts)
+        cutters.append(conn)
     
     # Step 8: Add smart cartridge bay
     if config.features_enabled.get("smart_cartridge", False):
-        _add_smart_cartridge_bay(shell, config)
+        cutters.append(_build_cartridge_bay(config))
     
     # Step 9: Add micro-feet
-    _add_micro_feet(shell, config)
+    unions.extend(_build_micro_feet(config))
+    
+    boolean_compose(shell, cutters, unions)
     
     # Step 10: Apply style-specific features
     _apply_style_features(shell, config, tokens)
@@ -159,21 +164,13 @@ def _create_outer_box(
     depth: float,
     height: float,
     name: str,
-) -> Optional["bpy.types.Object"]:
+) -> "bpy.types.Object":
     """Create basic outer shell box."""
-    ensure_bpy()
-    
-    bpy.ops.mesh.primitive_cube_add(
-        size=1,
-        location=(0, 0, height / 2)
+    return create_box(
+        width, depth, height,
+        name=name,
+        location=(0, 0, height / 2),
     )
-    obj = bpy.context.active_object
-    if obj is not None:
-        obj.name = name
-        obj.scale = (width, depth, height)
-        bpy.ops.object.transform_apply(scale=True)
-    
-    return obj
 
 
 def _create_inner_cavity(
@@ -181,63 +178,57 @@ def _create_inner_cavity(
     depth: float,
     height: float,
     config: DerivedConfig,
-) -> Optional["bpy.types.Object"]:
+) -> "bpy.types.Object":
     """Create inner cavity for drawer space."""
-    ensure_bpy()
-    
-    bpy.ops.mesh.primitive_cube_add(
-        size=1,
-        location=(0, 0, height / 2)
+    return create_box(
+        width, depth, height,
+        name="InnerCavity",
+        location=(0, 0, height / 2),
     )
-    obj = bpy.context.active_object
-    if obj is not None:
-        obj.name = "InnerCavity"
-        obj.scale = (width, depth, height)
-        bpy.ops.object.transform_apply(scale=True)
-    
-    return obj
 
 
-def _add_guide_cones(
-    shell: "bpy.types.Object",
+def _build_windowed_rail(
+    length: float,
     config: DerivedConfig,
-) -> None:
-    """Add guide cones at rail entry for auto-alignment."""
-    from .rails import build_guide_cone
-    from ..geometry.boolean_ops import boolean_union
+) -> "bpy.types.Object":
+    """Dust-lip rail with its ventilation windows cut, at the origin."""
+    rail = build_rail_with_dust_lip(length, config)
+    build_rail_windows(rail, length, config)
+    return rail
+
+
+def _build_guide_cones(config: DerivedConfig) -> list:
+    """Build guide cones at rail entry for auto-alignment (to union)."""
     
     width = config.config.width
     depth = config.config.depth
     wall = config.wall_thickness
     rail_w = config.RAIL_WIDTH
     
-    # Four cones at rail entry corners
-    positions = [
-        (-width / 2 + wall + rail_w / 2 - 2, -depth / 2 + wall + 2),
-        (-width / 2 + wall + rail_w / 2 + 2, -depth / 2 + wall + 2),
-        (width / 2 - wall - rail_w / 2 - 2, -depth / 2 + wall + 2),
-        (width / 2 - wall - rail_w / 2 + 2, -depth / 2 + wall + 2),
+    # Four cones at rail entry corners, fused into one object
+    rail_x = width / 2 - wall - rail_w / 2
+    offsets = [
+        (-rail_x - 2, 0, 0),
+        (-rail_x + 2, 0, 0),
+        (rail_x - 2, 0, 0),
+        (rail_x + 2, 0, 0),
     ]
     
-    for i, (x, y) in enumerate(positions):
-        cone = build_guide_cone(
-            height=1.5,
-            base_radius=2.0,
-            name=f"GuideCone_{i}",
-            location=(x, y, config.floor_thickness + 1)
-        )
-        if cone:
-            boolean_union(shell, cone)
+    # Union tool only, so shells of the same size share one cone mesh
+    cones = cached_mesh_object(
+        ("guide_cones", 1.5, 2.0, tuple(offsets)),
+        lambda: build_guide_cones(
+            offsets, height=1.5, base_radius=2.0, name="GuideCones"
+        ),
+        name="GuideCones",
+        location=(0, -depth / 2 + wall + 2, config.floor_thickness + 1),
+    )
+    return [cones]
 
 
-def _add_smart_cartridge_bay(
-    shell: "bpy.types.Object",
-    config: DerivedConfig,
-) -> None:
-    """Add smart cartridge bay at rear of shell."""
-    from ..geometry.boolean_ops import boolean_difference
+def _build_cartridge_bay(config: DerivedConfig) -> "bpy.types.Object":
+    """Build smart cartridge bay pocket at rear of shell (to cut)."""
     
-    width = config.config.width
     depth = config.config.depth
     
     # Cartridge pocket dimensions
@@ -245,24 +236,15 @@ def _add_smart_cartridge_bay(
     c_h = config.CARTRIDGE_H
     c_d = config.CARTRIDGE_D
     
-    bpy.ops.mesh.primitive_cube_add(
-        size=1,
-        location=(0, depth / 2 - c_d / 2, c_h / 2 + config.floor_thickness)
+    return create_box(
+        c_w, c_d, c_h,
+        name="CartridgeBay",
+        location=(0, depth / 2 - c_d / 2, c_h / 2 + config.floor_thickness),
     )
-    pocket = bpy.context.active_object
-    if pocket is not None:
-        pocket.name = "CartridgeBay"
-        pocket.scale = (c_w, c_d, c_h)
-        bpy.ops.object.transform_apply(scale=True)
-        boolean_difference(shell, pocket)
 
 
-def _add_micro_feet(
-    shell: "bpy.types.Object",
-    config: DerivedConfig,
-) -> None:
-    """Add micro-feet at corners for stability."""
-    from ..geometry.boolean_ops import boolean_union
+def _build_micro_feet(config: DerivedConfig) -> list:
+    """Build micro-feet at corners for stability (to union)."""
     
     width = config.config.width
     depth = config.config.depth
@@ -270,24 +252,29 @@ def _add_micro_feet(
     foot_height = 0.6
     foot_radius = 4.0
     
-    positions = [
-        (width / 2 - 10, depth / 2 - 10),
-        (width / 2 - 10, -depth / 2 + 10),
-        (-width / 2 + 10, depth / 2 - 10),
-        (-width / 2 + 10, -depth / 2 + 10),
+    foot_x = width / 2 - 10
+    foot_y = depth / 2 - 10
+    offsets = [
+        (foot_x, foot_y, 0),
+        (foot_x, -foot_y, 0),
+        (-foot_x, foot_y, 0),
+        (-foot_x, -foot_y, 0),
     ]
     
-    for i, (x, y) in enumerate(positions):
-        bpy.ops.mesh.primitive_cylinder_add(
-            vertices=24,
-            radius=foot_radius,
-            depth=foot_height,
-            location=(x, y, -foot_height / 2)
-        )
-        foot = bpy.context.active_object
-        if foot is not None:
-            foot.name = f"MicroFoot_{i}"
-            boolean_union(shell, foot)
+    # The four feet are one object, shared by shells of the same size
+    feet = cached_mesh_object(
+        ("micro_feet", foot_radius, foot_height, foot_x, foot_y),
+        lambda: create_mesh_object(
+            "MicroFeet",
+            *tile_mesh_data(
+                *cylinder_mesh_data(foot_radius, foot_height, vertices=24),
+                offsets,
+            ),
+        ),
+        name="MicroFeet",
+        location=(0, 0, -foot_height / 2),
+    )
+    return [feet]
 
 
 def _apply_style_features(
@@ -297,7 +284,6 @@ def _apply_style_features(
 ) -> None:
     """Apply style-specific features to shell."""
     from ..geometry.patterns import apply_rune_pattern
-    from ..geometry.boolean_ops import boolean_difference
     
     # Apply corner treatment based on style
     if tokens.radius_outer > 0:
@@ -334,27 +320,19 @@ def _add_version_mark(
     """Add version mark on bottom of shell."""
     # Version mark would be embossed text "BV-1.x"
     # For now, just a placeholder marker
-    from ..geometry.boolean_ops import boolean_difference
     
-    bpy.ops.mesh.primitive_cube_add(
-        size=1,
-        location=(0, 0, -0.15)
-    )
-    mark = bpy.context.active_object
-    if mark is not None:
-        mark.name = "VersionMark"
-        mark.scale = (20, 8, 0.3)
-        bpy.ops.object.transform_apply(scale=True)
-        boolean_difference(shell, mark)
+    mark = create_box(20, 8, 0.3, name="VersionMark", location=(0, 0, -0.15))
+    boolean_difference(shell, mark)
 
 
+@requires_bpy
 def build_shell_simple(
     width: float,
     depth: float,
     height: float,
     wall: float = 2.0,
     name: str = "ShellSimple",
-) -> Optional["bpy.types.Object"]:
+) -> "bpy.types.Object":
     """
     Build simplified shell without advanced features.
     
@@ -370,25 +348,15 @@ def build_shell_simple(
     Returns:
         Simple shell object
     """
-    ensure_bpy()
-    
-    from ..geometry.boolean_ops import boolean_difference
-    
     # Outer box
     shell = _create_outer_box(width, depth, height, name)
-    if shell is None:
-        return None
     
     # Inner cavity
-    bpy.ops.mesh.primitive_cube_add(
-        size=1,
-        location=(0, 0, height / 2 + wall / 2)
+    inner = create_box(
+        width - 2 * wall, depth - 2 * wall, height - wall,
+        name="InnerCavity",
+        location=(0, 0, height / 2 + wall / 2),
     )
-    inner = bpy.context.active_object
-    if inner is not None:
-        inner.name = "InnerCavity"
-        inner.scale = (width - 2 * wall, depth - 2 * wall, height - wall)
-        bpy.ops.object.transform_apply(scale=True)
-        boolean_difference(shell, inner)
+    boolean_difference(shell, inner)
     
     return shell
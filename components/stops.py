@@ -5,30 +5,81 @@ Two-stage stops with acoustic options.
 """
 
 import math
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import List, Tuple
 
 try:
     import bpy
-    import bmesh
+    import numpy as np
     HAS_BPY = True
 except ImportError:
     HAS_BPY = False
 
 from ..config.derived_config import DerivedConfig
 from ..config.enums import SoundProfile
+from ..geometry.primitives import (
+    box_mesh_data,
+    create_mesh_object,
+    cylinder_mesh_data,
+    merge_mesh_data,
+    requires_bpy,
+    tile_mesh_data,
+)
 
 
-def ensure_bpy():
-    """Check if bpy is available."""
-    if not HAS_BPY:
-        raise RuntimeError("Blender Python API (bpy) not available")
+# Polygon material_index of each part in a build_stop_set mesh
+STOP_PART_STOP = 0
+STOP_PART_EXTRA = 1
+STOP_PART_RELEASE = 2
 
+# Spring tab entry angle and the reciprocal of its tangent
+_ENTRY_ANGLE_DEG = 15.0
+_INV_TAN_ENTRY = 1.0 / math.tan(math.radians(_ENTRY_ANGLE_DEG))
 
+# Base block for the stop assembly: fixed width, depth and height
+# reaching these margins past the tab and the hard stop
+_STOP_BASE_WIDTH = 10.0
+_STOP_DEPTH_MARGIN = 5.0
+_STOP_HEIGHT_MARGIN = 2.0
+
+# Two-stage stop vertices as coefficient rows: x = X * base_width / 2,
+# y = Y @ (tab_length, entry_length, depth_margin),
+# z = Z @ (hard_stop_height, tab_thickness, height_margin).
+# Base rectangle, top with tab, tab tip with entry angle, hard stop.
+_TWO_STAGE_X = (-1, 1, 1, -1, -1, 1, 1, -1, -1, 1, -1, 1)
+_TWO_STAGE_Y = (
+    (0, 0, 0), (0, 0, 0), (1, 0, 1), (1, 0, 1),
+    (0, 0, 0), (0, 0, 0), (1, 0, 0), (1, 0, 0),
+    (1, 1, 0), (1, 1, 0),
+    (1, 0, 1), (1, 0, 1),
+)
+_TWO_STAGE_Z = (
+    (0, 0, 0), (0, 0, 0), (0, 0, 0), (0, 0, 0),
+    (1, 0, 1), (1, 0, 1), (1, 0, 1), (1, 0, 1),
+    (1, -1, 1), (1, -1, 1),
+    (1, 0, 0), (1, 0, 0),
+)
+
+# Two-stage stop faces, indexing the 12 vertices above
+_TWO_STAGE_FACES = (
+    (0, 1, 2, 3),           # Bottom
+    (0, 4, 5, 1),           # Front
+    (2, 11, 10, 3),         # Back
+    (0, 3, 10, 8, 7, 4),    # Left side
+    (1, 5, 6, 9, 11, 2),    # Right side
+    (4, 7, 6, 5),           # Top surfaces
+    (7, 8, 9, 6),
+    (10, 11, 9, 8),         # Hard stop top
+)
+
+
+@requires_bpy
 def build_two_stage_stop(
     config: DerivedConfig,
     name: str = "TwoStageStop",
     location: Tuple[float, float, float] = (0, 0, 0),
-) -> Optional["bpy.types.Object"]:
+    link: bool = True,
+) -> "bpy.types.Object":
     """
     Create two-stage drawer stop mechanism.
     
@@ -44,84 +95,57 @@ def build_two_stage_stop(
         config: DerivedConfig with stop parameters
         name: Object name
         location: Object location
+        link: Link to the active collection (False to batch-link)
     
     Returns:
         Blender object
     """
-    ensure_bpy()
-    
-    bm = bmesh.new()
-    
-    tab_thickness = config.STOP1_THICKNESS  # 1.2mm
-    tab_length = config.STOP1_LENGTH        # 8mm
-    hard_stop_height = config.STOP2_HEIGHT  # 3mm
-    
-    # Base block for the stop assembly
-    base_width = 10.0
-    base_depth = tab_length + 5.0
-    base_height = hard_stop_height + 2.0
+    verts = _two_stage_stop_verts(
+        config.STOP1_THICKNESS,  # 1.2mm
+        config.STOP1_LENGTH,     # 8mm
+        config.STOP2_HEIGHT,     # 3mm
+    )
+    return create_mesh_object(
+        name, verts, _TWO_STAGE_FACES, location, link=link
+    )
+
+
+@lru_cache(maxsize=16)
+def _two_stage_stop_verts(
+    tab_thickness: float,
+    tab_length: float,
+    hard_stop_height: float,
+) -> "np.ndarray":
+    """
+    Vertex data for build_two_stage_stop (cached, read-only).
     
+    Every drawer of a stack uses the same stop parameters, so the
+    vertex array is computed once and shared.
+    """
     # Spring tab profile with 15° entry angle
-    entry_angle_rad = math.radians(15)
-    entry_length = tab_thickness / math.tan(entry_angle_rad)
-    
-    # Create spring tab vertices
-    verts = [
-        # Base rectangle
-        bm.verts.new((-base_width / 2, 0, 0)),
-        bm.verts.new((base_width / 2, 0, 0)),
-        bm.verts.new((base_width / 2, base_depth, 0)),
-        bm.verts.new((-base_width / 2, base_depth, 0)),
-        # Top with tab
-        bm.verts.new((-base_width / 2, 0, base_height)),
-        bm.verts.new((base_width / 2, 0, base_height)),
-        bm.verts.new((base_width / 2, tab_length, base_height)),
-        bm.verts.new((-base_width / 2, tab_length, base_height)),
-        # Tab tip with entry angle
-        bm.verts.new((-base_width / 2, tab_length + entry_length,
-                      base_height - tab_thickness)),
-        bm.verts.new((base_width / 2, tab_length + entry_length,
-                      base_height - tab_thickness)),
-        # Hard stop
-        bm.verts.new((-base_width / 2, base_depth, hard_stop_height)),
-        bm.verts.new((base_width / 2, base_depth, hard_stop_height)),
-    ]
-    
-    # Create faces
-    # Bottom
-    bm.faces.new([verts[0], verts[1], verts[2], verts[3]])
-    # Front
-    bm.faces.new([verts[0], verts[4], verts[5], verts[1]])
-    # Back
-    bm.faces.new([verts[2], verts[11], verts[10], verts[3]])
-    # Left side
-    bm.faces.new([verts[0], verts[3], verts[10], verts[8], verts[7], verts[4]])
-    # Right side
-    bm.faces.new([verts[1], verts[5], verts[6], verts[9], verts[11], verts[2]])
-    # Top surfaces
-    bm.faces.new([verts[4], verts[7], verts[6], verts[5]])
-    bm.faces.new([verts[7], verts[8], verts[9], verts[6]])
-    # Hard stop top
-    bm.faces.new([verts[10], verts[11], verts[9], verts[8]])
-    
-    mesh = bpy.data.meshes.new(name)
-    bm.to_mesh(mesh)
-    bm.free()
-    
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
-    obj.location = location
-    
-    return obj
+    entry_length = tab_thickness * _INV_TAN_ENTRY
+    
+    verts = np.column_stack((
+        np.multiply(_TWO_STAGE_X, _STOP_BASE_WIDTH / 2),
+        np.dot(_TWO_STAGE_Y, (tab_length, entry_length, _STOP_DEPTH_MARGIN)),
+        np.dot(
+            _TWO_STAGE_Z, (hard_stop_height, tab_thickness, _STOP_HEIGHT_MARGIN)
+        ),
+    )).astype(np.float32)
+    verts.flags.writeable = False
+    
+    return verts
 
 
+@requires_bpy
 def build_acoustic_tab(
     width: float = 0.8,
     height: float = 6.0,
     length: float = 18.0,
     name: str = "AcousticTab",
     location: Tuple[float, float, float] = (0, 0, 0),
-) -> Optional["bpy.types.Object"]:
+    link: bool = True,
+) -> "bpy.types.Object":
     """
     Create acoustic resonator tab for MECH_CLICK sound profile.
     
@@ -136,27 +160,23 @@ def build_acoustic_tab(
         length: Tab length (cantilever)
         name: Object name
         location: Object location
+        link: Link to the active collection (False to batch-link)
     
     Returns:
         Blender object
     """
-    ensure_bpy()
-    
-    bpy.ops.mesh.primitive_cube_add(size=1, location=location)
-    obj = bpy.context.active_object
-    if obj is not None:
-        obj.name = name
-        obj.scale = (width, length, height)
-        bpy.ops.object.transform_apply(scale=True)
-    
-    return obj
+    return create_mesh_object(
+        name, *box_mesh_data(width, length, height), location, link=link
+    )
 
 
+@requires_bpy
 def build_soft_damper(
     config: DerivedConfig,
     name: str = "SoftDamper",
     location: Tuple[float, float, float] = (0, 0, 0),
-) -> Optional["bpy.types.Object"]:
+    link: bool = True,
+) -> "bpy.types.Object":
     """
     Create soft-close damper pocket for SILENT sound profile.
     
@@ -170,36 +190,34 @@ def build_soft_damper(
         config: DerivedConfig
         name: Object name
         location: Object location
+        link: Link to the active collection (False to batch-link)
     
     Returns:
         Blender object (pocket for boolean subtraction)
     """
-    ensure_bpy()
-    
+    return create_mesh_object(
+        name, *_soft_damper_mesh_data(), location, link=link
+    )
+
+
+def _soft_damper_mesh_data() -> Tuple["np.ndarray", Tuple[Tuple[int, ...], ...]]:
+    """Vertex and face data for the soft damper pocket (cached template)."""
     # Pocket for Ø8mm silicone bumper
     pocket_diameter = 8.5  # With clearance
     pocket_depth = 5.0
     
-    bpy.ops.mesh.primitive_cylinder_add(
-        vertices=24,
-        radius=pocket_diameter / 2,
-        depth=pocket_depth,
-        location=location,
-    )
-    obj = bpy.context.active_object
-    if obj is not None:
-        obj.name = name
-    
-    return obj
+    return cylinder_mesh_data(pocket_diameter / 2, pocket_depth, vertices=24)
 
 
+@requires_bpy
 def build_release_slot(
     width: float = 15.0,
     height: float = 5.0,
     depth: float = 3.0,
     name: str = "ReleaseSlot",
     location: Tuple[float, float, float] = (0, 0, 0),
-) -> Optional["bpy.types.Object"]:
+    link: bool = True,
+) -> "bpy.types.Object":
     """
     Create release slot for drawer removal.
     
@@ -216,26 +234,49 @@ def build_release_slot(
         depth: Slot depth (into shell)
         name: Object name
         location: Object location
+        link: Link to the active collection (False to batch-link)
     
     Returns:
         Blender object (for boolean subtraction)
     """
-    ensure_bpy()
-    
-    bpy.ops.mesh.primitive_cube_add(size=1, location=location)
-    obj = bpy.context.active_object
-    if obj is not None:
-        obj.name = name
-        obj.scale = (width, depth, height)
-        bpy.ops.object.transform_apply(scale=True)
-    
-    return obj
+    return create_mesh_object(
+        name,
+        *_release_slot_mesh_data(width, height, depth),
+        location,
+        link=link,
+    )
+
+
+def _release_slot_mesh_data(
+    width: float,
+    height: float,
+    depth: float = 3.0,
+) -> Tuple["np.ndarray", Tuple[Tuple[int, ...], ...]]:
+    """Vertex and face data for the release slot (cached box template)."""
+    return box_mesh_data(width, depth, height)
+
 
+def _acoustic_tab_mesh_data() -> Tuple["np.ndarray", Tuple[Tuple[int, ...], ...]]:
+    """Vertex and face data for a default 0.8 x 18 x 6mm acoustic tab."""
+    return box_mesh_data(0.8, 18.0, 6.0)
 
+
+# Extra stop-set part per sound profile: (mesh data, offset). SILENT
+# adds a damper pocket before the stop, MECH_CLICK an acoustic tab
+# adjacent to it; SOFT_CLICK has no extra part.
+_PROFILE_EXTRAS = {
+    SoundProfile.SILENT: (_soft_damper_mesh_data, (0, -15, 0)),
+    SoundProfile.MECH_CLICK: (_acoustic_tab_mesh_data, (0, 5, 0)),
+}
+
+
+@requires_bpy
 def build_stop_set(
     config: DerivedConfig,
     sound_profile: SoundProfile,
-) -> list:
+    name: str = "StopSet",
+    link: bool = True,
+) -> "bpy.types.Object":
     """
     Build complete stop assembly based on sound profile.
     
@@ -243,51 +284,100 @@ def build_stop_set(
     SOFT_CLICK: Two-stage stop with optimized spring
     MECH_CLICK: Two-stage stop + acoustic tab
     
+    All parts are written into one mesh. The polygon material_index
+    tells the parts apart: STOP_PART_STOP for the two-stage stop,
+    STOP_PART_EXTRA for the damper pocket or acoustic tab, and
+    STOP_PART_RELEASE for the release slot.
+    
     Args:
         config: DerivedConfig
         sound_profile: Desired sound profile
+        name: Object name
+        link: Link to the active collection (False to batch-link)
     
     Returns:
-        List of stop objects
+        Merged stop assembly object
     """
-    stops: list = []
+    verts, faces, part_ids = _stop_set_mesh_data(config, sound_profile)
+    obj = create_mesh_object(name, verts, faces, link=link)
+    obj.data.polygons.foreach_set("material_index", part_ids)
     
-    # Two-stage stop is always included
-    stop = build_two_stage_stop(
-        config,
-        name="TwoStageStop",
-        location=(0, 0, 0)
-    )
-    if stop:
-        stops.append(stop)
-    
-    if sound_profile == SoundProfile.SILENT:
-        # Add soft damper pocket
-        damper = build_soft_damper(
-            config,
-            name="SoftDamper",
-            location=(0, -15, 0)  # Before stop
-        )
-        if damper:
-            stops.append(damper)
-    
-    elif sound_profile == SoundProfile.MECH_CLICK:
-        # Add acoustic resonator tab
-        tab = build_acoustic_tab(
-            name="AcousticTab",
-            location=(0, 5, 0)  # Adjacent to stop
-        )
-        if tab:
-            stops.append(tab)
+    return obj
+
+
+@requires_bpy
+def build_stop_sets_batched(
+    config: DerivedConfig,
+    sound_profile: SoundProfile,
+    count: int,
+    name: str = "StopSets",
+    link: bool = True,
+) -> "bpy.types.Object":
+    """
+    Build the stop sets of a whole stack as one mesh.
     
-    # Release slot for all profiles
-    release = build_release_slot(
-        width=config.RELEASE_SLOT_W,
-        height=config.RELEASE_SLOT_H,
-        name="ReleaseSlot",
-        location=(0, 0, -config.wall_thickness)
+    The stop set is computed once and copied ``count`` times, one copy
+    per stack level spaced by the box height, so a stack costs a single
+    object and upload. Copy ``i`` holds vertices
+    ``[i * n, (i + 1) * n)`` of the mesh, where ``n`` is the vertex
+    count of one stop set; material indices are as in build_stop_set.
+    
+    Args:
+        config: DerivedConfig
+        sound_profile: Desired sound profile
+        count: Number of stack levels
+        name: Object name
+        link: Link to the active collection (False to batch-link)
+    
+    Returns:
+        Merged stop assemblies object
+    """
+    verts, faces, part_ids = _stop_set_mesh_data(config, sound_profile)
+    
+    offsets = np.zeros((count, 3), dtype=np.float32)
+    offsets[:, 2] = np.arange(count) * config.config.height
+    
+    obj = create_mesh_object(
+        name, *tile_mesh_data(verts, faces, offsets), link=link
     )
-    if release:
-        stops.append(release)
+    obj.data.polygons.foreach_set("material_index", np.tile(part_ids, count))
+    
+    return obj
+
+
+def _stop_set_mesh_data(
+    config: DerivedConfig,
+    sound_profile: SoundProfile,
+) -> Tuple["np.ndarray", List[Tuple[int, ...]], "np.ndarray"]:
+    """Merged vertex/face data and per-face part ids of one stop set."""
+    parts = []
+    part_ids = []
+    
+    # Two-stage stop is always included
+    parts.append((
+        _two_stage_stop_verts(
+            config.STOP1_THICKNESS,
+            config.STOP1_LENGTH,
+            config.STOP2_HEIGHT,
+        ),
+        _TWO_STAGE_FACES,
+        (0, 0, 0),
+    ))
+    part_ids.append(STOP_PART_STOP)
+    
+    # Profile-specific damper pocket or acoustic tab
+    extra = _PROFILE_EXTRAS.get(sound_profile)
+    if extra is not None:
+        mesh_data, offset = extra
+        parts.append((*mesh_data(), offset))
+        part_ids.append(STOP_PART_EXTRA)
     
-    return stops
+    # Release slot for all profiles
+    parts.append((
+        *_release_slot_mesh_data(config.RELEASE_SLOT_W, config.RELEASE_SLOT_H),
+        (0, 0, -config.wall_thickness),
+    ))
+    part_ids.append(STOP_PART_RELEASE)
+    
+    verts, faces, face_parts = merge_mesh_data(parts)
+    return verts, faces, np.asarray(part_ids, dtype=np.int32)[face_parts]
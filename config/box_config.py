@@ -5,7 +5,7 @@ User specifies only external dimensions and preferences,
 everything else is calculated automatically.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, fields, replace
 from typing import Tuple, Optional
 
 from .enums import (
@@ -30,7 +30,50 @@ from .enums import (
 )
 
 
-@dataclass
+# Belovodye preset settings as (attribute path, value) pairs; dotted
+# paths address the sub-configurations
+_BELOVODIE_PRESETS = {
+    BelovodiePreset.DESK: (
+        ("color_body", BelovodieColor.MIST_WHITE),
+        ("color_accent", BelovodieColor.EMERALD_DEEP),
+        ("pattern.type", RunePattern.KNOT_LINE),
+        ("pattern.position", PatternPosition.LABEL_FRAME),
+    ),
+    BelovodiePreset.WORKSHOP: (
+        ("color_body", BelovodieColor.OBSIDIAN),
+        ("color_accent", BelovodieColor.BRONZE_WARM),
+        ("pattern.type", RunePattern.CHEVRON_RUNE),
+        ("pattern.position", PatternPosition.BACK_EDGE),
+    ),
+    BelovodiePreset.MED: (
+        ("color_body", BelovodieColor.STONE_SAND),
+        ("color_accent", BelovodieColor.FROST_BLUE),
+        ("pattern.type", RunePattern.NONE),
+        ("sealed", True),
+    ),
+    BelovodiePreset.SACRED: (
+        ("color_body", BelovodieColor.OBSIDIAN),
+        ("color_accent", BelovodieColor.BRONZE_WARM),
+        ("pattern.type", RunePattern.CHEVRON_RUNE),
+        ("pattern.position", PatternPosition.BACK_EDGE),
+        ("details.rune_key", True),
+        ("details.rivet_dots", True),
+    ),
+}
+
+
+# Dimension limits: (attribute, min, max, below-min warning, above-max
+# warning); None means no limit on that side
+_DIM_RULES = (
+    ("width", 60, 400,
+     "Width < 60mm may be too small for drawer",
+     "Width > 400mm may have warping issues"),
+    ("depth", 80, None, "Depth < 80mm may be too shallow", None),
+    ("height", 30, None, "Height < 30mm very limited drawer depth", None),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class GeometryConfig:
     """Geometry configuration for shell shape."""
     shape: ShellGeometry = ShellGeometry.RECTANGULAR
@@ -39,7 +82,7 @@ class GeometryConfig:
     maintain_back_vertical: bool = True  # back face always vertical
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MechanicsConfig:
     """Mechanics configuration for drawer operation."""
     rail_profile: RailProfile = RailProfile.V_PROFILE
@@ -49,7 +92,7 @@ class MechanicsConfig:
     service_channel: bool = False  # dusty mode blowout channel
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PatternConfig:
     """Pattern configuration for Belovodye style."""
     type: RunePattern = RunePattern.NONE
@@ -60,7 +103,7 @@ class PatternConfig:
     groove_width: float = 0.8  # mm
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DetailsConfig:
     """Detail configuration for premium features."""
     shadow_gap: float = 0.4  # mm
@@ -70,7 +113,13 @@ class DetailsConfig:
     version_mark: bool = True  # BV-x.x mark on bottom
 
 
-@dataclass
+_DEFAULT_GEOMETRY = GeometryConfig()
+_DEFAULT_MECHANICS = MechanicsConfig()
+_DEFAULT_PATTERN = PatternConfig()
+_DEFAULT_DETAILS = DetailsConfig()
+
+
+@dataclass(slots=True)
 class BoxConfig:
     """
     Main configuration for Storage Box.
@@ -123,78 +172,45 @@ class BoxConfig:
     sealed: bool = False  # O-profile seal groove
     
     # === Sub-configurations ===
-    geometry: GeometryConfig = field(default_factory=GeometryConfig)
-    mechanics: MechanicsConfig = field(default_factory=MechanicsConfig)
-    pattern: PatternConfig = field(default_factory=PatternConfig)
-    details: DetailsConfig = field(default_factory=DetailsConfig)
+    # Frozen, so every BoxConfig can share the same default instances
+    geometry: GeometryConfig = _DEFAULT_GEOMETRY
+    mechanics: MechanicsConfig = _DEFAULT_MECHANICS
+    pattern: PatternConfig = _DEFAULT_PATTERN
+    details: DetailsConfig = _DEFAULT_DETAILS
     
     # === Meta ===
     description: str = ""
     
     def __post_init__(self):
         """Apply Belovodye preset if specified."""
-        if self.design == DesignStyle.BELOVODIE and self.belovodie_preset:
+        # Most configs have no preset; test that before the style
+        if self.belovodie_preset is None:
+            return
+        if self.design == DesignStyle.BELOVODIE:
             self._apply_belovodie_preset()
     
     def _apply_belovodie_preset(self):
         """Apply Belovodye preset settings."""
-        presets = {
-            BelovodiePreset.DESK: {
-                "color_body": BelovodieColor.MIST_WHITE,
-                "color_accent": BelovodieColor.EMERALD_DEEP,
-                "pattern_type": RunePattern.KNOT_LINE,
-                "pattern_position": PatternPosition.LABEL_FRAME,
-            },
-            BelovodiePreset.WORKSHOP: {
-                "color_body": BelovodieColor.OBSIDIAN,
-                "color_accent": BelovodieColor.BRONZE_WARM,
-                "pattern_type": RunePattern.CHEVRON_RUNE,
-                "pattern_position": PatternPosition.BACK_EDGE,
-            },
-            BelovodiePreset.MED: {
-                "color_body": BelovodieColor.STONE_SAND,
-                "color_accent": BelovodieColor.FROST_BLUE,
-                "pattern_type": RunePattern.NONE,
-                "sealed": True,
-            },
-            BelovodiePreset.SACRED: {
-                "color_body": BelovodieColor.OBSIDIAN,
-                "color_accent": BelovodieColor.BRONZE_WARM,
-                "pattern_type": RunePattern.CHEVRON_RUNE,
-                "pattern_position": PatternPosition.BACK_EDGE,
-                "rune_key": True,
-                "rivet_dots": True,
-            },
-        }
-        
-        preset = presets.get(self.belovodie_preset, {})
-        for key, value in preset.items():
-            if key == "pattern_type":
-                self.pattern.type = value
-            elif key == "pattern_position":
-                self.pattern.position = value
-            elif key == "sealed":
-                self.sealed = value
-            elif key == "rune_key":
-                self.details.rune_key = value
-            elif key == "rivet_dots":
-                self.details.rivet_dots = value
-            elif hasattr(self, key):
-                setattr(self, key, value)
+        for path, value in _BELOVODIE_PRESETS.get(self.belovodie_preset, ()):
+            owner, _, attr = path.rpartition(".")
+            if owner:
+                # Sub-configurations are frozen: swap in an updated copy
+                sub_config = replace(getattr(self, owner), **{attr: value})
+                setattr(self, owner, sub_config)
+            else:
+                setattr(self, attr, value)
     
     def validate(self) -> list[str]:
         """Validate configuration and return list of warnings."""
         warnings = []
         
         # Size limits
-        if self.width < 60:
-            warnings.append("Width < 60mm may be too small for drawer")
-        if self.width > 400:
-            warnings.append("Width > 400mm may have warping issues")
-        if self.depth < 80:
-            warnings.append("Depth < 80mm may be too shallow")
-        if self.height < 30:
-            warnings.append("Height < 30mm very limited drawer depth")
+        for attr, low, high, low_msg, high_msg in _DIM_RULES:
+            value = getattr(self, attr)
+            if low is not None and value < low:
+                warnings.append(low_msg)
+            if high is not None and value > high:
+                warnings.append(high_msg)
         
         # Material + feature compatibility
         if self.sealed and self.material == MaterialType.HYPER_PLA:
@@ -206,3 +222,53 @@ class BoxConfig:
                 warnings.append("Rune patterns only for BELOVODIE style")
         
         return warnings
+    
+    def freeze(self) -> tuple:
+        """
+        Hashable snapshot of every field, in declaration order.
+        
+        Sub-configurations are frozen and list values (e.g. a
+        target_cell_size read from JSON) become tuples, so the snapshot
+        can key caches such as DerivedConfig.from_config.
+        from_frozen() turns it back into a configuration with the same
+        values (lists come back as tuples).
+        
+        Returns:
+            Tuple of field values
+        """
+        return tuple(
+            tuple(value) if isinstance(value, list) else value
+            for value in (getattr(self, f.name) for f in fields(self))
+        )
+    
+    @classmethod
+    def from_frozen(cls, snapshot: tuple) -> "BoxConfig":
+        """
+        Rebuild a configuration from a freeze() snapshot.
+        
+        __post_init__ is not run, so a Belovodye preset is not applied
+        again over fields the snapshot's source had edited.
+        
+        Args:
+            snapshot: Tuple returned by freeze()
+        
+        Returns:
+            New BoxConfig with the snapshot's field values
+        """
+        config = cls.__new__(cls)
+        for f, value in zip(fields(cls), snapshot):
+            setattr(config, f.name, value)
+        return config
+    
+    @classmethod
+    def validate_batch(cls, configs: list["BoxConfig"]) -> list[list[str]]:
+        """
+        Validate many configurations.
+        
+        Args:
+            configs: Configurations to check
+        
+        Returns:
+            Warning list for each configuration, in input order
+        """
+        return [config.validate() for config in configs]
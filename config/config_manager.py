@@ -5,6 +5,8 @@ Handles saving and loading BoxConfig to/from YAML files.
 Supports versioning for forward compatibility.
 """
 
+import json
+import os
 import yaml
 from pathlib import Path
 from datetime import datetime
@@ -40,6 +42,131 @@ from .enums import (
 )
 
 
+# libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _Dumper, CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper, SafeLoader as _Loader
+
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+
+# value -> member tables for the enums read by _dict_to_config
+_ENUM_BY_VALUE: Dict[type, Dict[Any, Any]] = {
+    enum_cls: {member.value: member for member in enum_cls}
+    for enum_cls in (
+        DesignStyle,
+        MaterialType,
+        ConnectionType,
+        DividerLayout,
+        DividerMode,
+        RailProfile,
+        PrinterProfile,
+        SoundProfile,
+        HandleMode,
+        SmartCartridge,
+        PrintMode,
+        AntiWobbleType,
+        WhiskerVariant,
+        RunePattern,
+        PatternPosition,
+        BelovodieColor,
+        BelovodiePreset,
+        ShellGeometry,
+    )
+}
+
+
+def _enum_value(enum_cls: type, value: Any) -> Any:
+    """Enum member for a stored value; unknown values raise ValueError."""
+    try:
+        return _ENUM_BY_VALUE[enum_cls][value]
+    except (KeyError, TypeError):
+        return enum_cls(value)
+
+
+# Values used for keys missing from a loaded document
+_DEFAULT_CONFIG_DICT: Dict[str, Any] = {
+    "dimensions": {"width": 200.0, "depth": 220.0, "height": 80.0},
+    "design": {
+        "style": "nordic",
+        "belovodie_preset": None,
+        "colors": {"body": "mist_white", "accent": "emerald_deep"},
+    },
+    "material": {
+        "type": "hyper_pla",
+        "printer": "k1c",
+        "print_mode": "normal",
+    },
+    "mechanics": {
+        "rail_profile": "v_profile",
+        "anti_wobble": {"type": "none", "whisker_variant": "med_l"},
+        "sound_profile": "soft_click",
+        "service_channel": False,
+    },
+    "dividers": {
+        "layout": "auto",
+        "mode": "snap",
+        "target_cell_size": [50, 50],
+    },
+    "connection": "dovetail",
+    "context": {
+        "mount": "table",
+        "stack_levels": 1,
+        "expected_weight": 500.0,
+    },
+    "handle": {"mode": "hook", "tactile_zone": True},
+    "label": {"frame_style": "recessed_portal"},
+    "smart": {"cartridge": "plain", "hub_connector": False},
+    "special": {"sealed": False},
+    "geometry": {
+        "shape": "rectangular",
+        "slope_angle": 15.0,
+        "slope_direction": "front",
+        "maintain_back_vertical": True,
+    },
+    "patterns": {
+        "type": "none",
+        "position": "back_edge",
+        "spacing": 8.0,
+        "band_height": 14.0,
+        "groove_depth": 0.35,
+        "groove_width": 0.8,
+    },
+    "details": {
+        "shadow_gap": 0.4,
+        "guide_cones": True,
+        "rune_key": False,
+        "rivet_dots": False,
+        "version_mark": True,
+    },
+    "meta": {"description": ""},
+}
+
+
+def _deep_merge(
+    defaults: Dict[str, Any],
+    data: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Copy of defaults with data laid over it, merging nested dicts."""
+    merged = dict(defaults)
+    for key, value in data.items():
+        default = merged.get(key)
+        if isinstance(default, dict) and isinstance(value, dict):
+            value = _deep_merge(default, value)
+        merged[key] = value
+    return merged
+
+
+# Source revision recorded in saved files, if the build provides it
+_GIT_SHA = os.environ.get("GIT_SHA")
+
+
 # Version constants
 FORMAT_VERSION = "1.0"    # YAML structure version
 COMPAT_VERSION = "1.0"    # Hardware compatibility version
@@ -55,58 +182,102 @@ class ConfigManager:
         self.config_dir.mkdir(parents=True, exist_ok=True)
     
     def save(self, config: BoxConfig, filename: str, 
-             include_derived: bool = False) -> Path:
+             include_derived: bool = False,
+             add_timestamp: bool = False) -> Path:
         """
         Save configuration to YAML file.
         
+        Derived values go to a separate <filename>.derived.json file,
+        so the YAML only holds the user-facing fields. An existing YAML
+        file that is byte-identical to the new dump is not rewritten.
+        
         Args:
             config: BoxConfig to save
             filename: Name without extension
-            include_derived: Include computed values for debug
+            include_derived: Also write computed values for debug
+            add_timestamp: Record the save time in meta.created
         
         Returns:
             Path to saved file
         """
         filepath = self.config_dir / f"{filename}.yaml"
         
-        data = self._config_to_dict(config)
+        derived_path = self.config_dir / f"{filename}.derived.json"
         
-        # Add meta information
-        data["meta"] = {
-            "format_version": FORMAT_VERSION,
-            "compat_version": COMPAT_VERSION,
-            "created": datetime.now().isoformat(),
-            "description": config.description,
-        }
+        data = self._config_to_document(config, add_timestamp)
         
-        # Optionally add derived values for debugging
-        if include_derived:
-            derived = DerivedConfig(config)
-            data["_derived"] = {
-                "wall_thickness": derived.wall_thickness,
-                "tolerance_slide": derived.tolerances["slide"],
-                "tolerance_snap": derived.tolerances["snap"],
-                "inner_width": derived.effective_inner_width,
-                "inner_depth": derived.effective_inner_depth,
-                "drawer_width": derived.drawer_width,
-                "drawer_depth": derived.drawer_depth,
-                "divider_count": list(derived.divider_count),
-                "features": derived.features_enabled,
-            }
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            yaml.dump(
-                data, f, 
-                default_flow_style=False,
-                allow_unicode=True,
-                sort_keys=False
+        # The dumper encodes to UTF-8 bytes itself
+        content = yaml.dump(
+            data,
+            Dumper=_Dumper,
+            encoding='utf-8',
+            default_flow_style=False,
+            allow_unicode=True,
+            sort_keys=False
+        )
+        
+        # Byte-identical file on disk: keep it as is
+        unchanged = filepath.exists() and filepath.read_bytes() == content
+        if not unchanged:
+            filepath.write_bytes(content)
+        
+        # Keep a same-named msgpack file in step, or load() would
+        # keep returning its old content
+        fast_path = self.config_dir / f"{filename}.msgpack"
+        if fast_path.exists():
+            if HAS_MSGPACK:
+                packed = msgpack.packb(data, use_bin_type=True)
+                if fast_path.read_bytes() != packed:
+                    fast_path.write_bytes(packed)
+            else:
+                fast_path.unlink()
+        
+        # Derived values depend only on the config, so an existing
+        # side file is still current when the YAML was unchanged
+        if include_derived and not (unchanged and derived_path.exists()):
+            derived_path.write_text(
+                json.dumps(self._derived_dump(config), indent=2),
+                encoding='utf-8',
             )
+        elif not unchanged and derived_path.exists():
+            derived_path.unlink()  # stale dump of the previous config
+        
+        return filepath
+    
+    def save_fast(self, config: BoxConfig, filename: str,
+                  add_timestamp: bool = False) -> Path:
+        """
+        Save configuration to a binary msgpack file.
+        
+        Same content as the YAML file, but much faster to read back.
+        When both files exist, load() reads whichever is newer; save()
+        refreshes an existing msgpack file.
+        
+        Args:
+            config: BoxConfig to save
+            filename: Name without extension
+            add_timestamp: Record the save time in meta.created
+        
+        Returns:
+            Path to saved file
+        """
+        if not HAS_MSGPACK:
+            raise RuntimeError("msgpack not available")
+        
+        filepath = self.config_dir / f"{filename}.msgpack"
+        
+        data = self._config_to_document(config, add_timestamp)
+        filepath.write_bytes(msgpack.packb(data, use_bin_type=True))
         
         return filepath
     
     def load(self, filename: str) -> BoxConfig:
         """
-        Load configuration from YAML file.
+        Load configuration from msgpack or YAML file.
+        
+        The msgpack file written by save_fast() is used when it is at
+        least as new as the YAML file (and msgpack is installed), so a
+        hand-edited YAML file wins; otherwise the YAML file is read.
         
         Args:
             filename: Name without extension
@@ -114,13 +285,13 @@ class ConfigManager:
         Returns:
             BoxConfig instance
         """
-        filepath = self.config_dir / f"{filename}.yaml"
+        filepath = self._source_path(filename)
         
-        if not filepath.exists():
-            raise FileNotFoundError(f"Config not found: {filepath}")
-        
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        if filepath.suffix == ".msgpack":
+            data = msgpack.unpackb(filepath.read_bytes(), raw=False)
+        else:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = yaml.load(f, Loader=_Loader)
         
         # Version check
         meta = data.get("meta", {})
@@ -134,17 +305,123 @@ class ConfigManager:
         
         return self._dict_to_config(data)
     
-    def list_configs(self) -> List[str]:
-        """List all saved configurations."""
-        return [f.stem for f in self.config_dir.glob("*.yaml")]
+    def peek_meta(self, filename: str) -> Dict[str, Any]:
+        """
+        Read only the meta block of a saved configuration.
+        
+        Reads the same file as load(). For YAML files the meta section
+        is cut out with a line scan and only that part is parsed, so
+        the rest of the document is never tokenized.
+        
+        Args:
+            filename: Name without extension
+        
+        Returns:
+            Meta dict (empty if the file has none)
+        """
+        filepath = self._source_path(filename)
+        
+        if filepath.suffix == ".msgpack":
+            data = msgpack.unpackb(filepath.read_bytes(), raw=False)
+            return data.get("meta", {})
+        
+        block = []
+        with open(filepath, 'r', encoding='utf-8') as f:
+            for line in f:
+                if block and line[:1] not in (" ", "\n"):
+                    break  # next top-level key
+                if block or line.startswith("meta:"):
+                    block.append(line)
+        if not block:
+            return {}
+        return yaml.load("".join(block), Loader=_Loader)["meta"] or {}
+    
+    def list_configs(
+        self,
+        compat_version: Optional[str] = None,
+    ) -> List[str]:
+        """
+        List all saved configurations.
+        
+        Args:
+            compat_version: Only list configs saved with this
+                compatibility version (checked via peek_meta)
+        
+        Returns:
+            Config names without extension
+        """
+        names = [f.stem for f in self.config_dir.glob("*.yaml")]
+        names += [f.stem for f in self.config_dir.glob("*.msgpack")]
+        names = list(dict.fromkeys(names))
+        if compat_version is None:
+            return names
+        return [
+            name for name in names
+            if self.peek_meta(name).get("compat_version", "1.0")
+            == compat_version
+        ]
     
     def delete(self, filename: str) -> bool:
-        """Delete a configuration file."""
+        """Delete a configuration file (YAML, msgpack, derived dump)."""
+        deleted = False
+        for suffix in (".yaml", ".msgpack", ".derived.json"):
+            filepath = self.config_dir / f"{filename}{suffix}"
+            if filepath.exists():
+                filepath.unlink()
+                deleted = True
+        return deleted
+    
+    def _source_path(self, filename: str) -> Path:
+        """File read by load(): the newer of the msgpack and YAML files."""
         filepath = self.config_dir / f"{filename}.yaml"
+        fast_path = self.config_dir / f"{filename}.msgpack"
+        
+        if HAS_MSGPACK and fast_path.exists():
+            if (
+                not filepath.exists()
+                or fast_path.stat().st_mtime_ns >= filepath.stat().st_mtime_ns
+            ):
+                return fast_path
         if filepath.exists():
-            filepath.unlink()
-            return True
-        return False
+            return filepath
+        raise FileNotFoundError(f"Config not found: {filepath}")
+    
+    def _config_to_document(
+        self,
+        config: BoxConfig,
+        add_timestamp: bool = False,
+    ) -> Dict[str, Any]:
+        """Full file content: config fields and meta."""
+        data = self._config_to_dict(config)
+        
+        # Add meta information
+        meta = {
+            "format_version": FORMAT_VERSION,
+            "compat_version": COMPAT_VERSION,
+            "description": config.description,
+        }
+        if add_timestamp:
+            meta["created"] = datetime.now().isoformat()
+        if _GIT_SHA:
+            meta["git_sha"] = _GIT_SHA
+        data["meta"] = meta
+        
+        return data
+    
+    def _derived_dump(self, config: BoxConfig) -> Dict[str, Any]:
+        """Computed values written next to the config for debugging."""
+        derived = DerivedConfig.from_config(config)
+        return {
+            "wall_thickness": derived.wall_thickness,
+            "tolerance_slide": derived.tol_slide,
+            "tolerance_snap": derived.tol_snap,
+            "inner_width": derived.effective_inner_width,
+            "inner_depth": derived.effective_inner_depth,
+            "drawer_width": derived.drawer_width,
+            "drawer_depth": derived.drawer_depth,
+            "divider_count": derived.divider_count,
+            "features": dict(derived.features_enabled),
+        }
     
     def _config_to_dict(self, config: BoxConfig) -> Dict[str, Any]:
         """Convert BoxConfig to dictionary for YAML."""
@@ -229,140 +506,120 @@ class ConfigManager:
     
     def _dict_to_config(self, data: Dict[str, Any]) -> BoxConfig:
         """Convert dictionary to BoxConfig."""
-        dims = data.get("dimensions", {})
-        design = data.get("design", {})
-        material = data.get("material", {})
-        mechanics = data.get("mechanics", {})
-        dividers_data = data.get("dividers", {})
-        context = data.get("context", {})
-        handle = data.get("handle", {})
-        label = data.get("label", {})
-        smart = data.get("smart", {})
-        special = data.get("special", {})
-        geometry = data.get("geometry", {})
-        patterns = data.get("patterns", {})
-        details = data.get("details", {})
-        meta = data.get("meta", {})
+        merged = _deep_merge(_DEFAULT_CONFIG_DICT, data)
+        dims = merged["dimensions"]
+        design = merged["design"]
+        material = merged["material"]
+        mechanics = merged["mechanics"]
+        anti_wobble = mechanics["anti_wobble"]
+        dividers_data = merged["dividers"]
+        context = merged["context"]
+        geometry = merged["geometry"]
+        patterns = merged["patterns"]
+        details = merged["details"]
         
         # Parse belovodie_preset
-        bp_value = design.get("belovodie_preset")
+        bp_value = design["belovodie_preset"]
         belovodie_preset = (
-            BelovodiePreset(bp_value) if bp_value else None
+            _enum_value(BelovodiePreset, bp_value) if bp_value else None
         )
         
         return BoxConfig(
             # Dimensions
-            width=dims.get("width", 200.0),
-            depth=dims.get("depth", 220.0),
-            height=dims.get("height", 80.0),
+            width=dims["width"],
+            depth=dims["depth"],
+            height=dims["height"],
             
             # Design
-            design=DesignStyle(design.get("style", "nordic")),
+            design=_enum_value(DesignStyle, design["style"]),
             belovodie_preset=belovodie_preset,
-            color_body=BelovodieColor(
-                design.get("colors", {}).get("body", "mist_white")
-            ),
-            color_accent=BelovodieColor(
-                design.get("colors", {}).get("accent", "emerald_deep")
+            color_body=_enum_value(BelovodieColor, design["colors"]["body"]),
+            color_accent=_enum_value(
+                BelovodieColor, design["colors"]["accent"]
             ),
             
             # Material
-            material=MaterialType(material.get("type", "hyper_pla")),
-            printer=PrinterProfile(material.get("printer", "k1c")),
-            print_mode=PrintMode(material.get("print_mode", "normal")),
+            material=_enum_value(MaterialType, material["type"]),
+            printer=_enum_value(PrinterProfile, material["printer"]),
+            print_mode=_enum_value(PrintMode, material["print_mode"]),
             
             # Mechanics
             mechanics=MechanicsConfig(
-                rail_profile=RailProfile(
-                    mechanics.get("rail_profile", "v_profile")
+                rail_profile=_enum_value(
+                    RailProfile, mechanics["rail_profile"]
                 ),
-                anti_wobble=AntiWobbleType(
-                    mechanics.get("anti_wobble", {}).get("type", "none")
+                anti_wobble=_enum_value(AntiWobbleType, anti_wobble["type"]),
+                whisker_variant=_enum_value(
+                    WhiskerVariant, anti_wobble["whisker_variant"]
                 ),
-                whisker_variant=WhiskerVariant(
-                    mechanics.get("anti_wobble", {}).get(
-                        "whisker_variant", "med_l"
-                    )
+                sound_profile=_enum_value(
+                    SoundProfile, mechanics["sound_profile"]
                 ),
-                sound_profile=SoundProfile(
-                    mechanics.get("sound_profile", "soft_click")
-                ),
-                service_channel=mechanics.get("service_channel", False),
+                service_channel=mechanics["service_channel"],
             ),
             
             # Dividers
-            dividers=DividerLayout(dividers_data.get("layout", "auto")),
-            divider_mode=DividerMode(dividers_data.get("mode", "snap")),
-            target_cell_size=tuple(
-                dividers_data.get("target_cell_size", [50, 50])
-            ),
+            dividers=_enum_value(DividerLayout, dividers_data["layout"]),
+            divider_mode=_enum_value(DividerMode, dividers_data["mode"]),
+            target_cell_size=tuple(dividers_data["target_cell_size"]),
             
             # Connection
-            connection=ConnectionType(
-                data.get("connection", "dovetail")
-            ),
+            connection=_enum_value(ConnectionType, merged["connection"]),
             
             # Context
-            mount=context.get("mount", "table"),
-            stack_levels=context.get("stack_levels", 1),
-            expected_weight=context.get("expected_weight", 500.0),
+            mount=context["mount"],
+            stack_levels=context["stack_levels"],
+            expected_weight=context["expected_weight"],
             
             # Handle
-            handle_mode=HandleMode(handle.get("mode", "hook")),
-            handle_tactile_zone=handle.get("tactile_zone", True),
+            handle_mode=_enum_value(HandleMode, merged["handle"]["mode"]),
+            handle_tactile_zone=merged["handle"]["tactile_zone"],
             
             # Label
-            label_frame_style=label.get("frame_style", "recessed_portal"),
+            label_frame_style=merged["label"]["frame_style"],
             
             # Smart
-            smart_cartridge=SmartCartridge(
-                smart.get("cartridge", "plain")
+            smart_cartridge=_enum_value(
+                SmartCartridge, merged["smart"]["cartridge"]
             ),
-            hub_connector=smart.get("hub_connector", False),
+            hub_connector=merged["smart"]["hub_connector"],
             
             # Special
-            sealed=special.get("sealed", False),
+            sealed=merged["special"]["sealed"],
             
             # Geometry
             geometry=GeometryConfig(
-                shape=ShellGeometry(
-                    geometry.get("shape", "rectangular")
-                ),
-                slope_angle=geometry.get("slope_angle", 15.0),
-                slope_direction=geometry.get("slope_direction", "front"),
-                maintain_back_vertical=geometry.get(
-                    "maintain_back_vertical", True
-                ),
+                shape=_enum_value(ShellGeometry, geometry["shape"]),
+                slope_angle=geometry["slope_angle"],
+                slope_direction=geometry["slope_direction"],
+                maintain_back_vertical=geometry["maintain_back_vertical"],
             ),
             
             # Patterns
             pattern=PatternConfig(
-                type=RunePattern(patterns.get("type", "none")),
-                position=PatternPosition(
-                    patterns.get("position", "back_edge")
-                ),
-                spacing=patterns.get("spacing", 8.0),
-                band_height=patterns.get("band_height", 14.0),
-                groove_depth=patterns.get("groove_depth", 0.35),
-                groove_width=patterns.get("groove_width", 0.8),
+                type=_enum_value(RunePattern, patterns["type"]),
+                position=_enum_value(PatternPosition, patterns["position"]),
+                spacing=patterns["spacing"],
+                band_height=patterns["band_height"],
+                groove_depth=patterns["groove_depth"],
+                groove_width=patterns["groove_width"],
             ),
             
             # Details
             details=DetailsConfig(
-                shadow_gap=details.get("shadow_gap", 0.4),
-                guide_cones=details.get("guide_cones", True),
-                rune_key=details.get("rune_key", False),
-                rivet_dots=details.get("rivet_dots", False),
-                version_mark=details.get("version_mark", True),
+                shadow_gap=details["shadow_gap"],
+                guide_cones=details["guide_cones"],
+                rune_key=details["rune_key"],
+                rivet_dots=details["rivet_dots"],
+                version_mark=details["version_mark"],
             ),
             
             # Description
-            description=meta.get("description", ""),
+            description=merged["meta"]["description"],
         )
 
-
 def save_preset(preset_name: str, config_dir: Optional[Path] = None):
-    """Save a preset configuration to YAML."""
+    """Save a preset configuration to YAML (and msgpack if available)."""
     from .presets import PRESETS
     
     if preset_name not in PRESETS:
@@ -370,6 +627,8 @@ def save_preset(preset_name: str, config_dir: Optional[Path] = None):
     
     config = PRESETS[preset_name]
     manager = ConfigManager(config_dir)
+    if HAS_MSGPACK:
+        manager.save_fast(config, preset_name)
     return manager.save(config, preset_name, include_derived=True)
 
 
@@ -5,8 +5,11 @@ All dimensional calculations, tolerances, and feature flags
 are computed here based on user input.
 """
 
+import math
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 
 from .box_config import BoxConfig
 from .enums import (
@@ -16,14 +19,97 @@ from .enums import (
     PrintMode,
 )
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
-@dataclass
+
+# Drawer detail features per print mode. build_drawer checks each flag
+# before building the detail, so a disabled one never creates cutters.
+# Every mode keeps all details for now: turning any off changes the
+# printed geometry.
+_PRINT_MODE_DETAILS: Dict[PrintMode, Dict[str, bool]] = {
+    PrintMode.DRAFT: {
+        "dust_shelves": True,
+        "stops": True,
+        "slide_pads": True,
+        "micro_lip": True,
+        "weep_holes": True,
+    },
+    PrintMode.NORMAL: {
+        "dust_shelves": True,
+        "stops": True,
+        "slide_pads": True,
+        "micro_lip": True,
+        "weep_holes": True,
+    },
+    PrintMode.PREMIUM: {
+        "dust_shelves": True,
+        "stops": True,
+        "slide_pads": True,
+        "micro_lip": True,
+        "weep_holes": True,
+    },
+}
+
+# Nozzle width (mm); wall thickness is rounded to a multiple of it
+_NOZZLE = 0.4
+_INV_NOZZLE = 1 / _NOZZLE
+
+# Base slide tolerance per material (mm)
+_BASE_TOLERANCE: Dict[MaterialType, float] = {
+    MaterialType.HYPER_PLA: 0.30,
+    MaterialType.PETG: 0.40,
+    MaterialType.ABS: 0.35,
+}
+
+# Tolerance multipliers by use case, relative to the base tolerance
+_TOLERANCE_FACTORS: Dict[str, float] = {
+    "slide": 1.0,       # Drawer/rails
+    "snap": 0.7,        # Snap-fits (tighter)
+    "pressfit": 0.5,    # Magnets/NFC (very tight)
+    "loose": 1.3,       # Easy fit
+}
+
+# Spring whisker parameters per variant. whisker_params hands these
+# entries out directly, so they are read-only views.
+_WHISKER_VARIANTS: Dict[str, Mapping[str, float]] = {
+    variant: MappingProxyType(params)
+    for variant, params in {
+        "soft_s":  {"thickness": 0.8, "length": 12.0},
+        "soft_l":  {"thickness": 0.8, "length": 18.0},
+        "med_s":   {"thickness": 1.0, "length": 12.0},
+        "med_l":   {"thickness": 1.0, "length": 18.0},
+        "firm_s":  {"thickness": 1.2, "length": 12.0},
+        "firm_l":  {"thickness": 1.2, "length": 18.0},
+    }.items()
+}
+
+# Divider (cols, rows) for the fixed layouts
+_FIXED_DIVIDER_LAYOUTS: Dict[DividerLayout, Tuple[int, int]] = {
+    DividerLayout.GRID_2X2: (1, 1),
+    DividerLayout.GRID_2X3: (1, 2),
+    DividerLayout.GRID_3X3: (2, 2),
+}
+
+
+@dataclass(frozen=True)
 class DerivedConfig:
     """
     Computed parameters ready for geometry generation.
     
     All calculations based on BoxConfig input.
     Validates constraints and provides sensible defaults.
+    
+    The config is snapshotted when the instance is built, so later
+    edits to the caller's BoxConfig do not leave cached values stale;
+    build a new DerivedConfig (or use from_config) for an edited
+    config. Values are computed on first access and cached on the
+    instance. The instance is frozen and hashes by config value; it
+    keeps a __dict__ (no slots) because that is where cached_property
+    stores the values.
     """
     
     config: BoxConfig
@@ -37,6 +123,8 @@ class DerivedConfig:
     # Standard dimensions
     RAIL_WIDTH = 5.0  # Rail width mm
     RAIL_DEPTH = 4.0  # Rail depth mm
+    RAIL_ANGLE = 45.0  # V-rail angle degrees
+    V_TAN_HALF = math.tan(math.radians(RAIL_ANGLE / 2))  # V depth per half width
     DUST_LIP = 1.0    # Dust lip height mm
     DUST_SHELF = 0.8  # Dust shelf on drawer mm
     RAIL_WINDOW_SPACING = 35.0  # Rail window spacing mm
@@ -61,92 +149,197 @@ class DerivedConfig:
     SLOT_WIDTH = 2.4       # Universal slot width mm
     SLOT_DEPTH = 3.0       # Universal slot depth mm
     
-    @property
-    def base_tolerance(self) -> float:
-        """Base tolerance for material."""
-        tolerances = {
-            MaterialType.HYPER_PLA: 0.30,
-            MaterialType.PETG: 0.40,
-            MaterialType.ABS: 0.35,
-        }
-        return tolerances[self.config.material]
+    def __post_init__(self):
+        """Keep a private copy of the config (see class docstring)."""
+        object.__setattr__(
+            self, "config", BoxConfig.from_frozen(self.config.freeze())
+        )
     
-    @property
-    def tolerances(self) -> Dict[str, float]:
-        """Separate tolerances by use case."""
-        base = self.base_tolerance
+    def __hash__(self) -> int:
+        """Hash by config value, consistent with dataclass equality."""
+        return hash(self.config.freeze())
+    
+    @classmethod
+    def from_config(cls, config: BoxConfig) -> "DerivedConfig":
+        """
+        Shared DerivedConfig for a configuration.
+        
+        Equal configurations (e.g. every level of a stack) get the same
+        instance, built from a private copy of the configuration, so
+        later edits to ``config`` do not leak into the cached result.
+        Treat the returned object as read-only.
+        
+        Args:
+            config: Box configuration
+        
+        Returns:
+            Cached DerivedConfig
+        """
+        return _derived_from_frozen(config.freeze())
+    
+    @classmethod
+    def batch(cls, configs: List[BoxConfig]) -> Dict[str, "np.ndarray"]:
+        """
+        Evaluate the dimensional values for many configs at once.
+        
+        Same formulas as the per-instance properties, computed as
+        NumPy array expressions over all configs.
+        
+        Args:
+            configs: Box configurations
+        
+        Returns:
+            Dict of property name -> float array, one entry per config
+        """
+        if not HAS_NUMPY:
+            raise RuntimeError("numpy not available")
+        
+        width = np.array([c.width for c in configs], dtype=np.float64)
+        depth = np.array([c.depth for c in configs], dtype=np.float64)
+        height = np.array([c.height for c in configs], dtype=np.float64)
+        stacked = np.array([c.stack_levels > 2 for c in configs])
+        wall_mount = np.array([c.mount == "wall" for c in configs])
+        tol_slide = np.array(
+            [_BASE_TOLERANCE[c.material] for c in configs], dtype=np.float64
+        )
+        
+        area = width * height / 1000
+        base = np.select(
+            [area > 240, area > 160, area > 100], [3.6, 3.2, 2.4], 2.0
+        )
+        base = base + 0.4 * (stacked.astype(np.int64) + wall_mount)
+        wall = np.round(base * _INV_NOZZLE) * _NOZZLE
+        
+        floor = np.maximum(2.0, wall)
+        inner_w = width - 2 * wall
+        inner_d = depth - 2 * wall
+        inner_h = height - floor
+        rail_height = floor + 15.0
+        between_rails = inner_w - 2 * cls.RAIL_WIDTH
+        drawer_w = between_rails - 2 * tol_slide
+        front_panel = np.maximum(2.0, wall)
+        drawer_d = inner_d - 5.0 - front_panel
+        drawer_h = height - rail_height - 5.0 - tol_slide
+        drawer_wall = wall * 0.75
+        drawer_floor = np.maximum(1.6, wall * 0.8)
+        
         return {
-            "slide": base,              # Drawer/rails
-            "snap": base * 0.7,         # Snap-fits (tighter)
-            "pressfit": base * 0.5,     # Magnets/NFC (very tight)
-            "loose": base * 1.3,        # Easy fit
+            "wall_thickness": wall,
+            "floor_thickness": floor,
+            "tol_slide": tol_slide,
+            "shell_inner_width": inner_w,
+            "shell_inner_depth": inner_d,
+            "shell_inner_height": inner_h,
+            "rail_height_from_floor": rail_height,
+            "space_between_rails": between_rails,
+            "effective_inner_width": drawer_w,
+            "effective_inner_depth": inner_d,
+            "effective_inner_height": inner_h,
+            "front_panel_thickness": front_panel,
+            "drawer_body_width": drawer_w + 2 * 2.0,
+            "drawer_width": drawer_w,
+            "drawer_depth": drawer_d,
+            "drawer_height": drawer_h,
+            "drawer_wall_thickness": drawer_wall,
+            "drawer_floor_thickness": drawer_floor,
+            "drawer_inner_width": drawer_w - 2 * drawer_wall,
+            "drawer_inner_depth": drawer_d - 2 * drawer_wall,
+            "drawer_inner_height": drawer_h - drawer_floor,
         }
     
-    @property
+    @cached_property
+    def base_tolerance(self) -> float:
+        """Base tolerance for material."""
+        return _BASE_TOLERANCE[self.config.material]
+    
+    @cached_property
+    def tolerances(self) -> Mapping[str, float]:
+        """Separate tolerances by use case (shared, read-only)."""
+        base = self.base_tolerance
+        return MappingProxyType({
+            use: base * factor for use, factor in _TOLERANCE_FACTORS.items()
+        })
+    
+    @cached_property
+    def tol_slide(self) -> float:
+        """Slide tolerance (drawer/rails)."""
+        return self.base_tolerance
+    
+    @cached_property
+    def tol_snap(self) -> float:
+        """Snap-fit tolerance."""
+        return self.base_tolerance * _TOLERANCE_FACTORS["snap"]
+    
+    @cached_property
+    def tol_pressfit(self) -> float:
+        """Pressfit tolerance (magnets/NFC)."""
+        return self.base_tolerance * _TOLERANCE_FACTORS["pressfit"]
+    
+    @cached_property
+    def tol_loose(self) -> float:
+        """Loose fit tolerance."""
+        return self.base_tolerance * _TOLERANCE_FACTORS["loose"]
+    
+    @cached_property
     def wall_thickness(self) -> float:
         """Adaptive wall thickness based on size and load."""
-        base = 2.0
+        cfg = self.config
         
         # Reinforce based on side wall area
-        area = self.config.width * self.config.height / 1000  # cm²
-        if area > 240:      # > 300×80 или 200×120
-            base = 3.6
-        elif area > 160:    # > 200×80
-            base = 3.2
-        elif area > 100:    # > 200×50
-            base = 2.4
-        
-        # Reinforce for stacking
-        if self.config.stack_levels > 2:
-            base += 0.4
-        
-        # Reinforce for wall mount
-        if self.config.mount == "wall":
-            base += 0.4
+        area = cfg.width * cfg.height / 1000  # cm²
+        base = (
+            3.6 if area > 240       # > 300×80 или 200×120
+            else 3.2 if area > 160  # > 200×80
+            else 2.4 if area > 100  # > 200×50
+            else 2.0
+        )
+        
+        # Reinforce for stacking and for wall mount
+        base += 0.4 * ((cfg.stack_levels > 2) + (cfg.mount == "wall"))
         
         # Round to nozzle multiple (0.4mm)
-        return round(base / 0.4) * 0.4
+        return round(base * _INV_NOZZLE) * _NOZZLE
     
-    @property
+    @cached_property
     def floor_thickness(self) -> float:
         """Floor thickness (same as or thicker than walls)."""
         # Floor should not be thinner than walls for structural integrity
         return max(2.0, self.wall_thickness)
     
-    @property
+    @cached_property
     def shell_inner_width(self) -> float:
         """Shell internal cavity width."""
         return self.config.width - 2 * self.wall_thickness
     
-    @property
+    @cached_property
     def shell_inner_depth(self) -> float:
         """Shell internal cavity depth."""
         return self.config.depth - 2 * self.wall_thickness
     
-    @property
+    @cached_property
     def shell_inner_height(self) -> float:
         """Shell internal cavity height."""
         return self.config.height - self.floor_thickness
     
-    @property
+    @cached_property
     def rail_height_from_floor(self) -> float:
         """Height where rails sit (from bottom of shell)."""
         return self.floor_thickness + 15.0  # 15mm above floor
     
-    @property
+    @cached_property
     def space_between_rails(self) -> float:
         """Horizontal space between left and right rails."""
         return self.shell_inner_width - 2 * self.RAIL_WIDTH
     
-    @property
+    @cached_property
     def effective_inner_width(self) -> float:
         """DEPRECATED: Use drawer_width instead.
         
         Real internal width after rails and tolerances.
         """
-        return self.space_between_rails - 2 * self.tolerances["slide"]
+        return self.space_between_rails - 2 * self.tol_slide
     
-    @property
+    @cached_property
     def effective_inner_depth(self) -> float:
         """DEPRECATED: Use shell_inner_depth instead.
         
@@ -154,7 +347,7 @@ class DerivedConfig:
         """
         return self.shell_inner_depth
     
-    @property
+    @cached_property
     def effective_inner_height(self) -> float:
         """DEPRECATED: Use shell_inner_height instead.
         
@@ -162,7 +355,7 @@ class DerivedConfig:
         """
         return self.shell_inner_height
     
-    @property
+    @cached_property
     def drawer_body_width(self) -> float:
         """Drawer body width BEFORE V-grooves are cut.
         
@@ -174,19 +367,19 @@ class DerivedConfig:
         v_groove_depth = 2.0
         return (
             self.space_between_rails
-            - 2 * self.tolerances["slide"]
+            - 2 * self.tol_slide
             + 2 * v_groove_depth  # Add back what will be removed
         )
     
-    @property
+    @cached_property
     def drawer_width(self) -> float:
         """Drawer width AFTER V-grooves (final sliding width).
         
         This is what actually slides between the rails.
         """
-        return self.space_between_rails - 2 * self.tolerances["slide"]
+        return self.space_between_rails - 2 * self.tol_slide
     
-    @property
+    @cached_property
     def drawer_depth(self) -> float:
         """Drawer outer depth."""
         back_clearance = 5.0  # Space at back for air/drainage
@@ -197,7 +390,7 @@ class DerivedConfig:
             - front_clearance
         )
     
-    @property
+    @cached_property
     def drawer_height(self) -> float:
         """Drawer outer height.
         
@@ -209,57 +402,57 @@ class DerivedConfig:
             self.config.height
             - self.rail_height_from_floor  # Start at rail level
             - top_clearance
-            - self.tolerances["slide"]
+            - self.tol_slide
         )
     
-    @property
+    @cached_property
     def drawer_wall_thickness(self) -> float:
         """Drawer wall thickness (thinner than shell walls)."""
         return self.wall_thickness * 0.75
     
-    @property
+    @cached_property
     def drawer_floor_thickness(self) -> float:
         """Drawer floor thickness."""
         return max(1.6, self.wall_thickness * 0.8)
     
-    @property
+    @cached_property
     def drawer_inner_width(self) -> float:
         """Drawer internal width for content."""
         return self.drawer_width - 2 * self.drawer_wall_thickness
     
-    @property
+    @cached_property
     def drawer_inner_depth(self) -> float:
         """Drawer internal DEPTH for content (Y-axis)."""
         return self.drawer_depth - 2 * self.drawer_wall_thickness
     
-    @property
+    @cached_property
     def drawer_inner_height(self) -> float:
         """Drawer internal HEIGHT for content (Z-axis)."""
         return self.drawer_height - self.drawer_floor_thickness
     
-    @property
+    @cached_property
     def front_panel_thickness(self) -> float:
         """Front panel thickness."""
         return max(2.0, self.wall_thickness)
     
-    @property
+    @cached_property
     def front_opening_width(self) -> float:
         """Width of front opening in shell (П-shape)."""
         return self.shell_inner_width  # Full width between walls
     
-    @property
+    @cached_property
     def front_opening_height(self) -> float:
         """Height of front opening in shell."""
         # Leave small lip at top for structural integrity
         top_lip = 5.0
         return self.shell_inner_height - top_lip
     
-    @property
+    @cached_property
     def front_opening_depth(self) -> float:
         """Depth of front opening cut (to punch through wall)."""
         return self.wall_thickness * 2  # Cut through front wall completely
     
-    @property
+    @cached_property
     def divider_count(self) -> Tuple[int, int]:
         """Auto-calculate divider count based on target cell size."""
         if self.config.dividers == DividerLayout.NONE:
@@ -267,12 +460,7 @@ class DerivedConfig:
         
         if self.config.dividers != DividerLayout.AUTO:
             # Fixed layout mapping
-            layouts = {
-                DividerLayout.GRID_2X2: (1, 1),
-                DividerLayout.GRID_2X3: (1, 2),
-                DividerLayout.GRID_3X3: (2, 2),
-            }
-            return layouts.get(self.config.dividers, (0, 0))
+            return _FIXED_DIVIDER_LAYOUTS.get(self.config.dividers, (0, 0))
         
         # Auto-calculate
         target_w, target_d = self.config.target_cell_size
@@ -290,11 +478,11 @@ class DerivedConfig:
         
         return (cols, rows)
     
-    @property
-    def features_enabled(self) -> Dict[str, bool]:
-        """Auto-disable features for small sizes."""
+    @cached_property
+    def features_enabled(self) -> Mapping[str, bool]:
+        """Auto-disable features for small sizes (shared, read-only)."""
         inner_w = self.effective_inner_width
-        return {
+        return MappingProxyType({
             "label": inner_w >= 60,
             "led_slot": inner_w >= 100,
             "dividers": inner_w >= 50,
@@ -303,9 +491,10 @@ class DerivedConfig:
             "shadow_gap": self.config.print_mode != PrintMode.DRAFT,
             "guide_cones": True,
             "service_channel": self.config.mechanics.service_channel,
-        }
+            **_PRINT_MODE_DETAILS[self.config.print_mode],
+        })
     
-    @property
+    @cached_property
     def connection_auto(self) -> ConnectionType:
         """Smart connection type selection."""
         cfg = self.config
@@ -329,38 +518,30 @@ class DerivedConfig:
         # Default to user selection
         return cfg.connection
     
-    @property
+    @cached_property
     def lead_in_length(self) -> float:
         """Lead-in zone length for anti-jam."""
         return min(15.0, self.effective_inner_depth * 0.1)
     
-    @property
+    @cached_property
     def lead_in_tolerance(self) -> float:
         """Extra tolerance at lead-in zone."""
         return 0.1  # +0.1mm at entry
     
-    @property
+    @cached_property
     def acoustic_tab_dims(self) -> Tuple[float, float, float]:
         """Acoustic resonator tab dimensions (w, h, d)."""
         return (0.8, 6.0, 18.0)
     
-    @property
-    def whisker_params(self) -> Dict[str, float]:
-        """Spring whisker parameters based on variant."""
-        variants = {
-            "soft_s":  {"thickness": 0.8, "length": 12.0},
-            "soft_l":  {"thickness": 0.8, "length": 18.0},
-            "med_s":   {"thickness": 1.0, "length": 12.0},
-            "med_l":   {"thickness": 1.0, "length": 18.0},
-            "firm_s":  {"thickness": 1.2, "length": 12.0},
-            "firm_l":  {"thickness": 1.2, "length": 18.0},
-        }
-        return variants.get(
+    @cached_property
+    def whisker_params(self) -> Mapping[str, float]:
+        """Spring whisker parameters based on variant (shared, read-only)."""
+        return _WHISKER_VARIANTS.get(
             self.config.mechanics.whisker_variant.value,
-            variants["med_l"]
+            _WHISKER_VARIANTS["med_l"]
         )
     
-    @property
+    @cached_property
     def shadow_gap_size(self) -> float:
         """Shadow gap size based on print mode."""
         if self.config.print_mode == PrintMode.DRAFT:
@@ -369,20 +550,20 @@ class DerivedConfig:
             return 0.5
         return 0.4
     
-    @property
-    def pattern_params(self) -> Dict:
-        """Pattern parameters for Belovodye."""
+    @cached_property
+    def pattern_params(self) -> Mapping:
+        """Pattern parameters for Belovodye (shared, read-only)."""
         if self.config.pattern.type.value == "none":
-            return {}
+            return MappingProxyType({})
         
-        return {
+        return MappingProxyType({
             "type": self.config.pattern.type.value,
             "position": self.config.pattern.position.value,
             "spacing": self.config.pattern.spacing,
             "band_height": self.config.pattern.band_height,
             "groove_depth": self.config.pattern.groove_depth,
             "groove_width": self.config.pattern.groove_width,
-        }
+        })
     
     def validate(self) -> list[str]:
         """Validate derived parameters and return warnings."""
@@ -425,8 +606,8 @@ Floor thickness: {self.floor_thickness} mm
 Drawer wall: {self.drawer_wall_thickness:.2f} mm
 Drawer floor: {self.drawer_floor_thickness:.2f} mm
 
-Tolerance (slide): {self.tolerances['slide']} mm
-Tolerance (snap): {self.tolerances['snap']} mm
+Tolerance (slide): {self.tol_slide} mm
+Tolerance (snap): {self.tol_snap} mm
 
 Dividers: {self.divider_count[0]+1}×{self.divider_count[1]+1} grid
 Connection: {self.connection_auto.value}
@@ -437,3 +618,9 @@ Features enabled:
   - Shadow gap: {self.features_enabled['shadow_gap']}
   - Service channel: {self.features_enabled['service_channel']}
 """
+
+
+@lru_cache(maxsize=64)
+def _derived_from_frozen(frozen: tuple) -> DerivedConfig:
+    """Build a DerivedConfig from a BoxConfig.freeze() snapshot."""
+    return DerivedConfig(BoxConfig.from_frozen(frozen))
@@ -16,11 +16,7 @@ try:
 except ImportError:
     HAS_BPY = False
 
-
-def ensure_bpy():
-    """Check if bpy is available."""
-    if not HAS_BPY:
-        raise RuntimeError("Blender Python API (bpy) not available")
+from ..geometry.primitives import ensure_bpy
 
 
 @dataclass
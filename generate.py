@@ -27,8 +27,13 @@ Examples:
 """
 
 import argparse
+import hashlib
+import os
+import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, List, Optional
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
@@ -87,7 +92,7 @@ def generate_storage_box(
         return {}
     
     # Compute derived parameters
-    derived = DerivedConfig(config)
+    derived = DerivedConfig.from_config(config)
     
     # Validate
     warnings = derived.validate()
@@ -106,10 +111,10 @@ def generate_storage_box(
     setup_scene()
     
     # Import component builders
-    from storage_box.components import build_shell, build_drawer
-    from storage_box.components.dividers import build_divider_set
-    from storage_box.tests import build_complete_test_kit
-    from storage_box.export import export_component_set
+    from .components import build_shell, build_drawer
+    from .components.dividers import build_divider_set
+    from .tests import build_complete_test_kit
+    from .export import export_component_set
     
     components = {}
     
@@ -165,12 +170,12 @@ def generate_test_only(
         print("Error: Blender Python API required")
         return {}
     
-    derived = DerivedConfig(config)
+    derived = DerivedConfig.from_config(config)
     
     setup_scene()
     
-    from storage_box.tests import build_complete_test_kit
-    from storage_box.export import export_stl
+    from .tests import build_complete_test_kit
+    from .export import export_stl
     
     test_kit = build_complete_test_kit(derived)
     
@@ -196,8 +201,7 @@ def generate_test_only(
 def load_config_from_yaml(yaml_path: Path) -> BoxConfig:
     """Load BoxConfig from YAML file."""
     manager = ConfigManager(yaml_path.parent)
-    yaml_config = manager.load(yaml_path.stem)
-    return manager.to_box_config(yaml_config)
+    return manager.load(yaml_path.stem)
 
 
 def get_preset_config(preset_name: str) -> BoxConfig:
@@ -211,6 +215,96 @@ def get_preset_config(preset_name: str) -> BoxConfig:
     return manager.to_box_config(yaml_config)
 
 
+def generate_catalog(
+    config_files: List[Path],
+    output_dir: Path,
+    workers: Optional[int] = None,
+    blender: str = "blender",
+    timeout: float = 600,
+) -> Dict[str, bool]:
+    """
+    Generate a catalog of boxes, one background Blender process each.
+    
+    bpy cannot build several boxes in parallel inside one process, so
+    each YAML config is generated by its own ``blender --background``
+    run of this module's main(). Variants are independent, so the
+    processes run concurrently. A variant counts as built only if
+    Blender exits cleanly and its STL/manifest files were written; a
+    config whose content hash matches the marker left by such a run
+    is skipped.
+    
+    Runs outside Blender; bpy is not needed here.
+    
+    Args:
+        config_files: YAML configuration files, one per variant
+        output_dir: Directory for per-variant output subdirectories
+        workers: Concurrent Blender processes (default: CPU count)
+        blender: Blender executable
+        timeout: Seconds allowed per variant
+    
+    Returns:
+        Dict of config name -> success (skipped variants count as success)
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Import this module as part of its package inside Blender; running
+    # the file itself with --python breaks the relative imports
+    package_dir = Path(__file__).resolve().parent
+    worker = (
+        "import importlib, sys; "
+        f"sys.path.insert(0, {str(package_dir.parent)!r}); "
+        f"importlib.import_module({package_dir.name + '.generate'!r}).main()"
+    )
+    
+    def build(config_file: Path) -> bool:
+        variant_dir = output_dir / config_file.stem
+        marker = variant_dir / ".config_hash"
+        expected = [
+            variant_dir / "shell.stl",
+            variant_dir / "print_manifest.yaml",
+        ]
+        digest = hashlib.sha256(config_file.read_bytes()).hexdigest()
+        
+        if marker.exists() and marker.read_text() == digest:
+            return True
+        
+        # Clear the previous run so only fresh output counts
+        for path in [marker, *expected]:
+            path.unlink(missing_ok=True)
+        
+        cmd = [
+            blender,
+            "--background",
+            "--python-exit-code", "1",
+            "--python-expr", worker,
+            "--",
+            "--config", str(config_file),
+            "--output", str(variant_dir),
+        ]
+        try:
+            result = subprocess.run(
+                cmd, capture_output=True, text=True, timeout=timeout
+            )
+        except subprocess.TimeoutExpired:
+            return False
+        
+        if result.returncode != 0:
+            return False
+        if not all(path.exists() for path in expected):
+            return False
+        
+        marker.write_text(digest)
+        return True
+    
+    # Threads only wait on the Blender processes, which do the work
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        results = pool.map(build, config_files)
+        return {
+            config_file.stem: ok
+            for config_file, ok in zip(config_files, results)
+        }
+
+
 def main():
     """Main entry point."""
     # Parse arguments after '--' separator
@@ -12,11 +12,50 @@ try:
 except ImportError:
     HAS_BPY = False
 
+from .csg_manifold import csg_compose, replace_mesh_data
+from .primitives import ensure_bpy
 
-def ensure_bpy():
-    """Check if bpy is available."""
-    if not HAS_BPY:
-        raise RuntimeError("Blender Python API (bpy) not available")
+
+def ensure_object_mode() -> None:
+    """
+    Switch to Object mode once before a batch of modifier applies.
+    
+    modifier_apply only works in Object mode; checking once at the
+    start of a build avoids a mode switch per operation.
+    """
+    ensure_bpy()
+    
+    if bpy.context.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+
+def _apply_modifier(target: "bpy.types.Object", modifier_name: str) -> None:
+    """
+    Apply a modifier through a temporary context override.
+    
+    The operator sees ``target`` as the active and only selected
+    object without changing the scene's active object or selection,
+    so batch builds avoid selection updates between operations.
+    """
+    with bpy.context.temp_override(
+        object=target,
+        active_object=target,
+        selected_objects=[target],
+    ):
+        bpy.ops.object.modifier_apply(modifier=modifier_name)
+
+
+def _remove_tool(tool: "bpy.types.Object") -> None:
+    """
+    Delete a consumed boolean tool and its mesh if nothing else uses it.
+    
+    Meshes still referenced elsewhere (linked duplicates not yet
+    removed, or cached meshes held by a fake user) are kept.
+    """
+    mesh = tool.data
+    bpy.data.objects.remove(tool, do_unlink=True)
+    if mesh is not None and mesh.users == 0:
+        bpy.data.meshes.remove(mesh)
 
 
 def boolean_union(
@@ -45,11 +84,10 @@ def boolean_union(
     mod.object = tool
     
     if apply:
-        bpy.context.view_layer.objects.active = target
-        bpy.ops.object.modifier_apply(modifier=mod.name)
+        _apply_modifier(target, mod.name)
     
     if delete_tool:
-        bpy.data.objects.remove(tool, do_unlink=True)
+        _remove_tool(tool)
     
     return target
 
@@ -79,11 +117,10 @@ def boolean_difference(
     mod.object = tool
     
     if apply:
-        bpy.context.view_layer.objects.active = target
-        bpy.ops.object.modifier_apply(modifier=mod.name)
+        _apply_modifier(target, mod.name)
     
     if delete_tool:
-        bpy.data.objects.remove(tool, do_unlink=True)
+        _remove_tool(tool)
     
     return target
 
@@ -113,11 +150,49 @@ def boolean_intersect(
     mod.object = tool
     
     if apply:
-        bpy.context.view_layer.objects.active = target
-        bpy.ops.object.modifier_apply(modifier=mod.name)
+        _apply_modifier(target, mod.name)
     
     if delete_tool:
-        bpy.data.objects.remove(tool, do_unlink=True)
+        _remove_tool(tool)
+    
+    return target
+
+
+def _apply_batch(
+    target: "bpy.types.Object",
+    tools: List["bpy.types.Object"],
+    operation: str,
+    apply: bool,
+    delete_tools: bool,
+) -> "bpy.types.Object":
+    """
+    Run one boolean modifier with all tools as a collection operand.
+    
+    The exact solver then processes every tool in a single pass instead
+    of re-evaluating the growing target once per tool.
+    """
+    if not tools:
+        return target
+    
+    operands = bpy.data.collections.new(f"Boolean_{operation.title()}_Tools")
+    for tool in tools:
+        operands.objects.link(tool)
+    
+    mod = target.modifiers.new(
+        name=f"Boolean_{operation.title()}_Batch",
+        type='BOOLEAN'
+    )
+    mod.operation = operation
+    mod.operand_type = 'COLLECTION'
+    mod.collection = operands
+    
+    if apply:
+        _apply_modifier(target, mod.name)
+        bpy.data.collections.remove(operands)
+    
+    if delete_tools:
+        for tool in tools:
+            _remove_tool(tool)
     
     return target
 
@@ -129,12 +204,35 @@ def boolean_batch_difference(
     delete_tools: bool = True,
 ) -> "bpy.types.Object":
     """
-    Perform multiple boolean difference operations.
+    Perform multiple boolean difference operations in one pass.
     
     Args:
         target: Object to modify
         tools: List of objects to subtract
-        apply: Apply all modifiers immediately
+        apply: Apply the modifier immediately
+        delete_tools: Delete tool objects after operation
+    
+    Returns:
+        Modified target object
+    """
+    ensure_bpy()
+    
+    return _apply_batch(target, tools, 'DIFFERENCE', apply, delete_tools)
+
+
+def boolean_batch_union(
+    target: "bpy.types.Object",
+    tools: List["bpy.types.Object"],
+    apply: bool = True,
+    delete_tools: bool = True,
+) -> "bpy.types.Object":
+    """
+    Perform multiple boolean union operations in one pass.
+    
+    Args:
+        target: Object to modify
+        tools: List of objects to union with
+        apply: Apply the modifier immediately
         delete_tools: Delete tool objects after operation
     
     Returns:
@@ -142,23 +240,42 @@ def boolean_batch_difference(
     """
     ensure_bpy()
     
-    for i, tool in enumerate(tools):
-        mod = target.modifiers.new(
-            name=f"Boolean_Diff_{i}", 
-            type='BOOLEAN'
-        )
-        mod.operation = 'DIFFERENCE'
-        mod.object = tool
+    return _apply_batch(target, tools, 'UNION', apply, delete_tools)
+
+
+def boolean_compose(
+    target: "bpy.types.Object",
+    cutters: List["bpy.types.Object"],
+    unions: List["bpy.types.Object"],
+    delete_tools: bool = True,
+) -> "bpy.types.Object":
+    """
+    Subtract all cutters from target, then union all additive parts.
+    
+    Uses the manifold3d backend when it is installed and every operand
+    is a closed manifold; otherwise runs one batched difference and one
+    batched union through the boolean modifier.
     
-    if apply:
-        bpy.context.view_layer.objects.active = target
-        for mod in list(target.modifiers):
-            if mod.type == 'BOOLEAN':
-                bpy.ops.object.modifier_apply(modifier=mod.name)
+    Args:
+        target: Object to modify
+        cutters: Objects to subtract
+        unions: Objects to union with
+        delete_tools: Delete tool objects after operation
+    
+    Returns:
+        Modified target object
+    """
+    ensure_bpy()
+    
+    result = csg_compose(target, cutters, unions)
+    if result is None:
+        _apply_batch(target, cutters, 'DIFFERENCE', True, delete_tools)
+        return _apply_batch(target, unions, 'UNION', True, delete_tools)
     
+    replace_mesh_data(target, *result)
     if delete_tools:
-        for tool in tools:
-            bpy.data.objects.remove(tool, do_unlink=True)
+        for tool in cutters + unions:
+            _remove_tool(tool)
     
     return target
 
@@ -182,20 +299,14 @@ def join_objects(
     if not objects:
         raise ValueError("No objects to join")
     
-    # Deselect all
-    bpy.ops.object.select_all(action='DESELECT')
-    
-    # Select all objects to join
-    for obj in objects:
-        obj.select_set(True)
-    
-    # Set first as active
-    bpy.context.view_layer.objects.active = objects[0]
-    
-    # Join
-    bpy.ops.object.join()
+    # Join into the first object without touching the scene selection
+    with bpy.context.temp_override(
+        active_object=objects[0],
+        selected_editable_objects=objects,
+    ):
+        bpy.ops.object.join()
     
-    result = bpy.context.active_object
+    result = objects[0]
     result.name = name
     
     return result
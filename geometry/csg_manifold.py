@@ -0,0 +1,153 @@
+"""
+Manifold CSG backend for Storage Box geometry.
+
+Runs multi-tool boolean compositions with the manifold3d library on
+flat vertex/triangle arrays instead of Blender's boolean modifier.
+manifold3d is optional: when it is not installed, or an operand is not
+a closed manifold, callers fall back to the modifier path in
+boolean_ops.
+"""
+
+from typing import List, Optional, Tuple
+
+try:
+    import bpy
+    import numpy as np
+    HAS_BPY = True
+except ImportError:
+    HAS_BPY = False
+
+from .primitives import needs_loop_total
+
+try:
+    import manifold3d
+    HAS_MANIFOLD = True
+except ImportError:
+    HAS_MANIFOLD = False
+
+
+def _mesh_arrays(
+    obj: "bpy.types.Object",
+    to_local: "np.ndarray",
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Read an object's triangulated mesh as flat arrays.
+    
+    Args:
+        obj: Mesh object (modifiers are not evaluated)
+        to_local: 4x4 matrix from object space to the result space
+    
+    Returns:
+        Tuple of (float32 (N, 3) vertices, uint32 (M, 3) triangles)
+    """
+    mesh = obj.data
+    mesh.calc_loop_triangles()
+    
+    verts = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", verts)
+    verts = verts.reshape(-1, 3) @ to_local[:3, :3].T + to_local[:3, 3]
+    
+    tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.uint32)
+    mesh.loop_triangles.foreach_get("vertices", tris)
+    
+    return verts.astype(np.float32), tris.reshape(-1, 3)
+
+
+def _to_manifold(
+    obj: "bpy.types.Object",
+    to_local: "np.ndarray",
+) -> Optional["manifold3d.Manifold"]:
+    """Convert an object to a Manifold, or None if it is not closed."""
+    verts, tris = _mesh_arrays(obj, to_local)
+    solid = manifold3d.Manifold(
+        manifold3d.Mesh(vert_properties=verts, tri_verts=tris)
+    )
+    if solid.status() != manifold3d.Error.NoError:
+        return None
+    return solid
+
+
+def csg_compose(
+    target: "bpy.types.Object",
+    cutters: List["bpy.types.Object"],
+    unions: List["bpy.types.Object"],
+) -> Optional[Tuple["np.ndarray", "np.ndarray"]]:
+    """
+    Subtract all cutters from target, then add all unions, in one pass.
+    
+    Tool geometry is brought into the target's local space, so the
+    result can replace the target mesh in place.
+    
+    Args:
+        target: Base object
+        cutters: Objects to subtract
+        unions: Objects to add
+    
+    Returns:
+        Tuple of (vertices, triangles) in target space, or None if
+        manifold3d is unavailable or an operand is not manifold
+    """
+    if not HAS_MANIFOLD:
+        return None
+    
+    world_to_target = np.array(target.matrix_world.inverted(), dtype=np.float64)
+    
+    def convert(obj):
+        to_target = world_to_target @ np.array(obj.matrix_world, dtype=np.float64)
+        return _to_manifold(obj, to_target)
+    
+    base = _to_manifold(target, np.identity(4))
+    cutter_solids = [convert(obj) for obj in cutters]
+    union_solids = [convert(obj) for obj in unions]
+    if base is None or any(
+        solid is None for solid in cutter_solids + union_solids
+    ):
+        return None
+    
+    result = base
+    if cutter_solids:
+        result = manifold3d.Manifold.batch_boolean(
+            [result, *cutter_solids], manifold3d.OpType.Subtract
+        )
+    if union_solids:
+        result = manifold3d.Manifold.batch_boolean(
+            [result, *union_solids], manifold3d.OpType.Add
+        )
+    
+    out = result.to_mesh()
+    verts = np.asarray(out.vert_properties, dtype=np.float32)[:, :3]
+    tris = np.asarray(out.tri_verts, dtype=np.int32)
+    return verts, tris
+
+
+def replace_mesh_data(
+    obj: "bpy.types.Object",
+    verts: "np.ndarray",
+    tris: "np.ndarray",
+) -> None:
+    """
+    Overwrite an object's mesh with triangle data via foreach_set.
+    
+    Args:
+        obj: Object whose mesh is replaced
+        verts: (N, 3) vertex coordinates in object space
+        tris: (M, 3) triangle vertex indices
+    """
+    mesh = obj.data
+    mesh.clear_geometry()
+    
+    mesh.vertices.add(len(verts))
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(verts).reshape(-1))
+    mesh.loops.add(len(tris) * 3)
+    mesh.loops.foreach_set(
+        "vertex_index", np.ascontiguousarray(tris, dtype=np.int32).reshape(-1)
+    )
+    mesh.polygons.add(len(tris))
+    mesh.polygons.foreach_set(
+        "loop_start", np.arange(0, len(tris) * 3, 3, dtype=np.int32)
+    )
+    if needs_loop_total():
+        mesh.polygons.foreach_set(
+            "loop_total", np.full(len(tris), 3, dtype=np.int32)
+        )
+    mesh.update(calc_edges=True)
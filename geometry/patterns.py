@@ -11,6 +11,8 @@ Creates rune patterns for Belovodye style:
 import math
 from typing import List, Tuple, Optional, Dict
 
+from .primitives import create_box, ensure_bpy, shared_bmesh
+
 try:
     import bpy
     import bmesh
@@ -19,12 +21,6 @@ except ImportError:
     HAS_BPY = False
 
 
-def ensure_bpy():
-    """Check if bpy is available."""
-    if not HAS_BPY:
-        raise RuntimeError("Blender Python API (bpy) not available")
-
-
 def create_chevron_pattern(
     width: float,
     height: float,
@@ -52,7 +48,7 @@ def create_chevron_pattern(
     """
     ensure_bpy()
     
-    bm = bmesh.new()
+    bm = shared_bmesh()
     
     num_chevrons = int(width / spacing) + 1
     half_height = height / 2
@@ -91,7 +87,6 @@ def create_chevron_pattern(
     
     mesh = bpy.data.meshes.new(name)
     bm.to_mesh(mesh)
-    bm.free()
     
     obj = bpy.data.objects.new(name, mesh)
     bpy.context.collection.objects.link(obj)
@@ -128,7 +123,7 @@ def create_knot_pattern(
     """
     ensure_bpy()
     
-    bm = bmesh.new()
+    bm = shared_bmesh()
     
     segment_length = spacing * (1 - gap_ratio)
     gap_length = spacing * gap_ratio
@@ -155,7 +150,6 @@ def create_knot_pattern(
     
     mesh = bpy.data.meshes.new(name)
     bm.to_mesh(mesh)
-    bm.free()
     
     obj = bpy.data.objects.new(name, mesh)
     bpy.context.collection.objects.link(obj)
@@ -190,7 +184,7 @@ def create_wave_pattern(
     """
     ensure_bpy()
     
-    bm = bmesh.new()
+    bm = shared_bmesh()
     
     num_waves = int(width / spacing) + 1
     quarter_height = height / 4
@@ -224,7 +218,6 @@ def create_wave_pattern(
     
     mesh = bpy.data.meshes.new(name)
     bm.to_mesh(mesh)
-    bm.free()
     
     obj = bpy.data.objects.new(name, mesh)
     bpy.context.collection.objects.link(obj)
@@ -263,11 +256,9 @@ def create_pattern_band(
     ensure_bpy()
     
     # Create base box for the band
-    bpy.ops.mesh.primitive_cube_add(size=1, location=location)
-    band = bpy.context.active_object
-    band.name = name
-    band.scale = (width, extrusion_length, band_height)
-    bpy.ops.object.transform_apply(scale=True)
+    band = create_box(
+        width, extrusion_length, band_height, name=name, location=location
+    )
     
     # Create pattern grooves based on type
     pattern_funcs = {
@@ -332,27 +323,30 @@ def _create_groove_segment(
     px = -dz / length * (width / 2)
     pz = dx / length * (width / 2)
     
+    new_vert = bm.verts.new
+    new_face = bm.faces.new
+    
     # Create vertices for groove (rectangular cross-section)
     # Front face (Y=0)
-    v1 = bm.verts.new((x1 + px, 0, z1 + pz))
-    v2 = bm.verts.new((x1 - px, 0, z1 - pz))
-    v3 = bm.verts.new((x2 - px, 0, z2 - pz))
-    v4 = bm.verts.new((x2 + px, 0, z2 + pz))
+    v1 = new_vert((x1 + px, 0, z1 + pz))
+    v2 = new_vert((x1 - px, 0, z1 - pz))
+    v3 = new_vert((x2 - px, 0, z2 - pz))
+    v4 = new_vert((x2 + px, 0, z2 + pz))
     
     # Back face (Y=depth)
-    v5 = bm.verts.new((x1 + px, depth, z1 + pz))
-    v6 = bm.verts.new((x1 - px, depth, z1 - pz))
-    v7 = bm.verts.new((x2 - px, depth, z2 - pz))
-    v8 = bm.verts.new((x2 + px, depth, z2 + pz))
+    v5 = new_vert((x1 + px, depth, z1 + pz))
+    v6 = new_vert((x1 - px, depth, z1 - pz))
+    v7 = new_vert((x2 - px, depth, z2 - pz))
+    v8 = new_vert((x2 + px, depth, z2 + pz))
     
     # Create faces
     try:
-        bm.faces.new([v1, v2, v3, v4])  # Front
-        bm.faces.new([v8, v7, v6, v5])  # Back
-        bm.faces.new([v1, v4, v8, v5])  # Top
-        bm.faces.new([v2, v6, v7, v3])  # Bottom
-        bm.faces.new([v1, v5, v6, v2])  # Left
-        bm.faces.new([v4, v3, v7, v8])  # Right
+        new_face([v1, v2, v3, v4])  # Front
+        new_face([v8, v7, v6, v5])  # Back
+        new_face([v1, v4, v8, v5])  # Top
+        new_face([v2, v6, v7, v3])  # Bottom
+        new_face([v1, v5, v6, v2])  # Left
+        new_face([v4, v3, v7, v8])  # Right
     except ValueError:
         # Face already exists or invalid geometry
         pass
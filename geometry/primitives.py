@@ -5,13 +5,16 @@ Basic geometric shapes and profiles using Blender Python API (bpy).
 All functions work in headless mode for scripted generation.
 """
 
+import atexit
 import math
-from typing import Tuple, List, Optional
+from functools import lru_cache, wraps
+from typing import Callable, Dict, Tuple, List, Optional, Sequence
 
 # Try to import bpy, but allow running without Blender for testing
 try:
     import bpy
     import bmesh
+    import numpy as np
     from mathutils import Vector, Matrix
     HAS_BPY = True
 except ImportError:
@@ -25,6 +28,509 @@ def ensure_bpy():
         raise RuntimeError("Blender Python API (bpy) not available")
 
 
+def requires_bpy(fn: Callable) -> Callable:
+    """
+    Decorate a top-level builder with the bpy availability check.
+    
+    The check runs once at the builder's entry, so the builder and the
+    private helpers it calls can assume bpy and return concrete objects
+    instead of Optional ones.
+    
+    Args:
+        fn: Builder function
+    
+    Returns:
+        Wrapped builder
+    """
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        ensure_bpy()
+        return fn(*args, **kwargs)
+    
+    return wrapper
+
+
+_SHARED_BM = None
+
+
+def shared_bmesh() -> "bmesh.types.BMesh":
+    """
+    Return a cleared scratch BMesh shared by the bmesh-based builders.
+    
+    Builders write their geometry with ``to_mesh`` and never hold the
+    BMesh across calls, so one instance is reused instead of paying
+    for a ``bmesh.new()`` / ``free()`` pair per object. It is freed
+    at interpreter exit.
+    
+    Returns:
+        Empty BMesh
+    """
+    global _SHARED_BM
+    ensure_bpy()
+    
+    if _SHARED_BM is None:
+        _SHARED_BM = bmesh.new()
+        atexit.register(_SHARED_BM.free)
+    else:
+        _SHARED_BM.clear()
+    
+    return _SHARED_BM
+
+
+@lru_cache(maxsize=32)
+def prism_faces(count: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Face index table for a closed prism extruded from a profile.
+    
+    Vertices are expected as ``count`` front profile vertices followed
+    by the matching ``count`` back profile vertices. With the profile
+    running clockwise seen from the front and the back copy offset
+    along +Y, every face points outward.
+    
+    Args:
+        count: Number of vertices in the profile
+    
+    Returns:
+        Face index tuples (front, back, sides), cached per count
+    """
+    # Side quads run each profile edge i -> i+1; the front cap runs it
+    # backwards and the back cap is offset forwards, so every directed
+    # edge is used exactly once and all faces share one orientation
+    sides = tuple(
+        (i, (i + 1) % count, count + (i + 1) % count, count + i)
+        for i in range(count)
+    )
+    return (
+        tuple(range(count - 1, -1, -1)),
+        tuple(range(count, 2 * count)),
+    ) + sides
+
+
+@lru_cache(maxsize=32)
+def v_half_tan(angle: float) -> float:
+    """
+    Tangent of half a V angle: V point depth per unit half width.
+    
+    Args:
+        angle: Full V angle in degrees
+    
+    Returns:
+        tan(angle / 2)
+    """
+    return math.tan(math.radians(angle / 2))
+
+
+@lru_cache(maxsize=64)
+def cylinder_mesh_data(
+    radius: float,
+    depth: float,
+    vertices: int = 32,
+    axis: str = "Z",
+) -> Tuple["np.ndarray", Tuple[Tuple[int, ...], ...]]:
+    """
+    Vertex and face data for a capped cylinder centred on the origin.
+    
+    Matches the layout of bpy.ops.mesh.primitive_cylinder_add
+    (first ring vertex on +Y, n-gon caps) without the operator call.
+    Results are cached and read-only, so repeated cutters (magnet
+    pockets, honeycomb cells) share one template.
+    
+    Args:
+        radius: Cylinder radius
+        depth: Cylinder length along its axis
+        vertices: Number of vertices around circumference
+        axis: Cylinder axis ("X", "Y" or "Z")
+    
+    Returns:
+        Tuple of (vertex array, face list)
+    """
+    ensure_bpy()
+    
+    phi = np.arange(vertices) * (2 * math.pi / vertices)
+    
+    verts = np.empty((2 * vertices, 3), dtype=np.float32)
+    verts[:, 0] = np.tile(-radius * np.sin(phi), 2)
+    verts[:, 1] = np.tile(radius * np.cos(phi), 2)
+    verts[:vertices, 2] = -depth / 2
+    verts[vertices:, 2] = depth / 2
+    
+    # Rotate the Z-aligned cylinder onto the requested axis
+    if axis == "X":
+        verts = np.column_stack((verts[:, 2], verts[:, 1], -verts[:, 0]))
+    elif axis == "Y":
+        verts = np.column_stack((verts[:, 0], -verts[:, 2], verts[:, 1]))
+    
+    faces = [
+        tuple(range(vertices - 1, -1, -1)),
+        tuple(range(vertices, 2 * vertices)),
+    ]
+    for i in range(vertices):
+        next_i = (i + 1) % vertices
+        faces.append((i, next_i, vertices + next_i, vertices + i))
+    
+    verts.flags.writeable = False
+    return verts, tuple(faces)
+
+
+@lru_cache(maxsize=64)
+def cone_mesh_data(
+    radius1: float,
+    radius2: float,
+    depth: float,
+    vertices: int = 32,
+) -> Tuple["np.ndarray", Tuple[Tuple[int, ...], ...]]:
+    """
+    Vertex and face data for a Z-aligned cone centred on the origin.
+    
+    Matches bpy.ops.mesh.primitive_cone_add: a zero top radius
+    collapses the top ring into a single apex vertex. Results are
+    cached and read-only.
+    
+    Args:
+        radius1: Base radius (at -depth / 2)
+        radius2: Top radius (at +depth / 2), 0 for a pointed cone
+        depth: Cone height
+        vertices: Number of vertices around circumference
+    
+    Returns:
+        Tuple of (vertex array, face list)
+    """
+    ensure_bpy()
+    
+    phi = np.arange(vertices) * (2 * math.pi / vertices)
+    ring = np.column_stack((-np.sin(phi), np.cos(phi)))
+    
+    base = np.column_stack((radius1 * ring, np.full(vertices, -depth / 2)))
+    faces = [tuple(range(vertices - 1, -1, -1))]
+    
+    if radius2 > 0:
+        top = np.column_stack((radius2 * ring, np.full(vertices, depth / 2)))
+        faces.append(tuple(range(vertices, 2 * vertices)))
+        for i in range(vertices):
+            next_i = (i + 1) % vertices
+            faces.append((i, next_i, vertices + next_i, vertices + i))
+    else:
+        top = np.array([(0, 0, depth / 2)])
+        for i in range(vertices):
+            faces.append((i, (i + 1) % vertices, vertices))
+    
+    verts = np.concatenate([base, top]).astype(np.float32)
+    verts.flags.writeable = False
+    return verts, tuple(faces)
+
+
+# Unit cube corners: bottom ring then top ring, counter-clockwise
+_BOX_CORNERS = (
+    (-1, -1, -1), (1, -1, -1), (1, 1, -1), (-1, 1, -1),
+    (-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1),
+)
+_BOX_FACES = (
+    (3, 2, 1, 0), (4, 5, 6, 7),
+    (0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7),
+)
+
+
+@lru_cache(maxsize=64)
+def box_mesh_data(
+    width: float,
+    depth: float,
+    height: float,
+) -> Tuple["np.ndarray", Tuple[Tuple[int, ...], ...]]:
+    """
+    Vertex and face data for a box centred on the origin.
+    
+    The scale is baked into the vertices, so no transform_apply
+    pass is needed afterwards. Results are cached and read-only.
+    
+    Args:
+        width: X dimension
+        depth: Y dimension
+        height: Z dimension
+    
+    Returns:
+        Tuple of (vertex array, face list)
+    """
+    ensure_bpy()
+    
+    half = np.array([width / 2, depth / 2, height / 2], dtype=np.float32)
+    verts = np.array(_BOX_CORNERS, dtype=np.float32) * half
+    verts.flags.writeable = False
+    return verts, _BOX_FACES
+
+
+def tile_mesh_data(
+    verts: "np.ndarray",
+    faces: Sequence[Sequence[int]],
+    offsets: Sequence[Tuple[float, float, float]],
+) -> Tuple["np.ndarray", List[Tuple[int, ...]]]:
+    """
+    Copy one mesh template to several offsets as a single mesh.
+    
+    Used to fuse repeated cutters (cells, grooves, holes) into one
+    object so a single boolean pass replaces one pass per cutter.
+    
+    Args:
+        verts: Template vertex array (N, 3)
+        faces: Template face indices
+        offsets: Translation for each copy
+    
+    Returns:
+        Tuple of (vertex array, face list)
+    """
+    ensure_bpy()
+    
+    offsets = np.asarray(offsets, dtype=np.float32).reshape(-1, 3)
+    count = len(verts)
+    
+    tiled = (verts[None, :, :] + offsets[:, None, :]).reshape(-1, 3)
+    tiled_faces = [
+        tuple(i + k * count for i in face)
+        for k in range(len(offsets))
+        for face in faces
+    ]
+    
+    return tiled, tiled_faces
+
+
+def merge_mesh_data(
+    parts: Sequence[Tuple[
+        "np.ndarray", Sequence[Sequence[int]], Tuple[float, float, float]
+    ]],
+) -> Tuple["np.ndarray", List[Tuple[int, ...]], "np.ndarray"]:
+    """
+    Concatenate different meshes, each at its own offset, into one mesh.
+    
+    Like tile_mesh_data, but for distinct shapes (e.g. the parts of an
+    assembly). The part index of every face is returned so callers can
+    keep the parts addressable, e.g. through polygon material indices.
+    
+    Args:
+        parts: (vertex array, face indices, offset) for each part
+    
+    Returns:
+        Tuple of (vertex array, face list, per-face part index array)
+    """
+    ensure_bpy()
+    
+    verts = np.concatenate([
+        np.asarray(part_verts, dtype=np.float32)
+        + np.asarray(offset, dtype=np.float32)
+        for part_verts, _, offset in parts
+    ])
+    
+    faces = []
+    face_parts = []
+    base = 0
+    for index, (part_verts, part_faces, _) in enumerate(parts):
+        faces.extend(tuple(i + base for i in face) for face in part_faces)
+        face_parts.append(np.full(len(part_faces), index, dtype=np.int32))
+        base += len(part_verts)
+    
+    return verts, faces, np.concatenate(face_parts)
+
+
+def needs_loop_total() -> bool:
+    """
+    Whether polygon sizes must be written to ``polygons.loop_total``.
+    
+    Blender 4.0 derives them from ``loop_start``; older versions need
+    them set explicitly, or every polygon ends up with zero loops.
+    """
+    return bpy.app.version < (4, 0, 0)
+
+
+def create_mesh_object(
+    name: str,
+    verts: Sequence[Sequence[float]],
+    faces: Sequence[Sequence[int]],
+    location: Tuple[float, float, float] = (0, 0, 0),
+    link: bool = True,
+) -> "bpy.types.Object":
+    """
+    Create a mesh object directly from vertex and face data.
+    
+    Vertex coordinates and face indices are uploaded as flat arrays
+    with ``foreach_set``, so no Python-level loop runs per vertex or
+    per face (unlike bmesh or ``from_pydata``).
+    
+    Args:
+        name: Object and mesh name
+        verts: Vertex coordinates (list or (N, 3) array)
+        faces: Face vertex indices
+        location: Object location
+        link: Link to the active collection (see link_objects)
+    
+    Returns:
+        Blender object
+    """
+    ensure_bpy()
+    
+    coords = np.asarray(verts, dtype=np.float32).reshape(-1)
+    loop_totals = np.fromiter(map(len, faces), dtype=np.int32, count=len(faces))
+    loop_starts = np.zeros(len(faces), dtype=np.int32)
+    np.cumsum(loop_totals[:-1], out=loop_starts[1:])
+    loop_verts = np.fromiter(
+        (i for face in faces for i in face),
+        dtype=np.int32,
+        count=int(loop_totals.sum()),
+    )
+    
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(coords) // 3)
+    mesh.vertices.foreach_set("co", coords)
+    mesh.loops.add(len(loop_verts))
+    mesh.loops.foreach_set("vertex_index", loop_verts)
+    mesh.polygons.add(len(faces))
+    mesh.polygons.foreach_set("loop_start", loop_starts)
+    if needs_loop_total():
+        mesh.polygons.foreach_set("loop_total", loop_totals)
+    mesh.update(calc_edges=True)
+    
+    obj = bpy.data.objects.new(name, mesh)
+    if link:
+        bpy.context.collection.objects.link(obj)
+    obj.location = location
+    
+    return obj
+
+
+def link_objects(
+    objects: Sequence["bpy.types.Object"],
+    collection: Optional["bpy.types.Collection"] = None,
+) -> None:
+    """
+    Link a batch of unlinked objects to a collection in one pass.
+    
+    Builders called with ``link=False`` create objects off-scene;
+    linking them together afterwards avoids a scene update between
+    every object. Objects already in the collection are skipped.
+    
+    Args:
+        objects: Objects to link
+        collection: Target collection (active collection by default)
+    """
+    ensure_bpy()
+    
+    target = (collection or bpy.context.collection).objects
+    for obj in objects:
+        if obj.name not in target:
+            target.link(obj)
+
+
+def linked_duplicate(
+    obj: "bpy.types.Object",
+    name: str,
+    location: Optional[Tuple[float, float, float]] = None,
+    link: bool = True,
+) -> "bpy.types.Object":
+    """
+    Duplicate an object that shares the original's mesh datablock.
+    
+    Cheaper than rebuilding identical geometry: only a new object
+    is created, no mesh data is copied.
+    
+    Args:
+        obj: Object to duplicate
+        name: Name for the duplicate
+        location: Location for the duplicate (keeps original if None)
+        link: Link to the active collection
+    
+    Returns:
+        Duplicated object
+    """
+    ensure_bpy()
+    
+    dup = obj.copy()
+    dup.name = name
+    if location is not None:
+        dup.location = location
+    if link:
+        bpy.context.collection.objects.link(dup)
+    
+    return dup
+
+
+# Read-only tool meshes shared between builds, keyed by shape parameters
+_MESH_CACHE: Dict[tuple, "bpy.types.Mesh"] = {}
+
+
+def cached_mesh_object(
+    key: tuple,
+    build: Callable[[], Optional["bpy.types.Object"]],
+    name: Optional[str] = None,
+    location: Optional[Tuple[float, float, float]] = None,
+) -> Optional["bpy.types.Object"]:
+    """
+    Create an object whose mesh is shared with earlier identical builds.
+    
+    On the first call for ``key``, ``build`` creates the object and its
+    mesh is cached with a fake user, so it outlives the cutter objects
+    deleted after a boolean. Later calls only add a new object that
+    references the cached mesh.
+    
+    Only use this for tools and cutters whose mesh is never edited in
+    place: every object created for a key shares the same mesh. The
+    mesh is triangulated once when cached, so the boolean solver does
+    not re-triangulate it on every cut.
+    
+    Args:
+        key: Hashable description of the shape and all its parameters
+        build: Creates a fresh object on a cache miss
+        name: Object name (keeps the built/mesh name if None)
+        location: Object location (keeps the built location if None)
+    
+    Returns:
+        Blender object, or None if ``build`` returned None
+    """
+    ensure_bpy()
+    
+    mesh = _MESH_CACHE.get(key)
+    if mesh is not None:
+        try:
+            mesh.name
+        except ReferenceError:
+            # Mesh was removed from bpy.data (e.g. new file loaded)
+            mesh = None
+    
+    if mesh is None:
+        obj = build()
+        if obj is None:
+            return None
+        _triangulate_mesh(obj.data)
+        obj.data.use_fake_user = True
+        _MESH_CACHE[key] = obj.data
+    else:
+        obj = bpy.data.objects.new(name or mesh.name, mesh)
+        bpy.context.collection.objects.link(obj)
+    
+    if name is not None:
+        obj.name = name
+    if location is not None:
+        obj.location = location
+    
+    return obj
+
+
+def _triangulate_mesh(mesh: "bpy.types.Mesh") -> None:
+    """Triangulate a mesh in place (concave n-gons included)."""
+    bm = shared_bmesh()
+    bm.from_mesh(mesh)
+    bmesh.ops.triangulate(
+        bm, faces=bm.faces[:], quad_method='BEAUTY', ngon_method='BEAUTY'
+    )
+    bm.to_mesh(mesh)
+
+
+def clear_mesh_cache() -> None:
+    """Release all meshes held by cached_mesh_object."""
+    for mesh in _MESH_CACHE.values():
+        try:
+            mesh.use_fake_user = False
+        except ReferenceError:
+            pass
+    _MESH_CACHE.clear()
+
+
 def create_box(
     width: float, 
     depth: float, 
@@ -47,18 +553,8 @@ def create_box(
     """
     ensure_bpy()
     
-    bpy.ops.mesh.primitive_cube_add(
-        size=1,
-        location=location,
-    )
-    obj = bpy.context.active_object
-    obj.name = name
-    obj.scale = (width, depth, height)
-    
-    # Apply scale
-    bpy.ops.object.transform_apply(scale=True)
-    
-    return obj
+    verts, faces = box_mesh_data(width, depth, height)
+    return create_mesh_object(name, verts, faces, location)
 
 
 def create_cylinder(
@@ -83,16 +579,8 @@ def create_cylinder(
     """
     ensure_bpy()
     
-    bpy.ops.mesh.primitive_cylinder_add(
-        radius=radius,
-        depth=height,
-        vertices=vertices,
-        location=location,
-    )
-    obj = bpy.context.active_object
-    obj.name = name
-    
-    return obj
+    verts, faces = cylinder_mesh_data(radius, height, vertices)
+    return create_mesh_object(name, verts, faces, location)
 
 
 def create_plane(
@@ -115,17 +603,9 @@ def create_plane(
     """
     ensure_bpy()
     
-    bpy.ops.mesh.primitive_plane_add(
-        size=1,
-        location=location,
-    )
-    obj = bpy.context.active_object
-    obj.name = name
-    obj.scale = (width, depth, 1)
-    
-    bpy.ops.object.transform_apply(scale=True)
-    
-    return obj
+    hw, hd = width / 2, depth / 2
+    verts = [(-hw, -hd, 0), (hw, -hd, 0), (hw, hd, 0), (-hw, hd, 0)]
+    return create_mesh_object(name, verts, [(0, 1, 2, 3)], location)
 
 
 def create_v_rail(
@@ -152,58 +632,21 @@ def create_v_rail(
     """
     ensure_bpy()
     
-    # Create V profile using bmesh
-    bm = bmesh.new()
-    
     # Calculate V profile vertices
     half_width = width / 2
-    rad = math.radians(angle / 2)
-    v_depth = half_width * math.tan(rad)
-    
-    # Profile vertices (front face)
-    verts_front = [
-        bm.verts.new((-half_width, 0, 0)),           # Left top
-        bm.verts.new((0, 0, -v_depth)),              # Center bottom (V point)
-        bm.verts.new((half_width, 0, 0)),            # Right top
-        bm.verts.new((half_width, 0, depth)),        # Right top back
-        bm.verts.new((-half_width, 0, depth)),       # Left top back
-    ]
-    
-    # Profile vertices (back face)
-    verts_back = [
-        bm.verts.new((-half_width, length, 0)),
-        bm.verts.new((0, length, -v_depth)),
-        bm.verts.new((half_width, length, 0)),
-        bm.verts.new((half_width, length, depth)),
-        bm.verts.new((-half_width, length, depth)),
+    v_depth = half_width * v_half_tan(angle)
+    
+    # Profile (x, z), clockwise seen from the front so the faces
+    # prism_faces builds point outward
+    profile = [
+        (-half_width, depth),       # Left top back
+        (half_width, depth),        # Right top back
+        (half_width, 0),            # Right top
+        (0, -v_depth),              # Center bottom (V point)
+        (-half_width, 0),           # Left top
     ]
     
-    # Create faces
-    # Front face
-    bm.faces.new([verts_front[4], verts_front[3], 
-                  verts_front[2], verts_front[1], verts_front[0]])
-    # Back face
-    bm.faces.new([verts_back[0], verts_back[1], 
-                  verts_back[2], verts_back[3], verts_back[4]])
-    
-    # Side faces (connect front to back)
-    for i in range(5):
-        next_i = (i + 1) % 5
-        bm.faces.new([
-            verts_front[i], verts_front[next_i],
-            verts_back[next_i], verts_back[i]
-        ])
-    
-    # Create mesh and object
-    mesh = bpy.data.meshes.new(name)
-    bm.to_mesh(mesh)
-    bm.free()
-    
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
-    obj.location = location
-    
-    return obj
+    return extrude_profile(profile, length, name=name, location=location)
 
 
 def create_v_groove(
@@ -230,47 +673,19 @@ def create_v_groove(
     """
     ensure_bpy()
     
-    bm = bmesh.new()
-    
     # V groove is inverted V rail
     half_width = width / 2
-    rad = math.radians(angle / 2)
-    v_depth = half_width * math.tan(rad)
-    
-    # Profile vertices (groove pointing up into material)
-    verts_front = [
-        bm.verts.new((-half_width, 0, 0)),
-        bm.verts.new((0, 0, v_depth)),  # V point goes up
-        bm.verts.new((half_width, 0, 0)),
+    v_depth = half_width * v_half_tan(angle)
+    
+    # Profile (groove pointing up into material), clockwise seen
+    # from the front like the rail
+    profile = [
+        (-half_width, 0),
+        (0, v_depth),  # V point goes up
+        (half_width, 0),
     ]
     
-    verts_back = [
-        bm.verts.new((-half_width, length, 0)),
-        bm.verts.new((0, length, v_depth)),
-        bm.verts.new((half_width, length, 0)),
-    ]
-    
-    # Create faces
-    bm.faces.new([verts_front[0], verts_front[1], verts_front[2]])
-    bm.faces.new([verts_back[2], verts_back[1], verts_back[0]])
-    
-    # Side faces
-    bm.faces.new([verts_front[0], verts_back[0], 
-                  verts_back[1], verts_front[1]])
-    bm.faces.new([verts_front[1], verts_back[1], 
-                  verts_back[2], verts_front[2]])
-    bm.faces.new([verts_front[2], verts_back[2], 
-                  verts_back[0], verts_front[0]])
-    
-    mesh = bpy.data.meshes.new(name)
-    bm.to_mesh(mesh)
-    bm.free()
-    
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
-    obj.location = location
-    
-    return obj
+    return extrude_profile(profile, length, name=name, location=location)
 
 
 def create_chamfer_profile(
@@ -382,37 +797,20 @@ def extrude_profile(
     """
     ensure_bpy()
     
-    bm = bmesh.new()
-    
-    # Create front vertices
-    verts_front = [bm.verts.new((x, 0, z)) for x, z in profile]
-    
-    # Create back vertices
-    verts_back = [bm.verts.new((x, length, z)) for x, z in profile]
-    
-    # Create front face
-    if len(verts_front) >= 3:
-        bm.faces.new(verts_front)
+    # Front profile at Y=0, back copy at Y=length
+    front = np.zeros((len(profile), 3), dtype=np.float32)
+    front[:, [0, 2]] = profile
     
-    # Create back face (reversed)
-    if len(verts_back) >= 3:
-        bm.faces.new(list(reversed(verts_back)))
+    # prism_faces wants the profile clockwise in (x, z): flip
+    # counter-clockwise input so the normals point outward
+    x, z = front[:, 0], front[:, 2]
+    if np.dot(x, np.roll(z, -1)) - np.dot(z, np.roll(x, -1)) > 0:
+        front = front[::-1]
+    verts = np.concatenate([front, front + (0, length, 0)])
     
-    # Create side faces
-    n = len(profile)
-    for i in range(n):
-        next_i = (i + 1) % n
-        bm.faces.new([
-            verts_front[i], verts_front[next_i],
-            verts_back[next_i], verts_back[i]
-        ])
+    faces = prism_faces(len(profile))
+    if len(profile) < 3:
+        # No cap faces for a degenerate profile, only the sides
+        faces = faces[2:]
     
-    mesh = bpy.data.meshes.new(name)
-    bm.to_mesh(mesh)
-    bm.free()
-    
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
-    obj.location = location
-    
-    return obj
+    return create_mesh_object(name, verts, faces, location)
@@ -70,13 +70,118 @@ def test_derived_config():
     print(f"  Small box wall: {small_derived.wall_thickness}mm")
     print(f"  Large stacked wall: {large_derived.wall_thickness}mm")
 
+    # The config is snapshotted: later edits do not leave stale values
+    config = BoxConfig()
+    derived = DerivedConfig(config)
+    drawer_width = derived.drawer_width
+    config.width = 100
+    assert derived.drawer_width == drawer_width
+    assert DerivedConfig(config).drawer_width < drawer_width
+    assert hash(derived) == hash(DerivedConfig(BoxConfig()))
+    print("  Snapshot and hash OK")
+
     print("  DerivedConfig calculations correct")
     return True
 
 
+def test_derived_batch():
+    """Test DerivedConfig.batch against the per-instance properties."""
+    print("\n=== Test 4: Batched DerivedConfig ===")
+    import itertools
+    from .config import derived_config
+    from .config.box_config import BoxConfig
+    from .config.derived_config import DerivedConfig
+    from .config.enums import MaterialType
+
+    if not derived_config.HAS_NUMPY:
+        print("  numpy not installed, skipping")
+        return True
+
+    configs = [
+        BoxConfig(
+            width=width, depth=depth, height=height,
+            stack_levels=levels, mount=mount, material=material,
+        )
+        for width, depth, height, levels, mount, material in itertools.product(
+            (60.0, 150.0, 220.0, 300.0, 450.0, 600.0),
+            (80.0, 220.0, 400.0),
+            (30.0, 80.0, 120.0, 200.0),
+            (1, 3, 5),
+            ("table", "wall"),
+            list(MaterialType),
+        )
+    ]
+    batch = DerivedConfig.batch(configs)
+    for i, config in enumerate(configs):
+        derived = DerivedConfig(config)
+        for key, values in batch.items():
+            assert abs(values[i] - getattr(derived, key)) < 1e-9, (key, config)
+
+    print(f"  {len(configs)} configs x {len(batch)} values match")
+    return True
+
+
+def test_derived_from_config():
+    """Test that shared DerivedConfig matches a fresh one."""
+    print("\n=== Test 5: Shared DerivedConfig ===")
+    from .config.box_config import BoxConfig
+    from .config.derived_config import DerivedConfig
+    from .config.enums import BelovodiePreset, DesignStyle
+
+    # Edit a field the Belovodye preset sets
+    config = BoxConfig(
+        design=DesignStyle.BELOVODIE,
+        belovodie_preset=BelovodiePreset.MED,
+    )
+    assert config.sealed
+    config.sealed = False
+    shared = DerivedConfig.from_config(config)
+    assert shared.config.sealed is False
+    assert shared.summary() == DerivedConfig(config).summary()
+    print("  Preset edits survive from_config")
+
+    # List values (JSON/web input) can still key the cache
+    config.target_cell_size = [40, 60]
+    shared = DerivedConfig.from_config(config)
+    assert shared.divider_count == DerivedConfig(config).divider_count
+    print("  List fields are frozen to tuples")
+
+    # Cached dicts are shared by every from_config caller
+    for name in ("tolerances", "features_enabled", "whisker_params"):
+        try:
+            getattr(shared, name)["slide"] = 0.0
+        except TypeError:
+            pass
+        else:
+            raise AssertionError(f"{name} is mutable")
+    print("  Shared dicts are read-only")
+
+    return True
+
+
+def test_prism_faces():
+    """Test that prism face tables are closed and consistently wound."""
+    print("\n=== Test 6: Prism Faces ===")
+    from .geometry.primitives import prism_faces
+
+    # V-groove (primitives) 3, lead-in 4, V-rail and rail groove 5,
+    # dust lip 11, plus the neighbouring counts
+    for count in sorted({3, 4, 5, 11, *range(3, 13)}):
+        edges = [
+            (face[i], face[(i + 1) % len(face)])
+            for face in prism_faces(count)
+            for i in range(len(face))
+        ]
+        assert len(edges) == len(set(edges)), count
+        assert all((b, a) in edges for a, b in edges), count
+
+    print("  every directed edge used once, every edge shared")
+    return True
+
+
 def test_design_tokens():
     """Test DesignTokens for all styles."""
-    print("\n=== Test 4: Design Tokens ===")
+    print("\n=== Test 7: Design Tokens ===")
     from .config.design_tokens import DesignTokens
     from .config.enums import DesignStyle
 
@@ -99,7 +204,7 @@ def test_design_tokens():
 
 def test_presets():
     """Test preset configurations."""
-    print("\n=== Test 5: Presets ===")
+    print("\n=== Test 8: Presets ===")
     from .config.presets import PRESETS
     from .config.derived_config import DerivedConfig
 
@@ -119,7 +224,7 @@ def test_presets():
 
 def test_yaml_roundtrip():
     """Test YAML save/load."""
-    print("\n=== Test 6: YAML Save/Load ===")
+    print("\n=== Test 9: YAML Save/Load ===")
     from .config.config_manager import ConfigManager
     from .config.box_config import BoxConfig
     from .config.enums import DesignStyle, MaterialType
@@ -154,9 +259,153 @@ def test_yaml_roundtrip():
     return True
 
 
+def test_yaml_hand_edit():
+    """Test that save() overwrites a hand-edited YAML file."""
+    print("\n=== Test 10: YAML Hand Edit ===")
+    from .config.config_manager import ConfigManager
+    from .config.box_config import BoxConfig
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = ConfigManager(Path(tmpdir))
+        filepath = manager.save(BoxConfig(), "edited")
+
+        # Edit the file by hand, then save the original config again
+        text = filepath.read_text(encoding="utf-8")
+        assert "width: 200.0" in text
+        filepath.write_text(
+            text.replace("width: 200.0", "width: 250.0"), encoding="utf-8"
+        )
+        assert manager.load("edited").width == 250.0
+
+        manager.save(BoxConfig(), "edited")
+        assert manager.load("edited").width == 200.0
+        print("  Hand-edited file replaced on save")
+
+        # Unchanged content leaves the file untouched
+        before = filepath.stat().st_mtime_ns
+        manager.save(BoxConfig(), "edited")
+        assert filepath.stat().st_mtime_ns == before
+        print("  Identical save skipped")
+
+    return True
+
+
+def test_config_formats():
+    """Test list/delete and YAML vs msgpack precedence."""
+    print("\n=== Test 11: Config File Formats ===")
+    import dataclasses
+    import os
+    from .config import config_manager
+    from .config.config_manager import ConfigManager
+    from .config.box_config import BoxConfig
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = ConfigManager(Path(tmpdir))
+        manager.save(BoxConfig(), "a", include_derived=True)
+        assert manager.list_configs() == ["a"]
+        assert manager.peek_meta("a")["compat_version"] == "1.0"
+        assert manager.list_configs(compat_version="0.0") == []
+
+        if not config_manager.HAS_MSGPACK:
+            print("  msgpack not installed, skipping msgpack checks")
+        else:
+            wide = dataclasses.replace(BoxConfig(), width=300.0)
+            narrow = dataclasses.replace(BoxConfig(), width=120.0)
+
+            # save_fast() output is read back by load()
+            manager.save_fast(wide, "a")
+            manager.save_fast(BoxConfig(), "b")
+            assert manager.load("a").width == 300.0
+            assert sorted(manager.list_configs()) == ["a", "b"]
+
+            # save() refreshes the msgpack file of the same name
+            manager.save(narrow, "a")
+            assert manager.load("a").width == 120.0
+            print("  save() after save_fast() is loaded")
+
+            # A hand-edited (newer) YAML file wins over msgpack
+            yaml_path = Path(tmpdir) / "a.yaml"
+            text = yaml_path.read_text(encoding="utf-8")
+            yaml_path.write_text(
+                text.replace("description: ''", "description: edited"),
+                encoding="utf-8",
+            )
+            future = yaml_path.stat().st_mtime + 10
+            os.utime(yaml_path, (future, future))
+            assert manager.load("a").description == "edited"
+            assert manager.peek_meta("a")["description"] == "edited"
+            print("  load() and peek_meta() read the newer file")
+
+        # delete() removes every file of a config
+        assert manager.delete("a")
+        assert "a" not in manager.list_configs()
+        assert not list(Path(tmpdir).glob("a.*"))
+        assert not manager.delete("a")
+
+    print("  Config formats OK")
+    return True
+
+
+FAKE_BLENDER = """#!{python}
+import pathlib, sys
+args = sys.argv[1:]
+if "--python-exit-code" not in args:
+    sys.exit(2)
+output = pathlib.Path(args[args.index("--output") + 1])
+config = pathlib.Path(args[args.index("--config") + 1])
+try:
+    # Imports the package and runs generate.main(); without bpy it
+    # writes nothing, like a failed build
+    exec(args[args.index("--python-expr") + 1])
+except Exception:
+    sys.exit(1)
+if config.stem.startswith("good"):
+    output.mkdir(parents=True, exist_ok=True)
+    (output / "shell.stl").write_text("solid shell")
+    (output / "print_manifest.yaml").write_text("files: []")
+"""
+
+
+def test_generate_catalog():
+    """Test catalog generation with a fake blender executable."""
+    print("\n=== Test 12: Catalog Generation ===")
+    from .config.config_manager import ConfigManager
+    from .config.box_config import BoxConfig
+    from .generate import generate_catalog
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp = Path(tmpdir)
+        blender = tmp / "blender"
+        blender.write_text(FAKE_BLENDER.format(python=sys.executable))
+        blender.chmod(0o755)
+
+        configs = ConfigManager(tmp / "configs")
+        good = configs.save(BoxConfig(), "good")
+        empty = configs.save(BoxConfig(), "empty")
+        broken = tmp / "configs" / "broken.yaml"
+        broken.write_text("dimensions: [not, a, mapping]\n")
+
+        out = tmp / "out"
+        results = generate_catalog(
+            [good, empty, broken], out, workers=2, blender=str(blender)
+        )
+        assert results == {"good": True, "empty": False, "broken": False}
+        assert (out / "good" / ".config_hash").exists()
+        assert not (out / "empty" / ".config_hash").exists()
+        assert not (out / "broken" / ".config_hash").exists()
+        print("  Failed variants reported and left unmarked")
+
+        # Unchanged configs with a marker are not rebuilt
+        results = generate_catalog([good], out, blender="false")
+        assert results == {"good": True}
+        print("  Unchanged variant skipped")
+
+    return True
+
+
 def test_combinations():
     """Test various parameter combinations."""
-    print("\n=== Test 7: Parameter Combinations ===")
+    print("\n=== Test 13: Parameter Combinations ===")
     from .config.box_config import BoxConfig
     from .config.derived_config import DerivedConfig
     from .config.design_tokens import DesignTokens
@@ -204,9 +453,15 @@ def main():
         test_enums,
         test_box_config,
         test_derived_config,
+        test_derived_batch,
+        test_derived_from_config,
+        test_prism_faces,
         test_design_tokens,
         test_presets,
         test_yaml_roundtrip,
+        test_yaml_hand_edit,
+        test_config_formats,
+        test_generate_catalog,
         test_combinations,
     ]
 
@@ -44,20 +44,11 @@ def build_rail_clearance_test(
     ensure_bpy()
     
     from ..geometry.boolean_ops import boolean_union, boolean_difference
+    from ..geometry.primitives import create_box
     from .rails import build_v_rail, build_v_groove
     
     # Base plate
-    bpy.ops.mesh.primitive_cube_add(
-        size=1,
-        location=(0, 0, 3)
-    )
-    base = bpy.context.active_object
-    if base is None:
-        return None
-    
-    base.name = name
-    base.scale = (60, 25, 6)
-    bpy.ops.object.transform_apply(scale=True)
+    base = create_box(60, 25, 6, name=name, location=(0, 0, 3))
     
     # Three test sections with different clearances
     clearances = [0.25, 0.30, 0.35]
@@ -114,19 +105,10 @@ def build_snap_fit_test(
     ensure_bpy()
     
     from ..geometry.boolean_ops import boolean_union
+    from ..geometry.primitives import create_box
     
     # Base plate
-    bpy.ops.mesh.primitive_cube_add(
-        size=1,
-        location=(0, 0, 4)
-    )
-    base = bpy.context.active_object
-    if base is None:
-        return None
-    
-    base.name = name
-    base.scale = (50, 30, 8)
-    bpy.ops.object.transform_apply(scale=True)
+    base = create_box(50, 30, 8, name=name, location=(0, 0, 4))
     
     # Three spring tabs with different thicknesses
     thicknesses = [0.8, 1.0, 1.2]
@@ -158,19 +140,10 @@ def build_magnet_pressfit_test(
     ensure_bpy()
     
     from ..geometry.boolean_ops import boolean_batch_difference
+    from ..geometry.primitives import create_box, create_cylinder
     
     # Base plate
-    bpy.ops.mesh.primitive_cube_add(
-        size=1,
-        location=(0, 0, 3)
-    )
-    base = bpy.context.active_object
-    if base is None:
-        return None
-    
-    base.name = name
-    base.scale = (45, 20, 6)
-    bpy.ops.object.transform_apply(scale=True)
+    base = create_box(45, 20, 6, name=name, location=(0, 0, 3))
     
     # Three pockets with different diameters
     diameters = [6.0, 6.1, 6.2]
@@ -180,16 +153,12 @@ def build_magnet_pressfit_test(
     for i, dia in enumerate(diameters):
         x_pos = -12 + i * 12
         
-        bpy.ops.mesh.primitive_cylinder_add(
+        pockets.append(create_cylinder(
+            dia / 2, pocket_depth,
             vertices=32,
-            radius=dia / 2,
-            depth=pocket_depth,
-            location=(x_pos, 0, 6 - pocket_depth / 2)
-        )
-        pocket = bpy.context.active_object
-        if pocket is not None:
-            pocket.name = f"Pocket_{dia}"
-            pockets.append(pocket)
+            name=f"Pocket_{dia}",
+            location=(x_pos, 0, 6 - pocket_depth / 2),
+        ))
     
     if pockets:
         boolean_batch_difference(base, pockets)
@@ -253,9 +222,11 @@ def _build_whisker_insert(
     """
     ensure_bpy()
     
-    import bmesh
+    from ..geometry.primitives import shared_bmesh
     
-    bm = bmesh.new()
+    bm = shared_bmesh()
+    new_vert = bm.verts.new
+    new_face = bm.faces.new
     
     # Snap base (rectangular)
     base_w = 6.0
@@ -271,43 +242,42 @@ def _build_whisker_insert(
     
     verts = [
         # Base block
-        bm.verts.new((-half_w, -half_d, 0)),
-        bm.verts.new((half_w, -half_d, 0)),
-        bm.verts.new((half_w, half_d, 0)),
-        bm.verts.new((-half_w, half_d, 0)),
-        bm.verts.new((-half_w, -half_d, base_h)),
-        bm.verts.new((half_w, -half_d, base_h)),
-        bm.verts.new((half_w, half_d, base_h)),
-        bm.verts.new((-half_w, half_d, base_h)),
+        new_vert((-half_w, -half_d, 0)),
+        new_vert((half_w, -half_d, 0)),
+        new_vert((half_w, half_d, 0)),
+        new_vert((-half_w, half_d, 0)),
+        new_vert((-half_w, -half_d, base_h)),
+        new_vert((half_w, -half_d, base_h)),
+        new_vert((half_w, half_d, base_h)),
+        new_vert((-half_w, half_d, base_h)),
         # Whisker arm start
-        bm.verts.new((-arm_width / 2, half_d, base_h - thickness)),
-        bm.verts.new((arm_width / 2, half_d, base_h - thickness)),
-        bm.verts.new((arm_width / 2, half_d, base_h)),
-        bm.verts.new((-arm_width / 2, half_d, base_h)),
+        new_vert((-arm_width / 2, half_d, base_h - thickness)),
+        new_vert((arm_width / 2, half_d, base_h - thickness)),
+        new_vert((arm_width / 2, half_d, base_h)),
+        new_vert((-arm_width / 2, half_d, base_h)),
         # Whisker arm end
-        bm.verts.new((-arm_width / 2, half_d + length, base_h - thickness * 0.7)),
-        bm.verts.new((arm_width / 2, half_d + length, base_h - thickness * 0.7)),
-        bm.verts.new((arm_width / 2, half_d + length, base_h - thickness * 0.7 + thickness)),
-        bm.verts.new((-arm_width / 2, half_d + length, base_h - thickness * 0.7 + thickness)),
+        new_vert((-arm_width / 2, half_d + length, base_h - thickness * 0.7)),
+        new_vert((arm_width / 2, half_d + length, base_h - thickness * 0.7)),
+        new_vert((arm_width / 2, half_d + length, base_h - thickness * 0.7 + thickness)),
+        new_vert((-arm_width / 2, half_d + length, base_h - thickness * 0.7 + thickness)),
     ]
     
     # Base box faces
-    bm.faces.new([verts[0], verts[1], verts[2], verts[3]])  # bottom
-    bm.faces.new([verts[7], verts[6], verts[5], verts[4]])  # top (partial)
-    bm.faces.new([verts[0], verts[4], verts[5], verts[1]])  # front
-    bm.faces.new([verts[0], verts[3], verts[7], verts[4]])  # left
-    bm.faces.new([verts[1], verts[5], verts[6], verts[2]])  # right
+    new_face([verts[0], verts[1], verts[2], verts[3]])  # bottom
+    new_face([verts[7], verts[6], verts[5], verts[4]])  # top (partial)
+    new_face([verts[0], verts[4], verts[5], verts[1]])  # front
+    new_face([verts[0], verts[3], verts[7], verts[4]])  # left
+    new_face([verts[1], verts[5], verts[6], verts[2]])  # right
     
     # Whisker arm faces
-    bm.faces.new([verts[8], verts[9], verts[13], verts[12]])  # bottom
-    bm.faces.new([verts[10], verts[11], verts[15], verts[14]])  # top
-    bm.faces.new([verts[8], verts[12], verts[15], verts[11]])  # left
-    bm.faces.new([verts[9], verts[10], verts[14], verts[13]])  # right
-    bm.faces.new([verts[12], verts[13], verts[14], verts[15]])  # end
+    new_face([verts[8], verts[9], verts[13], verts[12]])  # bottom
+    new_face([verts[10], verts[11], verts[15], verts[14]])  # top
+    new_face([verts[8], verts[12], verts[15], verts[11]])  # left
+    new_face([verts[9], verts[10], verts[14], verts[13]])  # right
+    new_face([verts[12], verts[13], verts[14], verts[15]])  # end
     
     mesh = bpy.data.meshes.new(name)
     bm.to_mesh(mesh)
-    bm.free()
     
     obj = bpy.data.objects.new(name, mesh)
     bpy.context.collection.objects.link(obj)
@@ -324,33 +294,34 @@ def _add_spring_tab(
     """Add spring tab to test piece."""
     from ..geometry.boolean_ops import boolean_union
     
-    import bmesh
+    from ..geometry.primitives import shared_bmesh
     
-    bm = bmesh.new()
+    bm = shared_bmesh()
+    new_vert = bm.verts.new
+    new_face = bm.faces.new
     
     width = 6.0
     half_w = width / 2
     
     # Cantilever tab profile
     verts = [
-        bm.verts.new((-half_w, 0, 0)),
-        bm.verts.new((half_w, 0, 0)),
-        bm.verts.new((half_w, length, thickness)),
-        bm.verts.new((-half_w, length, thickness)),
-        bm.verts.new((-half_w, 0, thickness)),
-        bm.verts.new((half_w, 0, thickness)),
+        new_vert((-half_w, 0, 0)),
+        new_vert((half_w, 0, 0)),
+        new_vert((half_w, length, thickness)),
+        new_vert((-half_w, length, thickness)),
+        new_vert((-half_w, 0, thickness)),
+        new_vert((half_w, 0, thickness)),
     ]
     
     # Faces
-    bm.faces.new([verts[0], verts[1], verts[5], verts[4]])  # back
-    bm.faces.new([verts[4], verts[5], verts[2], verts[3]])  # top
-    bm.faces.new([verts[0], verts[4], verts[3], verts[2], verts[1]])  # bottom
-    bm.faces.new([verts[0], verts[2], verts[3]])  # left (triangle)
-    bm.faces.new([verts[1], verts[2], verts[5]])  # right (triangle)
+    new_face([verts[0], verts[1], verts[5], verts[4]])  # back
+    new_face([verts[4], verts[5], verts[2], verts[3]])  # top
+    new_face([verts[0], verts[4], verts[3], verts[2], verts[1]])  # bottom
+    new_face([verts[0], verts[2], verts[3]])  # left (triangle)
+    new_face([verts[1], verts[2], verts[5]])  # right (triangle)
     
     mesh = bpy.data.meshes.new("SpringTab")
     bm.to_mesh(mesh)
-    bm.free()
     
     tab = bpy.data.objects.new("SpringTab", mesh)
     bpy.context.collection.objects.link(tab)
@@ -365,6 +336,7 @@ def _add_test_labels(
 ) -> None:
     """Add visual markers for test values."""
     from ..geometry.boolean_ops import boolean_batch_difference
+    from ..geometry.primitives import create_box
     
     # Simple notches as labels (real implementation would use text)
     markers: list["bpy.types.Object"] = []
@@ -374,15 +346,11 @@ def _add_test_labels(
         num_notches = int(val * 10)  # 0.25 -> 2, 0.30 -> 3, 0.35 -> 3
         
         for j in range(num_notches):
-            bpy.ops.mesh.primitive_cube_add(
-                size=1,
-                location=(x_pos - 3 + j * 2, -12, 0)
-            )
-            notch = bpy.context.active_object
-            if notch is not None:
-                notch.scale = (1, 2, 3)
-                bpy.ops.object.transform_apply(scale=True)
-                markers.append(notch)
+            markers.append(create_box(
+                1, 2, 3,
+                name=f"Notch_{i}_{j}",
+                location=(x_pos - 3 + j * 2, -12, 0),
+            ))
     
     if markers:
         boolean_batch_difference(base, markers)
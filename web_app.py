@@ -110,7 +110,7 @@ def calculate_dimensions():
         )
         
         # Calculate derived parameters
-        derived = DerivedConfig(config)
+        derived = DerivedConfig.from_config(config)
         
         # Get design tokens
         tokens = DesignTokens.from_style(config.design, derived.wall_thickness)
@@ -133,8 +133,8 @@ def calculate_dimensions():
             "dividers": {
                 "count": derived.divider_count,
             },
-            "features": derived.features_enabled,
-            "tolerances": derived.tolerances,
+            "features": dict(derived.features_enabled),
+            "tolerances": dict(derived.tolerances),
             "warnings": warnings,
             "summary": derived.summary()
         })